@@ -0,0 +1,461 @@
+"""Caches for task listings and single tasks, invalidated by Outlook folder events."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .outlook import (
+    DEFAULT_TASK_FIELDS,
+    NewTask,
+    TASK_FIELDS,
+    OutlookExecutor,
+    OutlookTasks,
+    PendingEvents,
+    PendingItems,
+    TaskOrder,
+    TaskQuery,
+    add_change_listener,
+    format_item_key,
+    truncate_utf8,
+)
+from .settings import Settings, add_reload_listener, get_settings
+
+# (fields, body_preview, query, sort) of a listing request.
+ListingKey = Tuple[Tuple[str, ...], Optional[int], Optional[TaskQuery], Optional[TaskOrder]]
+
+
+@dataclass
+class Snapshot:
+    """A materialized listing; ``body`` and ``etag`` cache its rendered JSON."""
+
+    tasks: List[Dict[str, Any]]
+    created: float = field(default_factory=time.monotonic)
+    body: Optional[bytes] = None
+    etag: Optional[str] = None
+
+
+class TaskSnapshotCache:
+    """Keeps the last listing of the tasks folder per requested projection.
+
+    Listings are dropped when the folder's ``Items`` events report a change
+    we did not make ourselves, when a session reconnects, or after ``ttl``
+    seconds as a fallback for missed events. Writes made through
+    :meth:`add_task`, :meth:`complete_task` and :meth:`delete_task` update
+    the cached listings in place, and the events they cause are recognized
+    and ignored, so polling clients keep hitting the cache.
+
+    Events for our own adds and removals are matched by counting, since
+    Outlook may deliver them before or after the write returns; a foreign
+    change racing with one of ours can occasionally go unnoticed until the
+    TTL expires. Only tasks of the watched folder can be changed through
+    the API, and expected events, counted or by EntryID, lapse after
+    :data:`~app.outlook.PENDING_EVENT_TTL`, so none outlives its write.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_listings: int = 16) -> None:
+        self.ttl = ttl
+        self.max_listings = max_listings
+        self._lock = threading.Lock()
+        self._listings: Dict[ListingKey, Snapshot] = {}
+        self._counts: Dict[Optional[TaskQuery], Tuple[int, float]] = {}
+        self.generation = 0
+        self._pending_adds = PendingEvents()
+        self._pending_removes = PendingEvents()
+        self._added_ids = PendingItems()
+        self._early_add_ids: set = set()
+        self._completed_ids = PendingItems()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(
+        fields: Optional[Sequence[str]],
+        body_preview: Optional[int],
+        query: Optional[TaskQuery] = None,
+        sort: Optional[TaskOrder] = None,
+    ) -> ListingKey:
+        if query is not None and query.restriction() is None:
+            query = None
+        if not fields:
+            return DEFAULT_TASK_FIELDS, body_preview, query, sort
+        return tuple(f for f in TASK_FIELDS if f in fields), body_preview, query, sort
+
+    # Reads ---------------------------------------------------------------
+
+    def get(self, key: ListingKey) -> Optional[Snapshot]:
+        """Return the cached listing for ``key`` if it is still valid."""
+        if not self.ttl:
+            return None
+        with self._lock:
+            snapshot = self._listings.get(key)
+            if snapshot is not None and time.monotonic() - snapshot.created > self.ttl:
+                del self._listings[key]
+                snapshot = None
+            if snapshot is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return snapshot
+
+    def put(self, key: ListingKey, tasks: List[Dict[str, Any]], generation: int) -> Snapshot:
+        """Store a listing read while the cache was at ``generation``.
+
+        The listing is discarded if anything changed since, because it may
+        not reflect that change.
+        """
+        snapshot = Snapshot(tasks)
+        if not self.ttl:
+            return snapshot
+        with self._lock:
+            if generation == self.generation:
+                self._listings.pop(key, None)
+                while len(self._listings) >= self.max_listings:
+                    del self._listings[next(iter(self._listings))]
+                self._listings[key] = snapshot
+        return snapshot
+
+    async def list_tasks(
+        self,
+        executor: OutlookExecutor,
+        fields: Optional[Sequence[str]],
+        body_preview: Optional[int],
+        query: Optional[TaskQuery] = None,
+        sort: Optional[TaskOrder] = None,
+    ) -> Snapshot:
+        """Serve a listing from the cache, reading the folder on a miss."""
+        key = self.key(fields, body_preview, query, sort)
+        snapshot = self.get(key)
+        if snapshot is not None:
+            return snapshot
+        generation = self.generation
+        tasks = await executor.run(lambda client: client.list_incomplete_tasks(fields, body_preview, query, sort))
+        return self.put(key, tasks, generation)
+
+    async def count_tasks(self, executor: OutlookExecutor, query: Optional[TaskQuery]) -> int:
+        """Count matching tasks from a cached count or listing, asking Outlook on a miss."""
+        if query is not None and query.restriction() is None:
+            query = None
+        if self.ttl:
+            now = time.monotonic()
+            with self._lock:
+                cached = self._counts.get(query)
+                if cached is not None and now - cached[1] <= self.ttl:
+                    self.hits += 1
+                    return cached[0]
+                for key, snapshot in self._listings.items():
+                    if key[2] == query and now - snapshot.created <= self.ttl:
+                        self.hits += 1
+                        return len(snapshot.tasks)
+                self.misses += 1
+        generation = self.generation
+        count = await executor.run(lambda client: client.count_incomplete_tasks(query))
+        if self.ttl:
+            with self._lock:
+                if generation == self.generation:
+                    self._counts[query] = (count, time.monotonic())
+        return count
+
+    # Invalidation --------------------------------------------------------
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._listings.clear()
+        self._counts.clear()
+        self._added_ids.clear()
+        self._early_add_ids.clear()
+        self._completed_ids.clear()
+        self.generation += 1
+        self.invalidations += 1
+
+    def on_change(self, kind: str, item: Any) -> None:
+        """Change listener for :func:`app.outlook.add_change_listener`."""
+        entry_id = getattr(item, "EntryID", None) if item is not None else None
+        with self._lock:
+            if kind == "add":
+                if self._added_ids.consume(entry_id):
+                    return
+                if self._pending_adds.consume():
+                    self._early_add_ids.add(entry_id)
+                    return
+            elif kind == "change":
+                if self._completed_ids.consume(entry_id):
+                    return
+            elif kind == "remove":
+                if self._pending_removes.consume():
+                    return
+            self._invalidate()
+
+    # Write-through -------------------------------------------------------
+    # These run on the COM worker as part of the write job.
+
+    def add_task(
+        self, client: OutlookTasks, subject: str, due_date: Optional[datetime] = None, body: Optional[str] = None
+    ) -> str:
+        result = self.add_tasks(client, [(subject, due_date, body)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def add_tasks(self, client: OutlookTasks, tasks: Sequence[NewTask]) -> List[Union[str, Exception]]:
+        """Write-through for :meth:`OutlookTasks.add_tasks`; listings are updated once per batch."""
+        with self._lock:
+            self._pending_adds.expect(len(tasks))
+        try:
+            results = client.add_tasks(tasks)
+        except BaseException:
+            with self._lock:
+                self._pending_adds.cancel(len(tasks))
+                self._invalidate()
+            raise
+        created = [
+            {
+                "entryId": result,
+                "itemKey": format_item_key(result, client.store_id),
+                "subject": subject,
+                "dueDate": due_date,
+                "status": 0,
+                "body": body or "",
+            }
+            for result, (subject, due_date, body) in zip(results, tasks)
+            if not isinstance(result, Exception)
+        ]
+        with self._lock:
+            self._pending_adds.cancel(len(tasks) - len(created))
+            for task in created:
+                entry_id = task["entryId"]
+                if entry_id in self._early_add_ids:
+                    self._early_add_ids.discard(entry_id)
+                else:
+                    self._pending_adds.cancel()
+                    self._added_ids.expect([entry_id])
+            if len(created) < len(tasks):
+                # A failed add may have left a half-saved item behind.
+                self._invalidate()
+            elif created:
+                for key, snapshot in list(self._listings.items()):
+                    if "lastModified" in key[0] or key[2] is not None or key[3] is not None:
+                        # Outlook sets the modification time, decides which
+                        # tasks match a query and where a sort puts them; we
+                        # cannot fill any of these in.
+                        del self._listings[key]
+                        continue
+                    rows = [_project(task, key) for task in created]
+                    self._listings[key] = Snapshot(snapshot.tasks + rows, snapshot.created)
+                counted = self._counts.get(None)
+                self._counts.clear()
+                if counted is not None:
+                    self._counts[None] = (counted[0] + len(created), counted[1])
+                self.generation += 1
+        return results
+
+    def complete_task(self, client: OutlookTasks, entry_id: str) -> None:
+        error = self.complete_tasks(client, [entry_id])[0]
+        if error is not None:
+            raise error
+
+    def complete_tasks(
+        self, client: OutlookTasks, entry_ids: Sequence[str], stop_on_error: bool = False
+    ) -> List[Optional[Exception]]:
+        """Write-through for :meth:`OutlookTasks.complete_tasks`."""
+        with self._lock:
+            self._completed_ids.expect(entry_ids)
+            self._drop_entries(set(entry_ids))
+        try:
+            results = client.complete_tasks(entry_ids, stop_on_error)
+        except BaseException:
+            self.invalidate()
+            raise
+        if len(results) < len(entry_ids) or any(results):
+            self.invalidate()
+        return results
+
+    def delete_task(self, client: OutlookTasks, entry_id: str) -> None:
+        error = self.delete_tasks(client, [entry_id])[0]
+        if error is not None:
+            raise error
+
+    def delete_tasks(
+        self, client: OutlookTasks, entry_ids: Sequence[str], stop_on_error: bool = False
+    ) -> List[Optional[Exception]]:
+        """Write-through for :meth:`OutlookTasks.delete_tasks`."""
+        with self._lock:
+            self._pending_removes.expect(len(entry_ids))
+            self._drop_entries(set(entry_ids))
+        try:
+            results = client.delete_tasks(entry_ids, stop_on_error)
+        except BaseException:
+            with self._lock:
+                self._pending_removes.cancel(len(entry_ids))
+                self._invalidate()
+            raise
+        failed = len(entry_ids) - sum(1 for result in results if result is None)
+        if failed:
+            with self._lock:
+                self._pending_removes.cancel(failed)
+                self._invalidate()
+        return results
+
+    def _drop_entries(self, entry_ids: set) -> None:
+        # Whether the tasks were counted is unknown, so counts are re-read.
+        self._counts.clear()
+        for key, snapshot in list(self._listings.items()):
+            if "entryId" not in key[0]:
+                # Without EntryIDs the task cannot be found in this listing.
+                del self._listings[key]
+                continue
+            tasks = [task for task in snapshot.tasks if task["entryId"] not in entry_ids]
+            if len(tasks) != len(snapshot.tasks):
+                self._listings[key] = Snapshot(tasks, snapshot.created)
+        self.generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "listings": len(self._listings),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+@dataclass
+class DetailEntry:
+    """A cached single-task view; ``verified`` while no event may have changed it."""
+
+    task: Dict[str, Any]
+    verified: bool
+    created: float = field(default_factory=time.monotonic)
+
+
+class TaskDetailCache:
+    """LRU of single-task views, keyed on EntryID and LastModificationTime.
+
+    An entry is served without touching Outlook while it is verified: no
+    ``ItemChange`` for it, no unidentified removal and no reconnect since
+    it was read, and not older than ``ttl``. Otherwise the item is opened
+    and only its ``LastModificationTime`` compared; the other properties
+    are read again only if that differs. Bodies are read when first asked
+    for and then kept with the entry.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 256) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, DetailEntry]" = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_task(self, executor: OutlookExecutor, entry_id: str, include_body: bool) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._entries.get(entry_id)
+            if entry is not None:
+                self._entries.move_to_end(entry_id)
+                fresh = entry.verified and time.monotonic() - entry.created <= self.ttl
+                if fresh and (not include_body or "body" in entry.task):
+                    self.hits += 1
+                    return _without_body(entry.task, include_body)
+            self.misses += 1
+            generation = self.generation
+        cached = entry.task if entry is not None else None
+        task = await executor.run(lambda client: client.get_task(entry_id, include_body, cached))
+        with self._lock:
+            self._entries[entry_id] = DetailEntry(task, verified=generation == self.generation)
+            self._entries.move_to_end(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return _without_body(task, include_body)
+
+    def discard(self, entry_ids: Sequence[str]) -> None:
+        """Forget tasks we are changing; their events may arrive after the write returns."""
+        with self._lock:
+            for entry_id in entry_ids:
+                self._entries.pop(entry_id, None)
+            self.generation += 1
+
+    def on_change(self, kind: str, item: Any) -> None:
+        """Change listener for :func:`app.outlook.add_change_listener`."""
+        with self._lock:
+            self.generation += 1
+            if kind == "change":
+                self._entries.pop(getattr(item, "EntryID", None), None)
+            elif kind in ("remove", "reset"):
+                for entry in self._entries.values():
+                    entry.verified = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def _without_body(task: Dict[str, Any], include_body: bool) -> Dict[str, Any]:
+    if include_body or "body" not in task:
+        return task
+    return {key: value for key, value in task.items() if key != "body"}
+
+
+def _project(task: Dict[str, Any], key: ListingKey) -> Dict[str, Any]:
+    fields, body_preview = key[:2]
+    row = {f: task[f] for f in fields}
+    if body_preview is not None:
+        row["bodyPreview"] = truncate_utf8(task["body"] or "", body_preview)
+    return row
+
+
+_cache: Optional[TaskSnapshotCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_task_cache() -> TaskSnapshotCache:
+    """Return the process-wide listing cache, subscribing it to folder events."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TaskSnapshotCache(ttl=get_settings().outlook_cache_ttl)
+            add_change_listener(_cache.on_change)
+        return _cache
+
+
+_detail_cache: Optional[TaskDetailCache] = None
+
+
+def get_detail_cache() -> TaskDetailCache:
+    """Return the process-wide single-task cache, subscribing it to folder events."""
+    global _detail_cache
+    with _cache_lock:
+        if _detail_cache is None:
+            _detail_cache = TaskDetailCache(ttl=get_settings().outlook_cache_ttl)
+            add_change_listener(_detail_cache.on_change)
+        return _detail_cache
+
+
+def _on_settings_reload(old: Settings, new: Settings) -> None:
+    # Another folder or profile means the cached tasks are someone else's.
+    reconnect = (old.outlook_tasks_folder, old.outlook_profile) != (new.outlook_tasks_folder, new.outlook_profile)
+    for cache in (_cache, _detail_cache):
+        if cache is None:
+            continue
+        cache.ttl = new.outlook_cache_ttl
+        if reconnect:
+            cache.on_change("reset", None)
+
+
+add_reload_listener(_on_settings_reload)
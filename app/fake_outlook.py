@@ -0,0 +1,792 @@
+"""In-process fake of the Outlook COM object model.
+
+The fake mirrors the subset of ``Outlook.Application`` used by
+:mod:`app.outlook` so the server can be exercised and benchmarked on
+machines without Outlook. Every property read, property write and method
+call that crosses the fake "COM boundary" is counted and can be slowed
+down by a configurable per-call latency to approximate cross-process
+round trips.
+
+Typical use::
+
+    outlook = FakeOutlook(latency=0.0005)
+    outlook.seed_tasks(1000)
+    client = OutlookTasks(application=outlook.Application())
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+OL_FOLDER_TASKS = 13
+OL_TASK_COMPLETE = 2
+RPC_E_DISCONNECTED = -2147417848
+E_NOT_FOUND = -2147221233  # MAPI_E_NOT_FOUND (0x8004010F)
+E_INVALIDARG = -2147024809
+
+_TASK_PSET = "http://schemas.microsoft.com/mapi/id/{00062003-0000-0000-c000-000000000046}/"
+
+# DASL property names understood by @SQL filters and Table columns.
+DASL_PROPERTIES = {
+    "http://schemas.microsoft.com/mapi/proptag/0x001a001f": "MessageClass",
+    "http://schemas.microsoft.com/mapi/proptag/0x0fff0102": "EntryID",
+    "urn:schemas:httpmail:subject": "Subject",
+    "urn:schemas:httpmail:textdescription": "Body",
+    "urn:schemas:httpmail:importance": "Importance",
+    "urn:schemas-microsoft-com:office:office#keywords": "Categories",
+    "dav:getlastmodified": "LastModificationTime",
+    "urn:schemas:calendar:created": "CreationTime",
+    _TASK_PSET + "811c000b": "Complete",
+    _TASK_PSET + "81050040": "DueDate",
+    _TASK_PSET + "81040040": "StartDate",
+    _TASK_PSET + "81010003": "Status",
+    _TASK_PSET + "811f001f": "Owner",
+}
+
+# Properties Outlook refuses to add as Table columns.
+_UNSUPPORTED_COLUMNS = {"Body", "HTMLBody", "RTFBody"}
+
+# String columns read through a Table are truncated like in Outlook.
+TABLE_STRING_LIMIT = 255
+
+
+class FakeComError(Exception):
+    """Mimics ``pywintypes.com_error`` closely enough for error handling."""
+
+    def __init__(self, hresult: int, message: str = "") -> None:
+        super().__init__(hresult, message)
+        self.hresult = hresult
+
+
+# Object model -------------------------------------------------------------
+
+
+class _FakeObject:
+    """Marker base class for objects that are handed out behind a proxy."""
+
+
+class _Connection:
+    """One ``Outlook.Application`` handle; owns latency and call accounting."""
+
+    def __init__(self, outlook: "FakeOutlook") -> None:
+        self.outlook = outlook
+        self.generation = outlook.generation
+
+    def tick(self) -> None:
+        outlook = self.outlook
+        if not outlook.running or self.generation != outlook.generation:
+            raise FakeComError(RPC_E_DISCONNECTED, "The object invoked has disconnected from its clients.")
+        with outlook._lock:
+            outlook.calls += 1
+        if outlook.latency:
+            time.sleep(outlook.latency)
+
+    def wrap(self, value: Any) -> Any:
+        if isinstance(value, _FakeObject):
+            return _ComProxy(value, self)
+        return value
+
+
+class _ComProxy:
+    """Late-bound dispatch wrapper; every access is one simulated round trip."""
+
+    __slots__ = ("_target", "_conn")
+
+    def __init__(self, target: _FakeObject, conn: _Connection) -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_conn", conn)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        conn = self._conn
+        value = getattr(self._target, name)
+        if callable(value) and not isinstance(value, _FakeObject):
+            def method(*args: Any, **kwargs: Any) -> Any:
+                conn.tick()
+                args = tuple(_unwrap(a) for a in args)
+                return conn.wrap(value(*args, **kwargs))
+            return method
+        conn.tick()
+        return conn.wrap(value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._conn.tick()
+        setattr(self._target, name, _unwrap(value))
+
+    def __iter__(self) -> Iterator[Any]:
+        conn = self._conn
+        conn.tick()
+        for value in list(self._target):
+            conn.tick()
+            yield conn.wrap(value)
+
+    def __len__(self) -> int:
+        self._conn.tick()
+        return len(self._target)
+
+    def __repr__(self) -> str:
+        return f"<ComProxy {self._target!r}>"
+
+    def _with_events(self, handler: type) -> "FakeSubscription":
+        """Hook used in place of ``win32com.client.WithEvents``."""
+        target = self._target
+        if isinstance(target, FakeItems):
+            registry = target._folder._subscriptions
+        elif isinstance(target, FakeFolders):
+            registry = target._subscriptions
+        else:
+            raise FakeComError(E_INVALIDARG, f"{target!r} does not source events")
+        self._conn.tick()
+        return FakeSubscription(registry, handler(), self._conn)
+
+
+class FakeSubscription:
+    """Event connection of a handler to an ``Items`` or ``Folders`` collection."""
+
+    def __init__(self, registry: List["FakeSubscription"], handler: Any, conn: _Connection) -> None:
+        self._registry = registry
+        self.handler = handler
+        self.conn = conn
+        registry.append(self)
+
+    def fire(self, event: str, obj: Optional[_FakeObject]) -> None:
+        conn = self.conn
+        if not conn.outlook.running or conn.generation != conn.outlook.generation:
+            return
+        method = getattr(self.handler, "On" + event)
+        if event.endswith("Remove"):
+            method()
+        else:
+            method(conn.wrap(obj))
+
+    def close(self) -> None:
+        if self in self._registry:
+            self._registry.remove(self)
+
+
+def _fire(registry: List[FakeSubscription], event: str, obj: Optional[_FakeObject]) -> None:
+    # Outlook queues events for the subscriber's thread; the fake delivers
+    # them synchronously.
+    for subscription in list(registry):
+        subscription.fire(event, obj)
+
+
+def _unwrap(value: Any) -> Any:
+    return value._target if isinstance(value, _ComProxy) else value
+
+
+class FakeTaskItem(_FakeObject):
+    """A ``TaskItem`` stored in a fake folder."""
+
+    MessageClass = "IPM.Task"
+
+    def __init__(self, folder: "FakeFolder", subject: str = "", **props: Any) -> None:
+        now = datetime.now()
+        self._folder = folder
+        self.EntryID = uuid.uuid4().hex.upper()
+        self.Subject = subject
+        self.Body = ""
+        self.DueDate: Optional[datetime] = None
+        self.StartDate: Optional[datetime] = None
+        self.Status = 0
+        self.Importance = 1
+        self.Categories = ""
+        self.Owner = ""
+        self.PercentComplete = 0
+        self.CreationTime = now
+        self.LastModificationTime = now
+        self._saved = False
+        for key, value in props.items():
+            setattr(self, key, value)
+
+    @property
+    def Complete(self) -> bool:
+        return self.Status == OL_TASK_COMPLETE
+
+    @property
+    def Parent(self) -> "FakeFolder":
+        return self._folder
+
+    @property
+    def StoreID(self) -> str:
+        return self._folder.StoreID
+
+    def Save(self) -> None:
+        self.LastModificationTime = datetime.now()
+        if not self._saved:
+            self._saved = True
+            self._folder._insert(self)
+        else:
+            self._folder._changed(self)
+
+    def Delete(self) -> None:
+        self._folder._remove(self)
+
+    def __repr__(self) -> str:
+        return f"<FakeTaskItem {self.Subject!r}>"
+
+
+class FakeItems(_FakeObject):
+    """An ``Items`` collection: a live, optionally restricted view of a folder."""
+
+    def __init__(self, folder: "FakeFolder", predicate: Optional[Callable[[Any], bool]] = None) -> None:
+        self._folder = folder
+        self._predicate = predicate
+        self._sort: Optional[tuple] = None
+
+    def _rows(self) -> List[FakeTaskItem]:
+        items = self._folder._items
+        if self._predicate is not None:
+            items = [item for item in items if self._predicate(item)]
+        items = list(items)
+        if self._sort is not None:
+            _sort_rows(items, *self._sort)
+        return items
+
+    def Sort(self, property: str, descending: bool = False) -> None:
+        self._sort = (property, descending)
+
+    def __iter__(self) -> Iterator[FakeTaskItem]:
+        return iter(self._rows())
+
+    def __len__(self) -> int:
+        return len(self._rows())
+
+    @property
+    def Count(self) -> int:
+        return len(self._rows())
+
+    def Item(self, index: int) -> FakeTaskItem:
+        return self._rows()[index - 1]
+
+    def Restrict(self, filter: str) -> "FakeItems":
+        predicate = compile_filter(filter, DASL_PROPERTIES)
+        if self._predicate is None:
+            return FakeItems(self._folder, predicate)
+        outer = self._predicate
+        return FakeItems(self._folder, lambda item: outer(item) and predicate(item))
+
+    def Add(self, item_type: Any = "IPM.Task") -> FakeTaskItem:
+        return FakeTaskItem(self._folder)
+
+
+def _sort_rows(rows: List[FakeTaskItem], property: str, descending: bool = False) -> None:
+    """Sort in place like ``Items.Sort``; empty values sort as largest."""
+    name = property.strip("[]")
+    name = DASL_PROPERTIES.get(name.lower(), name)
+
+    def key(item: FakeTaskItem) -> tuple:
+        value = getattr(item, name, None)
+        if isinstance(value, str):
+            value = value.lower()
+        return (value is None, value if value is not None else 0)
+
+    rows.sort(key=key, reverse=descending)
+
+
+class FakeColumns(_FakeObject):
+    """A Table's ``Columns`` collection."""
+
+    def __init__(self) -> None:
+        self._names: List[str] = ["EntryID", "Subject", "CreationTime", "LastModificationTime", "MessageClass"]
+
+    @property
+    def Count(self) -> int:
+        return len(self._names)
+
+    def RemoveAll(self) -> None:
+        self._names = []
+
+    def Add(self, name: str) -> None:
+        # Long text properties are only available through their DASL name,
+        # and then truncated to TABLE_STRING_LIMIT characters.
+        if name in _UNSUPPORTED_COLUMNS:
+            raise FakeComError(E_INVALIDARG, f"Property {name!r} cannot be added as a Table column")
+        self._names.append(name)
+
+
+class FakeTable(_FakeObject):
+    """A ``Table``: a forward-only cursor over rows of selected columns."""
+
+    def __init__(self, rows: List[FakeTaskItem]) -> None:
+        self._rows = rows
+        self._position = 0
+        self.Columns = FakeColumns()
+
+    @property
+    def EndOfTable(self) -> bool:
+        return self._position >= len(self._rows)
+
+    def GetRowCount(self) -> int:
+        return len(self._rows)
+
+    def Sort(self, property: str, descending: bool = False) -> None:
+        _sort_rows(self._rows, property, descending)
+        self._position = 0
+
+    def MoveToStart(self) -> None:
+        self._position = 0
+
+    def Restrict(self, filter: str) -> "FakeTable":
+        predicate = compile_filter(filter, DASL_PROPERTIES)
+        return FakeTable([item for item in self._rows if predicate(item)])
+
+    def _value(self, item: FakeTaskItem, name: str) -> Any:
+        value = getattr(item, DASL_PROPERTIES.get(name.lower(), name), None)
+        if isinstance(value, str) and len(value) > TABLE_STRING_LIMIT:
+            value = value[:TABLE_STRING_LIMIT]
+        return value
+
+    def GetArray(self, max_rows: int) -> tuple:
+        names = self.Columns._names
+        block = self._rows[self._position:self._position + max_rows]
+        self._position += len(block)
+        return tuple(tuple(self._value(item, name) for name in names) for item in block)
+
+
+class FakeFolders(_FakeObject):
+    """A ``Folders`` collection; its events live on the owning folder or store list."""
+
+    def __init__(self, folders: List["FakeFolder"], subscriptions: List[FakeSubscription]) -> None:
+        self._folders = folders
+        self._subscriptions = subscriptions
+
+    def __iter__(self) -> Iterator["FakeFolder"]:
+        return iter(list(self._folders))
+
+    def __len__(self) -> int:
+        return len(self._folders)
+
+    @property
+    def Count(self) -> int:
+        return len(self._folders)
+
+    def Item(self, index: Any) -> "FakeFolder":
+        if isinstance(index, str):
+            for folder in self._folders:
+                if folder.Name.casefold() == index.casefold():
+                    return folder
+            raise FakeComError(E_NOT_FOUND, f"The attempted operation failed. An object could not be found: {index}")
+        return self._folders[index - 1]
+
+
+class FakeFolder(_FakeObject):
+    """A ``MAPIFolder``; the top folder of each store is its root."""
+
+    Class = 2  # olFolder
+
+    def __init__(self, outlook: "FakeOutlook", name: str, parent: Optional["FakeFolder"] = None) -> None:
+        self._outlook = outlook
+        self._parent = parent
+        self._children: List[FakeFolder] = []
+        self._items: List[FakeTaskItem] = []
+        self._subscriptions: List[FakeSubscription] = []
+        self._folder_subscriptions: List[FakeSubscription] = []
+        self.Name = name
+        self.EntryID = uuid.uuid4().hex.upper()
+        self.StoreID = parent.StoreID if parent is not None else uuid.uuid4().hex.upper()
+        outlook._folders[self.EntryID] = self
+
+    @property
+    def FolderPath(self) -> str:
+        if self._parent is None:
+            return "\\\\" + self.Name
+        return self._parent.FolderPath + "\\" + self.Name
+
+    @property
+    def Parent(self) -> _FakeObject:
+        return self._parent if self._parent is not None else FakeNamespace(self._outlook)
+
+    @property
+    def Folders(self) -> FakeFolders:
+        return FakeFolders(self._children, self._folder_subscriptions)
+
+    @property
+    def Items(self) -> FakeItems:
+        return FakeItems(self)
+
+    def GetTable(self, filter: str = "", table_contents: int = 0) -> FakeTable:
+        rows = list(self._items)
+        if filter:
+            predicate = compile_filter(filter, DASL_PROPERTIES)
+            rows = [item for item in rows if predicate(item)]
+        return FakeTable(rows)
+
+    def add_folder(self, name: str) -> "FakeFolder":
+        """Create a subfolder (test helper, not part of the COM surface)."""
+        child = FakeFolder(self._outlook, name, self)
+        self._children.append(child)
+        _fire(self._folder_subscriptions, "FolderAdd", child)
+        return child
+
+    def rename(self, name: str) -> None:
+        """Rename the folder, firing ``FolderChange`` on its parent's ``Folders``."""
+        self.Name = name
+        _fire(self._siblings_subscriptions(), "FolderChange", self)
+
+    def remove(self) -> None:
+        """Delete the folder, firing ``FolderRemove`` on its parent's ``Folders``."""
+        siblings = self._parent._children if self._parent is not None else self._outlook._stores
+        siblings.remove(self)
+        self._outlook._folders.pop(self.EntryID, None)
+        _fire(self._siblings_subscriptions(), "FolderRemove", None)
+
+    def _siblings_subscriptions(self) -> List[FakeSubscription]:
+        if self._parent is None:
+            return self._outlook._store_subscriptions
+        return self._parent._folder_subscriptions
+
+    def add_task(self, subject: str, **props: Any) -> FakeTaskItem:
+        """Create and save a task without paying simulated latency."""
+        item = FakeTaskItem(self, subject, **props)
+        item.Save()
+        return item
+
+    def _insert(self, item: FakeTaskItem) -> None:
+        self._items.append(item)
+        self._outlook._items[item.EntryID] = item
+        self._fire("ItemAdd", item)
+
+    def _changed(self, item: FakeTaskItem) -> None:
+        self._fire("ItemChange", item)
+
+    def _remove(self, item: FakeTaskItem) -> None:
+        self._items.remove(item)
+        self._outlook._items.pop(item.EntryID, None)
+        self._fire("ItemRemove", None)
+
+    def _fire(self, event: str, item: Optional[FakeTaskItem]) -> None:
+        _fire(self._subscriptions, event, item)
+
+    def __repr__(self) -> str:
+        return f"<FakeFolder {self.FolderPath!r}>"
+
+
+class FakeNamespace(_FakeObject):
+    """The ``MAPI`` namespace."""
+
+    Class = 1  # olNamespace
+
+    def __init__(self, outlook: "FakeOutlook") -> None:
+        self._outlook = outlook
+
+    @property
+    def Folders(self) -> FakeFolders:
+        return FakeFolders(self._outlook._stores, self._outlook._store_subscriptions)
+
+    def GetDefaultFolder(self, folder_type: int) -> FakeFolder:
+        if folder_type != OL_FOLDER_TASKS:
+            raise FakeComError(E_NOT_FOUND, f"Unsupported default folder: {folder_type}")
+        return self._outlook.default_tasks_folder
+
+    def GetFolderFromID(self, entry_id: str, store_id: Optional[str] = None) -> FakeFolder:
+        try:
+            return self._outlook._folders[entry_id]
+        except KeyError:
+            raise FakeComError(E_NOT_FOUND, f"Folder not found: {entry_id}") from None
+
+    def GetItemFromID(self, entry_id: str, store_id: Optional[str] = None) -> FakeTaskItem:
+        outlook = self._outlook
+        item = outlook._items.get(entry_id)
+        if store_id is None:
+            # Without a StoreID Outlook opens every store until it finds the
+            # item; each one costs a round trip.
+            for store in outlook._stores:
+                outlook._search_store()
+                if item is not None and store.StoreID == item.StoreID:
+                    break
+        elif item is not None and item.StoreID != store_id:
+            item = None
+        if item is None:
+            raise FakeComError(E_NOT_FOUND, f"Item not found: {entry_id}")
+        return item
+
+
+class FakeApplication(_FakeObject):
+    """``Outlook.Application``."""
+
+    def __init__(self, outlook: "FakeOutlook") -> None:
+        self._outlook = outlook
+
+    def GetNamespace(self, name: str) -> FakeNamespace:
+        return FakeNamespace(self._outlook)
+
+
+class FakeOutlook:
+    """The state behind the fake: stores, folders, items and call counters.
+
+    ``Application()`` plays the role of ``Dispatch("Outlook.Application")``
+    and returns a new proxied handle. ``restart()`` invalidates every handle
+    handed out so far, like Outlook being closed and reopened.
+    """
+
+    def __init__(self, latency: float = 0.0, connect_latency: float = 0.0, store_name: str = "Mailbox") -> None:
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.calls = 0
+        self.connects = 0
+        self.running = True
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._stores: List[FakeFolder] = []
+        self._store_subscriptions: List[FakeSubscription] = []
+        self._folders: Dict[str, FakeFolder] = {}
+        self._items: Dict[str, FakeTaskItem] = {}
+        root = self.add_store(store_name)
+        self.default_tasks_folder = root.add_folder("Tasks")
+
+    def add_store(self, name: str) -> FakeFolder:
+        """Add a mail store and return its root folder."""
+        root = FakeFolder(self, name)
+        self._stores.append(root)
+        return root
+
+    def seed_tasks(self, count: int, folder: Optional[FakeFolder] = None, body_size: int = 200) -> List[FakeTaskItem]:
+        """Populate ``folder`` (default Tasks) with ``count`` incomplete tasks."""
+        folder = folder or self.default_tasks_folder
+        start = datetime(2025, 1, 1, 9, 0)
+        return [
+            folder.add_task(
+                f"Task {i}",
+                DueDate=start + timedelta(days=i % 365),
+                Body=("x" * body_size),
+            )
+            for i in range(count)
+        ]
+
+    def Application(self) -> Any:
+        """Connect, like ``win32com.client.Dispatch("Outlook.Application")``."""
+        if not self.running:
+            raise FakeComError(RPC_E_DISCONNECTED, "Outlook is not running")
+        self.connects += 1
+        if self.connect_latency:
+            time.sleep(self.connect_latency)
+        conn = _Connection(self)
+        conn.tick()
+        return conn.wrap(FakeApplication(self))
+
+    def restart(self) -> None:
+        """Invalidate all existing handles, as if Outlook had been restarted."""
+        self.generation += 1
+
+    def reset_calls(self) -> None:
+        self.calls = 0
+
+    def _search_store(self) -> None:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+
+_fake: Optional[FakeOutlook] = None
+_fake_lock = threading.Lock()
+
+
+def get_fake_outlook(tasks: int = 0, latency: float = 0.0) -> FakeOutlook:
+    """Return the process-wide fake behind ``OUTLOOK_BACKEND=fake``.
+
+    Created on first use with ``tasks`` seeded tasks and ``latency``
+    seconds per call; later arguments are ignored.
+    """
+    global _fake
+    with _fake_lock:
+        if _fake is None:
+            _fake = FakeOutlook(latency=latency)
+            _fake.seed_tasks(tasks)
+        return _fake
+
+
+# Restrict filters --------------------------------------------------------
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<prop>\[[^\]]+\])
+      | (?P<dstr>"[^"]*")
+      | (?P<sstr>'(?:[^']|'')*')
+      | (?P<num>-?\d+(?:\.\d+)?)
+      | (?P<op><>|<=|>=|=|<|>)
+      | (?P<paren>[()])
+      | (?P<word>[A-Za-z_]+)
+    )""",
+    re.VERBOSE,
+)
+
+_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+)
+
+
+def _tokenize(text: str) -> List[tuple]:
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            raise FakeComError(-2147352567, f"Cannot parse condition: {text[pos:]!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+def _coerce(left: Any, right: Any) -> tuple:
+    if isinstance(left, datetime) and isinstance(right, str):
+        for fmt in _DATE_FORMATS:
+            try:
+                return left, datetime.strptime(right, fmt)
+            except ValueError:
+                continue
+    if isinstance(left, bool) and isinstance(right, (int, float)):
+        return int(left), right
+    if isinstance(left, str) and isinstance(right, str):
+        return left.lower(), right.lower()
+    return left, right
+
+
+def _compare(left: Any, op: str, right: Any) -> bool:
+    if op == "LIKE":
+        if not isinstance(left, str):
+            return False
+        pattern = "^" + re.escape(str(right).lower()).replace("%", ".*") + "$"
+        return re.match(pattern, left.lower(), re.DOTALL) is not None
+    if left is None or right is None:
+        return op == "=" and left is right or op == "<>" and left is not right
+    left, right = _coerce(left, right)
+    try:
+        if op == "=":
+            return left == right
+        if op == "<>":
+            return left != right
+        if op == "<":
+            return left < right
+        if op == ">":
+            return left > right
+        if op == "<=":
+            return left <= right
+        if op == ">=":
+            return left >= right
+    except TypeError:
+        return False
+    raise FakeComError(-2147352567, f"Unsupported operator: {op}")
+
+
+class _FilterParser:
+    """Recursive descent parser for the Jet and DASL restrictions we emit."""
+
+    def __init__(self, text: str, properties: Dict[str, str]) -> None:
+        self.dasl = text.lstrip().startswith("@SQL=")
+        if self.dasl:
+            text = text.lstrip()[len("@SQL="):]
+        self.properties = properties
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def peek(self) -> Optional[tuple]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self) -> tuple:
+        token = self.peek()
+        if token is None:
+            raise FakeComError(-2147352567, "Unexpected end of condition")
+        self.pos += 1
+        return token
+
+    def keyword(self, word: str) -> bool:
+        token = self.peek()
+        if token and token[0] == "word" and token[1].upper() == word:
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self) -> Callable[[Any], bool]:
+        predicate = self.parse_or()
+        if self.peek() is not None:
+            raise FakeComError(-2147352567, f"Unexpected token: {self.peek()[1]!r}")
+        return predicate
+
+    def parse_or(self) -> Callable[[Any], bool]:
+        terms = [self.parse_and()]
+        while self.keyword("OR"):
+            terms.append(self.parse_and())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda item: any(term(item) for term in terms)
+
+    def parse_and(self) -> Callable[[Any], bool]:
+        terms = [self.parse_not()]
+        while self.keyword("AND"):
+            terms.append(self.parse_not())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda item: all(term(item) for term in terms)
+
+    def parse_not(self) -> Callable[[Any], bool]:
+        if self.keyword("NOT"):
+            inner = self.parse_not()
+            return lambda item: not inner(item)
+        token = self.peek()
+        if token == ("paren", "("):
+            self.take()
+            inner = self.parse_or()
+            if self.take() != ("paren", ")"):
+                raise FakeComError(-2147352567, "Unbalanced parentheses")
+            return inner
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> Callable[[Any], bool]:
+        kind, text = self.take()
+        if kind == "prop":
+            name = text[1:-1]
+        elif kind == "dstr" and self.dasl:
+            uri = text[1:-1]
+            name = self.properties.get(uri.lower())
+            if name is None:
+                raise FakeComError(-2147352567, f"Unknown property: {uri}")
+        else:
+            raise FakeComError(-2147352567, f"Expected a property, got {text!r}")
+        if self.keyword("IS"):
+            negate = self.keyword("NOT")
+            if not self.keyword("NULL"):
+                raise FakeComError(-2147352567, "Expected NULL")
+            return lambda item: (getattr(item, name, None) in (None, "")) != negate
+        if self.keyword("LIKE"):
+            op = "LIKE"
+        else:
+            op_kind, op = self.take()
+            if op_kind != "op":
+                raise FakeComError(-2147352567, f"Expected an operator, got {op!r}")
+        value = self.parse_value()
+        if name == "Categories" and op in ("=", "LIKE"):
+            # Categories is a keyword list; a comparison matches any entry.
+            return lambda item: any(
+                _compare(part, op, value) for part in (item.Categories or "").split(", ")
+            )
+        return lambda item: _compare(getattr(item, name, None), op, value)
+
+    def parse_value(self) -> Any:
+        kind, text = self.take()
+        if kind == "num":
+            return float(text) if "." in text else int(text)
+        if kind in ("sstr", "dstr"):
+            return text[1:-1].replace("''", "'")
+        if kind == "word" and text.upper() in ("TRUE", "FALSE"):
+            return text.upper() == "TRUE"
+        raise FakeComError(-2147352567, f"Expected a value, got {text!r}")
+
+
+def compile_filter(text: str, properties: Optional[Dict[str, str]] = None) -> Callable[[Any], bool]:
+    """Compile a Jet or ``@SQL=`` DASL restriction into a Python predicate."""
+    return _FilterParser(text, properties or {}).parse()
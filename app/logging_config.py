@@ -0,0 +1,81 @@
+"""Logging setup for the server: ``LOG_LEVEL`` and text or JSON lines.
+
+Library modules only create loggers; :func:`configure_logging` is called
+by the entry point with the loaded settings, and again when they reload.
+Log calls use lazy ``%s`` arguments, so nothing is formatted, and no COM
+property is read, for records that are filtered out.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LogRecord attributes that are not user supplied ``extra`` fields.
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; ``extra={...}`` fields become keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level: str = "INFO", log_format: str = "text") -> str:
+    """Configure the root logger with ``level`` and ``text`` or ``json`` lines.
+
+    Returns the level name, for passing on to uvicorn.
+    """
+    level = level.upper()
+    log_format = log_format.lower()
+    if not isinstance(logging.getLevelName(level), int):
+        raise ValueError(f"Unknown log level: {level}")
+    if log_format not in ("text", "json"):
+        raise ValueError(f"Unknown log format: {log_format}")
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT))
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(level)
+    return level
+
+
+class SampledLogger:
+    """Logs the first of every ``every`` calls, for messages emitted once per item.
+
+    The level check comes first, so below the logger's level a call costs
+    one comparison and its arguments are never formatted.
+    """
+
+    def __init__(self, logger: logging.Logger, every: int = 100) -> None:
+        self.logger = logger
+        self.every = every
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    def debug(self, msg: str, *args: Any) -> None:
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        with self._lock:
+            calls = self._calls
+            self._calls += 1
+        if calls % self.every == 0:
+            self.logger.debug(msg + " (sampled 1/%d)", *args, self.every)
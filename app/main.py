@@ -2,46 +2,106 @@
 
 from __future__ import annotations
 
-import os
+import time
+from contextlib import asynccontextmanager
 from functools import lru_cache
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
 
-from .routers import tasks
+from .cache import get_detail_cache, get_task_cache
+from .logging_config import configure_logging
+from .metrics import REQUEST_LATENCY, register_stats
+from .mirror import get_mirror
+from .outlook import get_executor, get_folder_index, get_request_gate, get_store_cache, shutdown_executor
+from .settings import Settings, SettingsWatcher, add_reload_listener, get_settings, load_settings
+from .sync import get_change_log
+from .routers import admin, metrics, tasks
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_task_cache()
+    get_detail_cache()
+    get_change_log()
+    get_executor().start()
+    mirror = get_mirror()
+    if mirror is not None:
+        mirror.start(get_executor())
+    watcher = SettingsWatcher(get_settings().outlook_settings_watch_interval)
+    watcher.start()
+    yield
+    watcher.stop()
+    if mirror is not None:
+        mirror.stop()
+    shutdown_executor()
+
+
+def _reconfigure_logging(old: Settings, new: Settings) -> None:
+    if (old.log_level, old.log_format) != (new.log_level, new.log_format):
+        configure_logging(new.log_level, new.log_format)
+
+
+async def record_request_latency(request: Request, call_next):
+    """Observe each request under its route template, so IDs do not become labels."""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        REQUEST_LATENCY.labels(request.method, path, str(status)).observe(time.perf_counter() - started)
 
 
 @lru_cache(maxsize=1)
 def create_app() -> FastAPI:
-    load_dotenv()
-    app = FastAPI(title="Outlook Tasks API", version="0.1.0")
+    # The only read of the environment and .env; see app.settings for reloads.
+    load_settings()
+    add_reload_listener(_reconfigure_logging)
+    app = FastAPI(title="Outlook Tasks API", version="0.1.0", lifespan=lifespan)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.middleware("http")(record_request_latency)
     app.include_router(tasks.router)
+    app.include_router(metrics.router)
+    app.include_router(admin.router)
+    lookups = ("hits", "misses")
+    register_stats(
+        "executor",
+        lambda: get_executor().stats(),
+        counters=("submitted", "completed", "failed", "rejected", "timedOut"),
+    )
+    register_stats("request_gate", lambda: get_request_gate().stats(), counters=("admitted", "rejected"))
+    register_stats("breaker", lambda: get_executor().breaker.stats(), counters=("trips", "rejected"))
+    register_stats("listing_cache", lambda: get_task_cache().stats(), counters=lookups + ("invalidations",))
+    register_stats("detail_cache", lambda: get_detail_cache().stats(), counters=lookups)
+    register_stats("folder_index", get_folder_index().stats, counters=lookups)
+    register_stats("store_cache", get_store_cache().stats, counters=lookups)
+    mirror = get_mirror()
+    if mirror is not None:
+        register_stats(
+            "mirror",
+            mirror.stats,
+            counters=("reconciles", "reconcileFailures", "bodiesRead", "eventsApplied"),
+        )
     return app
 
 
 def run() -> None:
     import uvicorn
-    import logging
-
-    # Setup logging
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    logger = logging.getLogger("uvicorn")
-    logger.setLevel(logging.DEBUG)
 
     app = create_app()
-    host = os.getenv("HOST", "localhost")
-    port = int(os.getenv("PORT", "8124"))
-    uvicorn.run(app, host=host, port=port, log_level="debug")
+    settings = get_settings()
+    level = configure_logging(settings.log_level, settings.log_format)
+    # log_config=None keeps uvicorn's loggers on the handler configured above.
+    uvicorn.run(app, host=settings.host, port=settings.port, log_level=level.lower(), log_config=None)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,246 @@
+"""Prometheus metrics for API routes, Outlook operations and COM calls.
+
+COM calls are measured by :func:`instrument_com`, a thin proxy around the
+``Outlook.Application`` object: every object reached through it is proxied
+as well, so each property read, property write and method call is timed
+under its COM member name without the callers knowing. Outlook operations
+are timed per :class:`~app.outlook.OutlookTasks` method by
+:func:`measure_operations`. Figures kept elsewhere, such as executor queue
+depth, cache hits and breaker trips, are read at scrape time from the
+sources given to :func:`register_stats`.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import time
+import types
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, Tuple, Union
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+# Buckets from a cached read (well under a millisecond) up to a stalled
+# Outlook.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+REQUEST_LATENCY = Histogram(
+    "outlook_api_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+OPERATION_LATENCY = Histogram(
+    "outlook_operation_duration_seconds",
+    "Latency of OutlookTasks operations.",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+OPERATION_ERRORS = Counter(
+    "outlook_operation_errors_total",
+    "OutlookTasks operations that raised.",
+    ["operation"],
+)
+COM_CALL_LATENCY = Histogram(
+    "outlook_com_call_duration_seconds",
+    "Latency of single COM calls by member name; kind is get, set, call or iter.",
+    ["member", "kind"],
+    buckets=LATENCY_BUCKETS,
+)
+COM_CALL_ERRORS = Counter(
+    "outlook_com_call_errors_total",
+    "COM calls that raised, by member name.",
+    ["member", "kind"],
+)
+
+# Values returned as they are instead of being proxied.
+_PLAIN_TYPES = (str, bytes, bool, int, float, datetime, tuple, list, dict, type(None))
+_METHOD_TYPES = (types.MethodType, types.FunctionType, types.BuiltinFunctionType)
+
+_com_children: Dict[Tuple[str, str], Any] = {}
+
+
+def _observe_com(member: str, kind: str, started: float, failed: bool) -> None:
+    key = (member, kind)
+    child = _com_children.get(key)
+    if child is None:
+        child = _com_children[key] = COM_CALL_LATENCY.labels(member, kind)
+    child.observe(time.perf_counter() - started)
+    if failed:
+        COM_CALL_ERRORS.labels(member, kind).inc()
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, _PLAIN_TYPES) or isinstance(value, _InstrumentedProxy):
+        return value
+    return _InstrumentedProxy(value)
+
+
+def unwrap_com(value: Any) -> Any:
+    """Return the object behind an :func:`instrument_com` proxy."""
+    return value._target if isinstance(value, _InstrumentedProxy) else value
+
+
+def instrument_com(com_object: Any) -> Any:
+    """Proxy ``com_object`` and everything reached through it, timing every COM call."""
+    return _wrap(com_object)
+
+
+class _InstrumentedProxy:
+    """Times attribute reads, writes, calls and iteration of a COM object."""
+
+    __slots__ = ("_target",)
+
+    def __init__(self, target: Any) -> None:
+        object.__setattr__(self, "_target", target)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Internal hooks, e.g. the fake's event support, pass through.
+            return getattr(self._target, name)
+        started = time.perf_counter()
+        try:
+            value = getattr(self._target, name)
+        except BaseException:
+            _observe_com(name, "get", started, True)
+            raise
+        if isinstance(value, _METHOD_TYPES):
+            return _measure_method(name, value)
+        _observe_com(name, "get", started, False)
+        return _wrap(value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        started = time.perf_counter()
+        failed = True
+        try:
+            setattr(self._target, name, unwrap_com(value))
+            failed = False
+        finally:
+            _observe_com(name, "set", started, failed)
+
+    def __iter__(self) -> Iterator[Any]:
+        iterator = iter(self._target)
+        while True:
+            started = time.perf_counter()
+            try:
+                value = next(iterator)
+            except StopIteration:
+                _observe_com("_NewEnum", "iter", started, False)
+                return
+            except BaseException:
+                _observe_com("_NewEnum", "iter", started, True)
+                raise
+            _observe_com("_NewEnum", "iter", started, False)
+            yield _wrap(value)
+
+    def __len__(self) -> int:
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = len(self._target)
+            failed = False
+            return result
+        finally:
+            _observe_com("Count", "get", started, failed)
+
+    def __repr__(self) -> str:
+        return f"<instrumented {self._target!r}>"
+
+
+def _measure_method(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    def call(*args: Any, **kwargs: Any) -> Any:
+        args = tuple(unwrap_com(arg) for arg in args)
+        kwargs = {key: unwrap_com(value) for key, value in kwargs.items()}
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = method(*args, **kwargs)
+            failed = False
+        finally:
+            _observe_com(name, "call", started, failed)
+        return _wrap(result)
+
+    return call
+
+
+def measure_operations(cls: type) -> type:
+    """Class decorator timing every public method of ``cls`` by name.
+
+    Methods returning iterators are timed until the iterator is exhausted
+    or closed, since that is when the COM work happens.
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not isinstance(member, types.FunctionType):
+            continue
+        setattr(cls, name, _measure_operation(name, member))
+    return cls
+
+
+def _measure_operation(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    histogram = OPERATION_LATENCY.labels(name)
+    errors = OPERATION_ERRORS.labels(name)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            errors.inc()
+            histogram.observe(time.perf_counter() - started)
+            raise
+        if isinstance(result, Iterator):
+            return _measure_iterator(result, histogram, errors, started)
+        histogram.observe(time.perf_counter() - started)
+        return result
+
+    return wrapper
+
+
+def _measure_iterator(iterator: Iterator[Any], histogram: Any, errors: Any, started: float) -> Iterator[Any]:
+    try:
+        yield from iterator
+    except BaseException:
+        errors.inc()
+        raise
+    finally:
+        histogram.observe(time.perf_counter() - started)
+
+
+class _StatsCollector:
+    """Exposes numeric ``stats()`` values of registered sources as gauges or counters."""
+
+    def __init__(self) -> None:
+        self.sources: Dict[str, Tuple[Callable[[], Dict[str, Any]], FrozenSet[str]]] = {}
+
+    def collect(self) -> Iterator[Union[CounterMetricFamily, GaugeMetricFamily]]:
+        for prefix, (source, counters) in list(self.sources.items()):
+            try:
+                stats = source()
+            except Exception:  # noqa: BLE001
+                continue
+            for key, value in stats.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"outlook_{prefix}_{_snake_case(key)}"
+                family = CounterMetricFamily if key in counters else GaugeMetricFamily
+                yield family(name, f"{key} from the {prefix} stats.", value=value)
+
+
+_stats = _StatsCollector()
+REGISTRY.register(_stats)
+
+
+def register_stats(prefix: str, source: Callable[[], Dict[str, Any]], counters: Iterable[str] = ()) -> None:
+    """Expose ``source()``'s numeric values as ``outlook_<prefix>_<key>`` gauges.
+
+    The keys named in ``counters`` only ever grow; they are exposed as
+    ``outlook_<prefix>_<key>_total`` counters instead, so ``rate()`` works.
+    """
+    _stats.sources[prefix] = (source, frozenset(counters))
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name).lower()
@@ -0,0 +1,543 @@
+"""Local SQLite mirror of the incomplete tasks, for reads that skip Outlook.
+
+The mirror is filled by a Table scan (:meth:`OutlookTasks.scan_incomplete_tasks`)
+that opens only new or modified items, and kept current by the folder's
+``ItemAdd``/``ItemChange`` events and by writes made through this server.
+Outlook does not say which item an ``ItemRemove`` was about, so removals,
+reconnects and a timer trigger another scan (a reconciliation), which also
+repairs anything the events missed.
+
+:class:`TaskMirror` implements :class:`~app.outlook.TaskReader` with the
+same results as :class:`OutlookTasks`, so routes can run a read job
+against either. Task start and due dates are kept as
+local wall-clock times, as Outlook compares them. An FTS5 index over
+subjects, bodies and categories, updated by triggers with every row
+change, backs :meth:`TaskMirror.search`.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .outlook import (
+    DEFAULT_TASK_FIELDS,
+    DETAIL_PROPERTIES,
+    TASK_FIELDS,
+    OutlookExecutor,
+    OutlookNotFoundError,
+    TaskKey,
+    TaskOrder,
+    TaskQuery,
+    add_change_listener,
+    format_item_key,
+    task_record,
+    truncate_utf8,
+)
+from .settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS tasks (
+    entry_id TEXT PRIMARY KEY,
+    subject TEXT,
+    due_date TEXT,
+    start_date TEXT,
+    status INTEGER,
+    percent_complete INTEGER,
+    importance INTEGER,
+    categories TEXT,
+    owner TEXT,
+    created TEXT,
+    last_modified TEXT,
+    body TEXT
+);
+-- Matches the page order: tasks without a due date come last.
+CREATE INDEX IF NOT EXISTS tasks_due_date ON tasks (due_date IS NULL, due_date, entry_id);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status);
+CREATE TABLE IF NOT EXISTS task_categories (
+    category TEXT NOT NULL COLLATE NOCASE,
+    entry_id TEXT NOT NULL,
+    PRIMARY KEY (category, entry_id)
+);
+CREATE INDEX IF NOT EXISTS task_categories_entry ON task_categories (entry_id);
+
+-- Full-text index over the tasks table, kept in step by the triggers.
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    subject, body, categories,
+    content = 'tasks', content_rowid = 'rowid',
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts (rowid, subject, body, categories)
+    VALUES (new.rowid, new.subject, new.body, new.categories);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, subject, body, categories)
+    VALUES ('delete', old.rowid, old.subject, old.body, old.categories);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, subject, body, categories)
+    VALUES ('delete', old.rowid, old.subject, old.body, old.categories);
+    INSERT INTO tasks_fts (rowid, subject, body, categories)
+    VALUES (new.rowid, new.subject, new.body, new.categories);
+END;
+"""
+
+# bm25 weights of the subject, body and categories columns in search ranking.
+SEARCH_WEIGHTS = (10.0, 1.0, 5.0)
+
+# Task field -> column of the tasks table.
+COLUMNS = {
+    "entryId": "entry_id",
+    "subject": "subject",
+    "dueDate": "due_date",
+    "startDate": "start_date",
+    "status": "status",
+    "percentComplete": "percent_complete",
+    "importance": "importance",
+    "categories": "categories",
+    "owner": "owner",
+    "created": "created",
+    "lastModified": "last_modified",
+    "body": "body",
+}
+# Fields holding task dates (wall-clock) and timestamps (kept with their offset).
+WALL_CLOCK_FIELDS = ("dueDate", "startDate")
+TIMESTAMP_FIELDS = ("created", "lastModified")
+
+# Sort field (see SORT_PROPERTIES) -> ORDER BY expression.
+SORT_COLUMNS = {
+    "dueDate": "due_date",
+    "startDate": "start_date",
+    "importance": "importance",
+    "lastModified": "last_modified",
+    "subject": "subject COLLATE NOCASE",
+}
+
+# Seconds to wait after a removal or reconnect before scanning, so a burst
+# of events costs one scan.
+RECONCILE_DEBOUNCE = 1.0
+# Seconds between attempts while the first scan has not succeeded.
+RETRY_INTERVAL = 5.0
+
+
+class TaskMirror:
+    """SQLite copy of the incomplete tasks with indexes on due date, status and category.
+
+    Thread-safe: one connection is shared behind a lock, and every query is
+    a single indexed statement.
+    """
+
+    def __init__(self, path: str = ":memory:", reconcile_interval: float = 300.0) -> None:
+        self.path = path
+        self.reconcile_interval = reconcile_interval
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        with self._db:
+            if self._db.execute("SELECT 1 FROM meta WHERE key = 'fts'").fetchone() is None:
+                # A mirror file from before the full-text index existed.
+                self._db.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+                self._db.execute("INSERT INTO meta (key, value) VALUES ('fts', '1')")
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'store_id'").fetchone()
+        self.store_id: Optional[str] = row[0] if row else None
+        self.ready = False
+        self.reconciles = 0
+        self.reconcile_failures = 0
+        self.last_reconcile = 0.0
+        self.bodies_read = 0
+        self.events_applied = 0
+
+    # Keeping the mirror current ------------------------------------------
+
+    def start(self, executor: OutlookExecutor) -> None:
+        """Start the background thread that scans Outlook now and after each trigger."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._reconcile_loop, args=(executor,), name="task-mirror", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def request_reconcile(self) -> None:
+        """Have the background thread scan Outlook again soon."""
+        self._wake.set()
+
+    def _reconcile_loop(self, executor: OutlookExecutor) -> None:
+        while not self._stop.is_set():
+            try:
+                self.reconcile(executor)
+            except Exception as e:  # noqa: BLE001
+                self.reconcile_failures += 1
+                logger.warning("Task mirror reconciliation failed: %s", e)
+            self._wake.wait(self.reconcile_interval if self.ready else RETRY_INTERVAL)
+            if self._wake.is_set() and not self._stop.is_set():
+                self._stop.wait(RECONCILE_DEBOUNCE)
+            self._wake.clear()
+
+    def reconcile(self, executor: OutlookExecutor) -> None:
+        """Bring the mirror in line with Outlook in one Table scan."""
+        started = time.perf_counter()
+        known = self._versions()
+
+        def job(client: Any) -> Tuple[List[Dict[str, Any]], List[str], str]:
+            changed, present = client.scan_incomplete_tasks(known)
+            return changed, present, client.store_id
+
+        # A full scan may take minutes, so it has no request deadline and
+        # stays out of the circuit breaker; it is only abandoned on stop().
+        future = executor.submit(job)
+        while True:
+            try:
+                changed, present, store_id = future.result(timeout=RETRY_INTERVAL)
+                break
+            except TimeoutError:
+                if self._stop.is_set():
+                    future.cancel()
+                    return
+        # Tasks added while the scan ran are not in ``known`` and stay.
+        gone = set(known) - set(present)
+        with self._lock, self._db:
+            self._upsert(changed)
+            self._delete(gone)
+            self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('store_id', ?)", (store_id,))
+            self.store_id = store_id
+        self.reconciles += 1
+        self.bodies_read += len(changed)
+        self.last_reconcile = time.perf_counter() - started
+        self.ready = True
+        logger.debug("Task mirror reconciled: %d changed, %d removed", len(changed), len(gone))
+
+    def on_change(self, kind: str, item: Any) -> None:
+        """Change listener for :func:`app.outlook.add_change_listener`."""
+        if kind not in ("add", "change"):
+            self.request_reconcile()
+            return
+        try:
+            task = task_record(item)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Could not read changed task; reconciling: %s", e)
+            self.request_reconcile()
+            return
+        with self._lock, self._db:
+            if task["complete"]:
+                self._delete([task["entryId"]])
+            else:
+                self._upsert([task])
+        self.events_applied += 1
+
+    def record_added(self, entry_id: str, subject: str, due_date: Optional[datetime], body: Optional[str]) -> None:
+        """Mirror a task this server just created, until its ``ItemAdd`` event or the next scan.
+
+        Its ``lastModified`` is left unknown, so the next scan reads it in full.
+        """
+        with self._lock, self._db:
+            # New tasks start as notStarted with normal importance.
+            self._db.execute(
+                "INSERT OR IGNORE INTO tasks (entry_id, subject, due_date, status, importance, body)"
+                " VALUES (?, ?, ?, 0, 1, ?)",
+                (entry_id, subject, _wall_clock(due_date), body),
+            )
+
+    def discard(self, entry_ids: Iterable[str]) -> None:
+        """Drop tasks this server completed or deleted."""
+        with self._lock, self._db:
+            self._delete(entry_ids)
+
+    def _versions(self) -> Dict[str, Optional[datetime]]:
+        with self._lock:
+            rows = self._db.execute("SELECT entry_id, last_modified FROM tasks").fetchall()
+        return {entry_id: _timestamp(modified) for entry_id, modified in rows}
+
+    def _upsert(self, tasks: Sequence[Dict[str, Any]]) -> None:
+        names = list(COLUMNS.values())
+        self._db.executemany(
+            f"INSERT INTO tasks ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+            f" ON CONFLICT (entry_id) DO UPDATE SET {', '.join(f'{name} = excluded.{name}' for name in names[1:])}",
+            [_row(task) for task in tasks],
+        )
+        entry_ids = [(task["entryId"],) for task in tasks]
+        self._db.executemany("DELETE FROM task_categories WHERE entry_id = ?", entry_ids)
+        self._db.executemany(
+            "INSERT OR IGNORE INTO task_categories (category, entry_id) VALUES (?, ?)",
+            [(category, task["entryId"]) for task in tasks for category in _split_categories(task.get("categories"))],
+        )
+
+    def _delete(self, entry_ids: Iterable[str]) -> None:
+        params = [(entry_id,) for entry_id in entry_ids]
+        self._db.executemany("DELETE FROM tasks WHERE entry_id = ?", params)
+        self._db.executemany("DELETE FROM task_categories WHERE entry_id = ?", params)
+
+    # Reads, with the signatures of the OutlookTasks methods ---------------
+
+    def list_incomplete_tasks(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+        sort: Optional[TaskOrder] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """As :meth:`OutlookTasks.list_incomplete_tasks`; unsorted tasks come in scan order."""
+        fields = _fields(fields)
+        where, params = _where(query)
+        order = "rowid"
+        if sort is not None:
+            column = SORT_COLUMNS[sort[0]]
+            direction = "DESC" if sort[1] else "ASC"
+            # Outlook sorts tasks without a date as if due in 4501.
+            order = f"{column.split()[0]} IS NULL {direction}, {column} {direction}, rowid"
+        sql = f"SELECT {_select(fields, body_preview)} FROM tasks WHERE {where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_project(task, fields, body_preview) for task in self._query(sql, params, fields, body_preview)]
+
+    def iter_incomplete_tasks(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+        sort: Optional[TaskOrder] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        return iter(self.list_incomplete_tasks(fields, body_preview, query, sort, limit))
+
+    def list_incomplete_task_page(
+        self,
+        limit: int,
+        after: Optional[TaskKey] = None,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[TaskKey]]:
+        """As :meth:`OutlookTasks.list_incomplete_task_page`, as one indexed range query."""
+        fields = _fields(fields)
+        where, params = _where(query)
+        if after is not None:
+            due, entry_id = after
+            if due is None:
+                where += " AND due_date IS NULL AND entry_id > ?"
+                params.append(entry_id)
+            else:
+                where += " AND (due_date IS NULL OR due_date > ? OR (due_date = ? AND entry_id > ?))"
+                params.extend([_wall_clock(due), _wall_clock(due), entry_id])
+        read = list(fields) + ["dueDate"]
+        sql = (
+            f"SELECT {_select(read, body_preview)} FROM tasks WHERE {where}"
+            " ORDER BY due_date IS NULL, due_date, entry_id LIMIT ?"
+        )
+        params.append(limit + 1)
+        tasks = self._query(sql, params, read, body_preview)
+        more = len(tasks) > limit
+        del tasks[limit:]
+        next_key = (tasks[-1]["dueDate"], tasks[-1]["entryId"]) if more and tasks else None
+        return [_project(task, fields, body_preview) for task in tasks], next_key
+
+    def count_incomplete_tasks(self, query: Optional[TaskQuery] = None) -> int:
+        where, params = _where(query)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM tasks WHERE {where}", params).fetchone()[0]
+
+    def get_task(self, entry_id: str, include_body: bool = True) -> Dict[str, Any]:
+        """As :meth:`OutlookTasks.get_task`; raises OutlookNotFoundError for tasks not mirrored."""
+        fields = ["entryId", "itemKey", *DETAIL_PROPERTIES] + (["body"] if include_body else [])
+        sql = f"SELECT {_select(fields, None)} FROM tasks WHERE entry_id = ?"
+        tasks = self._query(sql, [entry_id], fields, None)
+        if not tasks:
+            raise OutlookNotFoundError(f"Task not mirrored: {entry_id}")
+        return _project(tasks[0], fields, None)
+
+    def search(self, text: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Incomplete tasks whose subject, body or categories contain every word of ``text``.
+
+        Best matches come first, with subject and category hits weighing
+        more than body hits. A word ending in ``*`` matches as a prefix.
+        Each result has ``entryId``, ``itemKey``, ``subject`` and ``score``.
+        """
+        match = _match_expression(text)
+        if match is None:
+            return []
+        weights = ", ".join(str(weight) for weight in SEARCH_WEIGHTS)
+        sql = (
+            f"SELECT t.entry_id, t.subject, bm25(tasks_fts, {weights}) AS rank"
+            " FROM tasks_fts JOIN tasks t ON t.rowid = tasks_fts.rowid"
+            " WHERE tasks_fts MATCH ? ORDER BY rank LIMIT ?"
+        )
+        with self._lock:
+            rows = self._db.execute(sql, (match, limit)).fetchall()
+        store_id = self.store_id or ""
+        return [
+            {
+                "entryId": entry_id,
+                "itemKey": format_item_key(entry_id, store_id),
+                "subject": subject,
+                # bm25 is lower for better matches.
+                "score": -rank,
+            }
+            for entry_id, subject, rank in rows
+        ]
+
+    def _query(
+        self, sql: str, params: List[Any], fields: Sequence[str], body_preview: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Run a SELECT of :func:`_select` columns and decode the rows."""
+        names = _selected(fields, body_preview)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        store_id = self.store_id or ""
+        tasks = []
+        for row in rows:
+            task = _decode(dict(zip(names, row)))
+            if "itemKey" in fields:
+                task["itemKey"] = format_item_key(task["entryId"], store_id)
+            tasks.append(task)
+        return tasks
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        return {
+            "ready": self.ready,
+            "tasks": rows,
+            "reconciles": self.reconciles,
+            "reconcileFailures": self.reconcile_failures,
+            "lastReconcileMs": self.last_reconcile * 1000,
+            "bodiesRead": self.bodies_read,
+            "eventsApplied": self.events_applied,
+        }
+
+
+def _fields(fields: Optional[Sequence[str]]) -> List[str]:
+    wanted = fields or DEFAULT_TASK_FIELDS
+    return [field for field in TASK_FIELDS if field in wanted]
+
+
+def _selected(fields: Sequence[str], body_preview: Optional[int]) -> List[str]:
+    """Stored fields to read for ``fields``; entryId always, body for previews."""
+    names = ["entryId"] + [field for field in COLUMNS if field in fields and field != "entryId"]
+    if body_preview is not None and "body" not in names:
+        names.append("body")
+    return names
+
+
+def _select(fields: Sequence[str], body_preview: Optional[int]) -> str:
+    return ", ".join(COLUMNS[field] for field in _selected(fields, body_preview))
+
+
+def _project(task: Dict[str, Any], fields: Sequence[str], body_preview: Optional[int]) -> Dict[str, Any]:
+    result = {field: task.get(field) for field in fields}
+    if body_preview is not None:
+        result["bodyPreview"] = truncate_utf8(task.get("body") or "", body_preview)
+    return result
+
+
+def _where(query: Optional[TaskQuery]) -> Tuple[str, List[Any]]:
+    """SQL conditions equivalent to ``query.restriction()``."""
+    conditions = ["1"]
+    params: List[Any] = []
+    if query is None:
+        return conditions[0], params
+    if query.due_before is not None:
+        conditions.append("due_date < ?")
+        params.append(_wall_clock(query.due_before))
+    if query.due_after is not None:
+        conditions.append("due_date > ?")
+        params.append(_wall_clock(query.due_after))
+    if query.statuses:
+        conditions.append(f"status IN ({', '.join('?' * len(query.statuses))})")
+        params.extend(query.statuses)
+    if query.category is not None:
+        conditions.append("entry_id IN (SELECT entry_id FROM task_categories WHERE category = ?)")
+        params.append(query.category)
+    if query.importance is not None:
+        conditions.append("importance = ?")
+        params.append(query.importance)
+    if query.subject_contains is not None:
+        conditions.append("subject LIKE ? ESCAPE '\\'")
+        params.append("%" + _escape_like(query.subject_contains) + "%")
+    if query.owner is not None:
+        conditions.append("owner = ? COLLATE NOCASE")
+        params.append(query.owner)
+    return " AND ".join(conditions), params
+
+
+def _match_expression(text: str) -> Optional[str]:
+    """An FTS5 query requiring every word of ``text``, with FTS5 syntax quoted away."""
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', "")
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms) or None
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _split_categories(categories: Optional[str]) -> Set[str]:
+    return {category.strip() for category in (categories or "").split(",") if category.strip()}
+
+
+def _wall_clock(value: Optional[datetime]) -> Optional[str]:
+    """A task date as sortable local wall-clock text."""
+    return value.replace(tzinfo=None).isoformat(sep=" ") if value is not None else None
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _row(task: Dict[str, Any]) -> Tuple[Any, ...]:
+    values = []
+    for field in COLUMNS:
+        value = task.get(field)
+        if field in WALL_CLOCK_FIELDS:
+            value = _wall_clock(value)
+        elif field in TIMESTAMP_FIELDS and value is not None:
+            value = value.isoformat()
+        values.append(value)
+    return tuple(values)
+
+
+def _decode(task: Dict[str, Any]) -> Dict[str, Any]:
+    for field in WALL_CLOCK_FIELDS + TIMESTAMP_FIELDS:
+        if field in task:
+            task[field] = _timestamp(task[field])
+    return task
+
+
+_mirror: Optional[TaskMirror] = None
+_mirror_lock = threading.Lock()
+
+
+def get_mirror() -> Optional[TaskMirror]:
+    """Return the process-wide mirror if ``OUTLOOK_MIRROR`` is on, subscribing it to folder events."""
+    global _mirror
+    settings = get_settings()
+    with _mirror_lock:
+        if _mirror is None:
+            if not settings.outlook_mirror:
+                return None
+            _mirror = TaskMirror(settings.outlook_mirror_path, settings.outlook_mirror_reconcile_interval)
+            add_change_listener(_mirror.on_change)
+        return _mirror
@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
-import os
 import sys
 import logging
+import asyncio
+import base64
+import heapq
+import itertools
+import json
 import platform
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from dotenv import load_dotenv, find_dotenv
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Protocol, Sequence, Set, Tuple, TypeVar, Union
 
-# Configure basic logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from .logging_config import SampledLogger
+from .metrics import instrument_com, measure_operations, unwrap_com
+from .settings import Settings, add_reload_listener, get_settings, load_settings
+
+logger = logging.getLogger(__name__)
+# Per-item debug messages, sampled so large folders do not flood the log.
+item_logger = SampledLogger(logger)
 
 try:
     import win32com.client  # type: ignore
@@ -30,45 +42,522 @@ except Exception:  # noqa: BLE001
     OUTLOOK_TASK_COMPLETE = 2
 
 
+# HRESULTs raised when the Outlook process went away or the proxy is stale.
+# A warm session that hits one of these is rebuilt instead of reused.
+RPC_DISCONNECT_HRESULTS = frozenset(
+    {
+        -2147417848,  # RPC_E_DISCONNECTED (0x80010108)
+        -2147023174,  # RPC_S_SERVER_UNAVAILABLE (0x800706BA)
+        -2147023170,  # RPC_S_CALL_FAILED (0x800706BE)
+        -2147417851,  # RPC_E_SERVERFAULT (0x80010105)
+        -2147221503,  # CO_E_OBJNOTCONNECTED (0x800401FD)
+    }
+)
+
+# HRESULTs raised while Outlook is running but not taking calls, e.g. behind
+# a modal dialog. With the ones above, these count against the circuit breaker.
+RPC_BUSY_HRESULTS = frozenset(
+    {
+        -2147418111,  # RPC_E_CALL_REJECTED (0x80010001)
+        -2147417846,  # RPC_E_SERVERCALL_RETRYLATER (0x8001010A)
+        -2147417847,  # RPC_E_SERVERCALL_REJECTED (0x80010109)
+    }
+)
+
+# DASL names of the task properties used in @SQL filters. The Table engine
+# uses the built-in names in TABLE_COLUMNS so dates come back in local time.
+DASL_MESSAGE_CLASS = "http://schemas.microsoft.com/mapi/proptag/0x001A001F"
+DASL_TASK_COMPLETE = "http://schemas.microsoft.com/mapi/id/{00062003-0000-0000-C000-000000000046}/811C000B"
+# Tasks of the standard form and of custom forms (IPM.Task.*), but not task
+# requests (IPM.TaskRequest*). Every engine and the count use this predicate.
+DASL_TASK_CLASS = f'("{DASL_MESSAGE_CLASS}" = \'IPM.Task\' OR "{DASL_MESSAGE_CLASS}" LIKE \'IPM.Task.%\')'
+TASK_CLASS_FILTER = f"@SQL={DASL_TASK_CLASS}"
+INCOMPLETE_TASKS_FILTER = f'@SQL={DASL_TASK_CLASS} AND "{DASL_TASK_COMPLETE}" = 0'
+COMPLETED_TASKS_FILTER = f'@SQL={DASL_TASK_CLASS} AND "{DASL_TASK_COMPLETE}" = 1'
+
+# Fields a listing can return, in output order, and those returned by default.
+# Bodies cost a round trip per item, so they are only read when asked for.
+TASK_FIELDS = ("entryId", "itemKey", "subject", "dueDate", "status", "body", "lastModified")
+DEFAULT_TASK_FIELDS = ("entryId", "subject", "dueDate", "status")
+# Fields of the changed tasks /tasks/changes returns: enough to keep a full copy.
+SYNC_TASK_FIELDS = DEFAULT_TASK_FIELDS + ("body", "lastModified")
+
+# Task field -> Table column / item property. Body is not allowed as a
+# Table column.
+TABLE_COLUMNS = {
+    "entryId": "EntryID",
+    "subject": "Subject",
+    "dueDate": "DueDate",
+    "status": "Status",
+    "lastModified": "LastModificationTime",
+}
+
+# Task field -> item property returned by the single-task view, besides
+# entryId, itemKey and body.
+DETAIL_PROPERTIES = {
+    "subject": "Subject",
+    "dueDate": "DueDate",
+    "startDate": "StartDate",
+    "status": "Status",
+    "percentComplete": "PercentComplete",
+    "importance": "Importance",
+    "categories": "Categories",
+    "owner": "Owner",
+    "created": "CreationTime",
+    "lastModified": "LastModificationTime",
+}
+
+# Outlook returns at most TABLE_STRING_LIMIT characters of the body through
+# this column, which is enough for short previews without opening the item.
+BODY_PREVIEW_COLUMN = "urn:schemas:httpmail:textdescription"
+TABLE_STRING_LIMIT = 255
+
+DASL_TASK_DUE_DATE = "http://schemas.microsoft.com/mapi/id/{00062003-0000-0000-C000-000000000046}/81050040"
+DASL_TASK_STATUS = "http://schemas.microsoft.com/mapi/id/{00062003-0000-0000-C000-000000000046}/81010003"
+DASL_TASK_OWNER = "http://schemas.microsoft.com/mapi/id/{00062003-0000-0000-C000-000000000046}/811F001F"
+DASL_SUBJECT = "urn:schemas:httpmail:subject"
+DASL_IMPORTANCE = "urn:schemas:httpmail:importance"
+DASL_CATEGORIES = "urn:schemas-microsoft-com:office:office#Keywords"
+DATED_TASKS_FILTER = f'@SQL="{DASL_TASK_DUE_DATE}" IS NOT NULL'
+UNDATED_TASKS_FILTER = f'@SQL="{DASL_TASK_DUE_DATE}" IS NULL'
+
+LIST_ENGINES = ("table", "items")
+# Rows fetched per Table.GetArray call.
+TABLE_BLOCK_SIZE = 500
+
+# OlObjectClass value of a MAPIFolder, used to stop at the namespace when
+# walking up ``Parent``.
+OL_FOLDER_CLASS = 2
+
+# Outlook reports "no date" as 1 January 4501.
+OUTLOOK_NO_DATE_YEAR = 4501
+
+# Task field -> property a listing can be sorted by.
+SORT_PROPERTIES = {
+    "dueDate": "DueDate",
+    "startDate": "StartDate",
+    "importance": "Importance",
+    "lastModified": "LastModificationTime",
+    "subject": "Subject",
+}
+
+# OlTaskStatus and OlImportance values by the names the API accepts.
+TASK_STATUSES = {"notStarted": 0, "inProgress": 1, "complete": 2, "waiting": 3, "deferred": 4}
+IMPORTANCES = {"low": 0, "normal": 1, "high": 2}
+
+# (dueDate, entryId) of a task; the position a listing page resumes after.
+TaskKey = Tuple[Optional[datetime], str]
+# (field, descending) a listing is sorted by; field is a SORT_PROPERTIES key.
+TaskOrder = Tuple[str, bool]
+# (subject, due_date, body) of a task to create.
+NewTask = Tuple[str, Optional[datetime], Optional[str]]
+
+T = TypeVar("T")
+A = TypeVar("A")
+R = TypeVar("R")
+
+
 class OutlookError(Exception):
     """Custom exception for Outlook errors."""
 
 
+class OutlookBusyError(OutlookError):
+    """Raised when the Outlook job queue is full, or Outlook itself is busy or not running.
+
+    ``retry_after`` estimates in seconds when the backlog will have drained.
+    """
+
+    def __init__(self, message: str, retry_after: float = 1.0) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class OutlookUnavailableError(OutlookBusyError):
+    """Raised without calling Outlook while the :class:`CircuitBreaker` is open."""
+
+
+class OutlookTimeoutError(OutlookError, TimeoutError):
+    """Raised when an Outlook operation misses its deadline."""
+
+
+class OutlookFilterError(OutlookError, ValueError):
+    """Raised when Outlook rejects a Restrict filter."""
+
+
+class OutlookNotFoundError(OutlookError, LookupError):
+    """Raised when an item cannot be opened by its entry ID."""
+
+
+@dataclass(frozen=True)
+class TaskQuery:
+    """Filters for a task listing, applied by Outlook as one ``@SQL=`` Restrict.
+
+    ``statuses`` holds OlTaskStatus values, any of which may match;
+    ``importance`` an OlImportance value. Text comparisons are
+    case-insensitive, as everywhere in Outlook.
+    """
+
+    due_before: Optional[datetime] = None
+    due_after: Optional[datetime] = None
+    statuses: Tuple[int, ...] = ()
+    category: Optional[str] = None
+    importance: Optional[int] = None
+    subject_contains: Optional[str] = None
+    owner: Optional[str] = None
+
+    def restriction(self) -> Optional[str]:
+        """The DASL filter for these conditions, or None if there are none."""
+        conditions = []
+        if self.due_before is not None:
+            conditions.append(f'"{DASL_TASK_DUE_DATE}" < \'{_dasl_date(self.due_before)}\'')
+        if self.due_after is not None:
+            conditions.append(f'"{DASL_TASK_DUE_DATE}" > \'{_dasl_date(self.due_after)}\'')
+        if self.statuses:
+            alternatives = " OR ".join(f'"{DASL_TASK_STATUS}" = {status}' for status in self.statuses)
+            conditions.append(f"({alternatives})" if len(self.statuses) > 1 else alternatives)
+        if self.category is not None:
+            # Keywords is multi-valued; equality matches any one category.
+            conditions.append(f'"{DASL_CATEGORIES}" = {_dasl_string(self.category)}')
+        if self.importance is not None:
+            conditions.append(f'"{DASL_IMPORTANCE}" = {self.importance}')
+        if self.subject_contains is not None:
+            conditions.append(f'"{DASL_SUBJECT}" LIKE {_dasl_string("%" + self.subject_contains + "%")}')
+        if self.owner is not None:
+            conditions.append(f'"{DASL_TASK_OWNER}" = {_dasl_string(self.owner)}')
+        if not conditions:
+            return None
+        return "@SQL=" + " AND ".join(conditions)
+
+
+class TaskReader(Protocol):
+    """The read operations routes run against a task source.
+
+    Implemented by :class:`OutlookTasks`, on a COM worker, and by
+    :class:`app.mirror.TaskMirror`, locally; both return the same results.
+    """
+
+    def list_incomplete_tasks(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+        sort: Optional[TaskOrder] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]: ...
+
+    def iter_incomplete_tasks(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+        sort: Optional[TaskOrder] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]: ...
+
+    def list_incomplete_task_page(
+        self,
+        limit: int,
+        after: Optional[TaskKey] = None,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[TaskKey]]: ...
+
+    def count_incomplete_tasks(self, query: Optional[TaskQuery] = None) -> int: ...
+
+    def get_task(self, entry_id: str, include_body: bool = True) -> Dict[str, Any]: ...
+
+
+def is_outlook_failure(exc: BaseException) -> bool:
+    """Return True if ``exc`` means Outlook failed, not that the request was wrong.
+
+    Only timeouts and the disconnect and busy HRESULTs count; any other COM
+    error is Outlook answering, e.g. that an item does not exist.
+    """
+    if isinstance(exc, OutlookTimeoutError):
+        return True
+    hresult = _hresult(exc)
+    return hresult in RPC_DISCONNECT_HRESULTS or hresult in RPC_BUSY_HRESULTS
+
+
+def _as_busy_error(exc: BaseException) -> BaseException:
+    """``exc`` as an :class:`OutlookBusyError` if it is a COM error of a busy or disconnected Outlook."""
+    if isinstance(exc, OutlookError) or not is_outlook_failure(exc):
+        return exc
+    return OutlookBusyError(f"Outlook is busy or not running: {exc}")
+
+
+def is_disconnect_error(exc: BaseException) -> bool:
+    """Return True if ``exc`` is a COM error meaning Outlook is unreachable."""
+    return _hresult(exc) in RPC_DISCONNECT_HRESULTS
+
+
+def _hresult(exc: BaseException) -> Optional[int]:
+    hresult = getattr(exc, "hresult", None)
+    if hresult is None and exc.args and isinstance(exc.args[0], int):
+        hresult = exc.args[0]
+    return hresult
+
+
+class _ItemsEvents:
+    """Event sink for ``Items``; subclasses set ``listener``."""
+
+    listener: Callable[[str, Any], None]
+
+    def OnItemAdd(self, item: Any) -> None:
+        self.listener("add", item)
+
+    def OnItemChange(self, item: Any) -> None:
+        self.listener("change", item)
+
+    def OnItemRemove(self) -> None:
+        self.listener("remove", None)
+
+
+class _FoldersEvents:
+    """Event sink for ``Folders``; subclasses set ``listener``."""
+
+    listener: Callable[[str, Any], None]
+
+    def OnFolderAdd(self, folder: Any) -> None:
+        self.listener("add", folder)
+
+    def OnFolderChange(self, folder: Any) -> None:
+        self.listener("change", folder)
+
+    def OnFolderRemove(self) -> None:
+        self.listener("remove", None)
+
+
+class FolderIndex:
+    """Process-wide map of normalized folder paths to ``(EntryID, StoreID)``.
+
+    Resolving a path by walking ``Folders`` collections costs several COM
+    calls per level, so every resolved prefix is remembered and later
+    lookups open the deepest known one directly with ``GetFolderFromID``.
+    Clients clear the index when a folder on their path changes; a cached
+    entry that no longer opens is dropped and walked again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(path: str) -> List[str]:
+        return [part.casefold() for part in path.split("\\") if part]
+
+    def resolve(self, namespace: Any, path: str) -> Any:
+        """Return the folder at ``path`` (e.g. ``\\\\Mailbox\\Tasks``)."""
+        logger = logging.getLogger(__name__)
+        names = [part for part in path.split("\\") if part]
+        keys = self.normalize(path)
+        if not names:
+            raise OutlookError("Invalid folder path: empty path")
+
+        # Start from the deepest prefix we already know.
+        current = None
+        depth = len(keys)
+        while depth:
+            with self._lock:
+                cached = self._entries.get("\\".join(keys[:depth]))
+            if cached is not None:
+                try:
+                    current = namespace.GetFolderFromID(*cached)
+                    break
+                except Exception as e:  # noqa: BLE001
+                    logger.debug("Cached folder for %s no longer opens: %s", path, e)
+                    self.invalidate()
+            depth -= 1
+        with self._lock:
+            if depth == len(keys):
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        folders = current.Folders if current is not None else namespace.Folders
+        for i in range(depth, len(names)):
+            try:
+                current = folders.Item(names[i])
+            except Exception:
+                level = "Root folder" if i == 0 else "Subfolder"
+                raise OutlookError(f"{level} not found: {names[i]}") from None
+            with self._lock:
+                self._entries["\\".join(keys[: i + 1])] = (current.EntryID, current.StoreID)
+            if i + 1 < len(names):
+                folders = current.Folders
+        return current
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def on_folder_event(self, kind: str, folder: Any) -> None:
+        """Folder event listener; any add, change or removal clears the index."""
+        self.invalidate()
+
+
+_folder_index = FolderIndex()
+
+
+def get_folder_index() -> FolderIndex:
+    """Return the process-wide folder path index."""
+    return _folder_index
+
+
+class StoreCache:
+    """Process-wide LRU of the StoreID each known EntryID lives in.
+
+    ``GetItemFromID`` without a StoreID makes Outlook search every store in
+    the profile. Clients look items up in the store remembered here, or in
+    their tasks folder's store, and only fall back to the search on a miss.
+    """
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stores: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, entry_id: str) -> Optional[str]:
+        with self._lock:
+            store_id = self._stores.get(entry_id)
+            if store_id is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._stores.move_to_end(entry_id)
+            return store_id
+
+    def put(self, entry_id: str, store_id: str) -> None:
+        with self._lock:
+            self._stores[entry_id] = store_id
+            self._stores.move_to_end(entry_id)
+            while len(self._stores) > self.max_entries:
+                self._stores.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._stores),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_store_cache = StoreCache()
+
+
+def get_store_cache() -> StoreCache:
+    """Return the process-wide EntryID to StoreID cache."""
+    return _store_cache
+
+
+def format_item_key(entry_id: str, store_id: str) -> str:
+    """Compound ``EntryID:StoreID`` key of an item."""
+    return f"{entry_id}:{store_id}"
+
+
+def parse_item_key(key: str) -> str:
+    """Return the EntryID of an item key or plain EntryID, remembering its store."""
+    entry_id, _, store_id = key.partition(":")
+    if store_id:
+        get_store_cache().put(entry_id, store_id)
+    return entry_id
+
+
+def _with_events(com_object: Any, handler: type) -> Any:
+    """``win32com.client.WithEvents`` that also accepts fake COM objects."""
+    hook = getattr(com_object, "_with_events", None)
+    if hook is not None:
+        return hook(handler)
+    if win32com is None:
+        raise OutlookError("pywin32 not available or platform not Windows")
+    return win32com.client.WithEvents(unwrap_com(com_object), handler)
+
+
+@measure_operations
 class OutlookTasks:
     """Helper for interacting with Outlook Tasks via COM."""
     
-    def __init__(self, folder_path: Optional[str] = None, profile: Optional[str] = None) -> None:
-        """Initialize the Outlook Tasks helper with optional folder path and profile."""
+    def __init__(
+        self,
+        folder_path: Optional[str] = None,
+        profile: Optional[str] = None,
+        application: Any = None,
+        list_engine: str = "table",
+    ) -> None:
+        """Initialize the Outlook Tasks helper with optional folder path and profile.
+
+        ``application`` may be an already connected ``Outlook.Application``
+        object (or the fake from :mod:`app.fake_outlook`); when omitted a new
+        COM connection is made for the current thread. ``list_engine``
+        selects how listings read the folder, see :meth:`list_incomplete_tasks`.
+        """
         logger = logging.getLogger(__name__)
+
+        if list_engine not in LIST_ENGINES:
+            raise OutlookError(f"Unknown list engine: {list_engine}")
+        self.list_engine = list_engine
+        self._store_id: Optional[str] = None
+        self._folder_id: Optional[str] = None
         
-        if platform.system() != "Windows" or not WIN32_AVAILABLE:
+        if application is None and (platform.system() != "Windows" or not WIN32_AVAILABLE):
             raise OutlookError("pywin32 not available or platform not Windows")
 
-        logger.debug(f"Initializing OutlookTasks with folder_path={folder_path}, profile={profile}")
+        logger.debug("Initializing OutlookTasks with folder_path=%s, profile=%s", folder_path, profile)
         
-        self.outlook = self._connect_outlook(profile)
+        self.outlook = instrument_com(application if application is not None else self._connect_outlook(profile))
         self.namespace = self.outlook.GetNamespace("MAPI")
         
         # Simplified approach: Always use the default Tasks folder
         # unless folder_path is "custom" and then use path resolution
         if folder_path and folder_path.lower() != "default":
             try:
-                logger.debug(f"Attempting to find folder from path: {folder_path}")
-                entry_id = self._find_folder_id_by_path(folder_path)
-                self.tasks_folder = self.namespace.GetFolderFromID(entry_id)
-                logger.debug(f"Using custom tasks folder: {self.tasks_folder.Name}")
+                logger.debug("Attempting to find folder from path: %s", folder_path)
+                self.tasks_folder = get_folder_index().resolve(self.namespace, folder_path)
             except Exception as e:
-                logger.error(f"Failed to get custom Tasks folder: {str(e)}")
+                logger.error("Failed to get custom Tasks folder: %s", e)
                 raise OutlookError(f"Failed to get custom Tasks folder: {str(e)}")
         else:
             logger.debug("Using default Tasks folder")
             self.tasks_folder = self.namespace.GetDefaultFolder(OUTLOOK_TASK_FOLDER)
         
-        logger.info(f"Using tasks folder: {self.tasks_folder.Name}")
+        logger.info("Using tasks folder: %s", folder_path or "default")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Reading the name costs a COM round trip; only pay it when it is logged.
+            logger.debug("Tasks folder name: %s", self.tasks_folder.Name)
+
+        self._folder_subscriptions: List[Any] = []
+        if folder_path and folder_path.lower() != "default":
+            try:
+                self._folder_subscriptions = self._watch_folder_path()
+            except Exception as e:  # noqa: BLE001
+                # Without events, cached paths are only dropped once they no longer open.
+                logger.warning("Could not subscribe to folder events: %s", e)
     
     @staticmethod
     def _connect_outlook(profile: Optional[str] = None):
-        """Connect to Outlook and initialize COM for the current thread."""
+        """Connect to Outlook from a thread whose COM apartment is already initialized.
+
+        The apartment is owned by the :class:`OutlookExecutor` worker (or by
+        pythoncom itself on the main thread), which also uninitializes it.
+        """
         if not WIN32_AVAILABLE or win32com is None:
             raise OutlookError("pywin32 not available or platform not Windows")
         
@@ -76,148 +565,1436 @@ class OutlookTasks:
         logger = logging.getLogger(__name__)
         
         try:
-            # Import required modules inside the function
-            import pythoncom
-            logger.debug("Initializing COM for the current thread...")
-            
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
-            logger.debug("COM initialized successfully")
-            
-            # Now connect to Outlook
             logger.debug("Attempting to connect to Outlook...")
             app = win32com.client.Dispatch("Outlook.Application")
             logger.debug("Connected to Outlook using Dispatch")
             return app
         except Exception as e:
-            logger.error(f"Failed to connect to Outlook: {str(e)}", exc_info=True)
+            logger.error("Failed to connect to Outlook: %s", e, exc_info=True)
             raise OutlookError(f"Failed to connect to Outlook: {str(e)}")
     
     def _find_folder_id_by_path(self, path: str) -> str:
         """Resolve a folder path like '\\Mailbox\\Tasks' to EntryID."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # Clean up the path by removing empty parts
-        parts = [p for p in path.split("\\") if p]
-        logger.debug(f"Folder path parts: {parts}")
-        
-        if not parts:
-            raise OutlookError("Invalid folder path: empty path")
-        
-        # Start with the root folders collection
-        folders = self.namespace.Folders
-        current = None
-        
-        # First level is the mailbox/store name
-        for i in range(folders.Count):
-            folder = folders.Item(i+1)  # 1-based index
-            logger.debug(f"Checking root folder: {folder.Name}")
-            if folder.Name == parts[0]:
-                current = folder
-                logger.debug(f"Found root folder: {folder.Name}")
-                break
-        
-        if current is None:
-            raise OutlookError(f"Root folder not found: {parts[0]}")
-        
-        # Navigate through the remaining path
-        for name in parts[1:]:
-            found = False
-            try:
-                sub_folders = current.Folders
-                for i in range(sub_folders.Count):
-                    folder = sub_folders.Item(i+1)  # 1-based index
-                    logger.debug(f"Checking subfolder: {folder.Name}")
-                    if folder.Name == name:
-                        current = folder
-                        found = True
-                        logger.debug(f"Found subfolder: {folder.Name}")
-                        break
-                
-                if not found:
-                    raise OutlookError(f"Subfolder not found: {name}")
-                    
-            except Exception as e:
-                raise OutlookError(f"Error accessing folder {name}: {str(e)}")
-        
-        return current.EntryID
+        return get_folder_index().resolve(self.namespace, path).EntryID
+
+    def _watch_folder_path(self) -> List[Any]:
+        """Subscribe to folder changes along the tasks folder's path.
+
+        A rename, move or removal of any folder on the path changes what the
+        configured path means, so each ancestor's ``Folders`` collection is
+        watched and any event clears the :class:`FolderIndex`.
+        """
+        index = get_folder_index()
+        handler = type("FoldersEvents", (_FoldersEvents,), {"listener": staticmethod(index.on_folder_event)})
+        subscriptions = []
+        parent = self.tasks_folder.Parent
+        while parent is not None and parent.Class == OL_FOLDER_CLASS:
+            subscriptions.append(_with_events(parent.Folders, handler))
+            parent = parent.Parent
+        subscriptions.append(_with_events(self.namespace.Folders, handler))
+        return subscriptions
+
+    def ping(self) -> None:
+        """Cheap round trip used to check that the COM proxies are still alive."""
+        self.tasks_folder.EntryID
+
+    def watch(self, listener: Callable[[str, Any], None]) -> Any:
+        """Subscribe ``listener(kind, item)`` to changes in the tasks folder.
+
+        ``kind`` is ``"add"``, ``"change"`` or ``"remove"``; Outlook does not
+        say which item was removed, so ``item`` is None for removals. Events
+        are delivered on this client's thread while it pumps COM messages.
+        Keep the returned subscription alive for as long as events are wanted.
+        """
+        handler = type("ItemsEvents", (_ItemsEvents,), {"listener": staticmethod(listener)})
+        items = self.tasks_folder.Items
+        return _with_events(items, handler)
 
     # Task operations -----------------------------------------------------
 
-    def list_incomplete_tasks(self) -> List[Dict[str, Any]]:
-        """List all incomplete tasks in the tasks folder."""
+    def list_incomplete_tasks(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+        sort: Optional[TaskOrder] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """List all incomplete tasks in the tasks folder.
+
+        The ``table`` engine reads the scalar columns for a whole block of
+        rows in one ``Table.GetArray`` call; the ``items`` engine reads every
+        property of every item separately. Only the properties named in
+        ``fields`` (default: :data:`DEFAULT_TASK_FIELDS`) are read; with
+        ``body_preview`` each task also gets a ``bodyPreview`` of at most
+        that many UTF-8 bytes. Only tasks matching ``query`` are returned;
+        Outlook does the filtering. With ``sort`` Outlook orders the rows
+        before they are read, so with ``limit`` only the first ``limit``
+        rows are read at all.
+        """
+        return list(self.iter_incomplete_tasks(fields, body_preview, query, sort, limit))
+
+    def iter_incomplete_tasks(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+        sort: Optional[TaskOrder] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Like :meth:`list_incomplete_tasks`, but yield tasks as they are read."""
+        fields = _check_fields(fields)
+        prop, descending = (SORT_PROPERTIES[sort[0]], sort[1]) if sort else (None, False)
+        tasks = self._iter_tasks(
+            set(fields), body_preview, _restrictions(query), prop, descending=descending, limit=limit
+        )
+        return self._finish_iter(tasks, fields, body_preview)
+
+    def count_incomplete_tasks(self, query: Optional[TaskQuery] = None) -> int:
+        """Count the incomplete tasks matching ``query`` without opening any item."""
+        restrictions = _restrictions(query)
+        if self.list_engine == "table":
+            table = self.tasks_folder.GetTable(INCOMPLETE_TASKS_FILTER)
+            for restriction in restrictions:
+                table = table.Restrict(restriction)
+            return table.GetRowCount()
+        items = self.tasks_folder.Items.Restrict(TASK_CLASS_FILTER).Restrict("[Complete] = 0")
+        for restriction in restrictions:
+            items = items.Restrict(restriction)
+        return items.Count
+
+    def list_changed_tasks(self, since: datetime) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Return tasks modified at or after ``since``: ``(incomplete, completed)``.
+
+        Incomplete tasks come with :data:`SYNC_TASK_FIELDS`; completed ones with ``entryId`` and ``lastModified``
+        only. Outlook compares dates to the minute, so the restriction is
+        widened to the minute and narrowed again here.
+        """
+        restriction = [f"[LastModificationTime] >= '{_jet_date(since)}'"]
+        fields = SYNC_TASK_FIELDS
+        changed = [
+            task
+            for task in self._iter_tasks(set(fields), None, restriction)
+            if task["lastModified"] >= since
+        ]
+        completed = [
+            {"entryId": task["entryId"], "lastModified": task["lastModified"]}
+            for task in self._iter_tasks({"lastModified"}, None, restriction, completed=True)
+            if task["lastModified"] >= since
+        ]
+        return self._finish(changed, fields, None), completed
+
+    def list_incomplete_task_page(
+        self,
+        limit: int,
+        after: Optional[TaskKey] = None,
+        fields: Optional[Sequence[str]] = None,
+        body_preview: Optional[int] = None,
+        query: Optional[TaskQuery] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[TaskKey]]:
+        """Return one page of incomplete tasks ordered by due date, then EntryID.
+
+        Tasks without a due date come last. ``after`` is the key returned for
+        the previous page; the returned key resumes after this page and is
+        None once the folder is exhausted (a full last page may still be
+        followed by an empty one). Rows are read in due date order only up to
+        the end of the page's last due date, and bodies only for the page.
+        Undated rows are scanned but only ``limit + 1`` of them are kept.
+        ``fields``, ``body_preview`` and ``query`` work as in
+        :meth:`list_incomplete_tasks`.
+        """
+        fields = _check_fields(fields)
+        read = set(fields) | {"entryId", "dueDate"}
+        page: List[Dict[str, Any]] = []
+        more = False
+        if after is None or after[0] is not None:
+            restrictions = _restrictions(query, DATED_TASKS_FILTER)
+            if after is not None:
+                restrictions.append(f"[DueDate] >= '{_jet_date(after[0])}'")
+            boundary = None
+            for task in self._iter_tasks(read, body_preview, restrictions, sort="DueDate"):
+                if after is not None and _task_sort_key(task) <= _key_sort_key(after):
+                    continue
+                if boundary is not None and task["dueDate"] != boundary:
+                    more = True
+                    break
+                page.append(task)
+                if boundary is None and len(page) >= limit:
+                    boundary = task["dueDate"]
+            page.sort(key=_task_sort_key)
+            more = more or len(page) > limit
+            del page[limit:]
+        if len(page) < limit:
+            # Outlook can neither sort nor restrict on EntryID, so the undated
+            # rows are scanned, keeping only the next ones past the cursor.
+            remaining = limit - len(page)
+            undated = heapq.nsmallest(
+                remaining + 1,
+                (
+                    task
+                    for task in self._iter_tasks(read, body_preview, _restrictions(query, UNDATED_TASKS_FILTER))
+                    if after is None or _task_sort_key(task) > _key_sort_key(after)
+                ),
+                key=_task_sort_key,
+            )
+            more = len(undated) > remaining
+            page.extend(undated[:remaining])
+        else:
+            more = True
+        next_key = (page[-1]["dueDate"], page[-1]["entryId"]) if more and page else None
+        return self._finish(page, fields, body_preview), next_key
+
+    def _iter_tasks(
+        self,
+        fields: Set[str],
+        body_preview: Optional[int] = None,
+        restrictions: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        completed: bool = False,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield incomplete (or ``completed``) tasks with the scalar ``fields`` read.
+
+        Uses the configured engine, sorted by the ``sort`` property if given
+        and stopping after ``limit`` rows. Bodies are filled in later by
+        :meth:`_finish`, once it is known which rows are returned.
+        """
+        if self.list_engine == "table":
+            block_size = min(limit, TABLE_BLOCK_SIZE) if limit else TABLE_BLOCK_SIZE
+            tasks = self._iter_table(
+                fields, body_preview, restrictions or [], sort, completed, descending, block_size
+            )
+        else:
+            tasks = self._iter_items(fields, restrictions or [], sort, completed, descending)
+        return itertools.islice(tasks, limit)
+
+    def _iter_table(
+        self,
+        fields: Set[str],
+        body_preview: Optional[int],
+        restrictions: List[str],
+        sort: Optional[str],
+        completed: bool = False,
+        descending: bool = False,
+        block_size: int = TABLE_BLOCK_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Read tasks through ``Folder.GetTable``."""
+        table = self.tasks_folder.GetTable(COMPLETED_TASKS_FILTER if completed else INCOMPLETE_TASKS_FILTER)
+        for restriction in restrictions:
+            table = table.Restrict(restriction)
+        if sort:
+            table.Sort(sort, descending)
+        keys = [key for key in TABLE_COLUMNS if key in fields or key == "entryId"]
+        columns = table.Columns
+        columns.RemoveAll()
+        for key in keys:
+            columns.Add(TABLE_COLUMNS[key])
+        if self._preview_in_table(body_preview):
+            columns.Add(BODY_PREVIEW_COLUMN)
+            keys.append("bodyPreview")
+
+        while not table.EndOfTable:
+            rows = table.GetArray(block_size)
+            if not rows:
+                break
+            for row in rows:
+                task = dict(zip(keys, row))
+                if "dueDate" in task:
+                    task["dueDate"] = _com_date(task["dueDate"])
+                yield task
+
+    def _iter_items(
+        self,
+        fields: Set[str],
+        restrictions: List[str],
+        sort: Optional[str],
+        completed: bool = False,
+        descending: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Read tasks by iterating the restricted ``Items`` collection."""
         items = self.tasks_folder.Items
-        items = items.Restrict("[MessageClass] = 'IPM.Task'")
-        incomplete = items.Restrict("[Complete] = 0")
+        items = items.Restrict(TASK_CLASS_FILTER)
+        incomplete = items.Restrict("[Complete] <> 0" if completed else "[Complete] = 0")
+        for restriction in restrictions:
+            incomplete = incomplete.Restrict(restriction)
+        if sort:
+            incomplete.Sort(f"[{sort}]", descending)
+        keys = [key for key in TABLE_COLUMNS if key in fields and key != "entryId"]
 
-        results = []
         for task in incomplete:
-            results.append(
-                {
-                    "entryId": task.EntryID,
-                    "subject": task.Subject,
-                    "dueDate": getattr(task, "DueDate", None),
-                    "status": task.Status,
-                    "body": getattr(task, "Body", None),
-                }
-            )
-        return results
+            row: Dict[str, Any] = {"entryId": task.EntryID, "_item": task}
+            for key in keys:
+                row[key] = getattr(task, TABLE_COLUMNS[key], None)
+            if "dueDate" in row:
+                row["dueDate"] = _com_date(row["dueDate"])
+            yield row
+
+    def _preview_in_table(self, body_preview: Optional[int]) -> bool:
+        """Whether a body preview this long can be read as a Table column."""
+        return self.list_engine == "table" and body_preview is not None and body_preview <= TABLE_STRING_LIMIT
+
+    def _finish(
+        self, tasks: List[Dict[str, Any]], fields: Sequence[str], body_preview: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Read bodies for the returned rows and project them onto ``fields``."""
+        return list(self._finish_iter(tasks, fields, body_preview))
+
+    def _finish_iter(
+        self, tasks: Iterable[Dict[str, Any]], fields: Sequence[str], body_preview: Optional[int]
+    ) -> Iterator[Dict[str, Any]]:
+        need_body = "body" in fields or (body_preview is not None and not self._preview_in_table(body_preview))
+        for task in tasks:
+            item = task.pop("_item", None)
+            if need_body:
+                if item is None:
+                    item_logger.debug("Opening %s to read its body", task["entryId"])
+                    item = self.namespace.GetItemFromID(task["entryId"], self.store_id)
+                task["body"] = getattr(item, "Body", None)
+            if "itemKey" in fields:
+                task["itemKey"] = format_item_key(task["entryId"], self.store_id)
+            result = {field: task.get(field) for field in fields}
+            if body_preview is not None:
+                preview = task["bodyPreview"] if "bodyPreview" in task else task["body"]
+                result["bodyPreview"] = truncate_utf8(preview or "", body_preview)
+            yield result
         
     def add_task(self, subject: str, due_date: Optional[datetime] = None, body: Optional[str] = None) -> str:
         """Add a new task to Outlook Tasks folder."""
-        task = self.tasks_folder.Items.Add("IPM.Task")
+        return self._add_task(self.tasks_folder.Items, subject, due_date, body)
+
+    def add_tasks(self, tasks: Sequence[NewTask]) -> List[Union[str, Exception]]:
+        """Add ``(subject, due_date, body)`` tasks, returning each EntryID or its error."""
+        items = self.tasks_folder.Items
+        return _apply_each(tasks, lambda task: self._add_task(items, *task))
+
+    @staticmethod
+    def _add_task(items: Any, subject: str, due_date: Optional[datetime], body: Optional[str]) -> str:
+        task = items.Add("IPM.Task")
         task.Subject = subject
-        
+
         if due_date:
             task.DueDate = due_date
-            
+
         if body:
             task.Body = body
-            
+
         task.Save()
         return task.EntryID
         
     def complete_task(self, entry_id: str) -> None:
         """Mark a task as complete using its entry ID."""
-        task = self.namespace.GetItemFromID(entry_id)
+        task = self._get_item(entry_id)
         task.Status = OUTLOOK_TASK_COMPLETE  # olTaskComplete = 2
         task.Save()
 
     def delete_task(self, entry_id: str) -> None:
         """Delete a task using its entry ID."""
-        task = self.namespace.GetItemFromID(entry_id)
+        task = self._get_item(entry_id)
         task.Delete()
 
+    def get_task(
+        self, entry_id: str, include_body: bool = True, cached: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Return every :data:`DETAIL_PROPERTIES` field of one task, and its body if asked.
+
+        If ``cached`` is an earlier result for the same item with the same
+        ``lastModified``, its properties are reused and only the body is
+        read, if it is wanted and missing.
+        """
+        item, store_id = self._open_item(entry_id)
+        if cached is not None and cached["lastModified"] == item.LastModificationTime:
+            task = dict(cached)
+        else:
+            task = {"entryId": entry_id, "itemKey": format_item_key(entry_id, store_id)}
+            for field, prop in DETAIL_PROPERTIES.items():
+                task[field] = getattr(item, prop, None)
+            task["dueDate"] = _com_date(task["dueDate"])
+            task["startDate"] = _com_date(task["startDate"])
+        if include_body and "body" not in task:
+            task["body"] = item.Body
+        return task
+
+    @property
+    def store_id(self) -> str:
+        """StoreID of the tasks folder, read once."""
+        if self._store_id is None:
+            self._store_id = self.tasks_folder.StoreID
+        return self._store_id
+
+    @property
+    def folder_id(self) -> str:
+        """EntryID of the tasks folder, read once."""
+        if self._folder_id is None:
+            self._folder_id = self.tasks_folder.EntryID
+        return self._folder_id
+
+    def _get_item(self, entry_id: str) -> Any:
+        """Open a task of the tasks folder to change it.
+
+        Items in other folders are reported as not found: changing them
+        raises no event on the watched folder, which the caches expect.
+        """
+        item = self._open_item(entry_id)[0]
+        if item.Parent.EntryID != self.folder_id:
+            raise OutlookNotFoundError(f"Task not found in the tasks folder: {entry_id}")
+        return item
+
+    def _open_item(self, entry_id: str) -> Tuple[Any, str]:
+        """Open an item in its cached store, else the tasks folder's store.
+
+        Only if that fails is Outlook left to search every store, and the
+        store the item was found in is remembered. Returns the item and
+        its StoreID; raises :class:`OutlookNotFoundError` if there is none,
+        but lets a busy or disconnected Outlook's error through.
+        """
+        stores = get_store_cache()
+        store_id = stores.get(entry_id) or self.store_id
+        try:
+            return self.namespace.GetItemFromID(entry_id, store_id), store_id
+        except Exception as e:
+            if is_outlook_failure(e):
+                raise
+        try:
+            item = self.namespace.GetItemFromID(entry_id)
+        except Exception as e:
+            if is_outlook_failure(e):
+                raise
+            raise OutlookNotFoundError(f"Task not found: {entry_id}") from e
+        store_id = item.Parent.StoreID
+        stores.put(entry_id, store_id)
+        return item, store_id
+
+    def complete_tasks(self, entry_ids: Sequence[str], stop_on_error: bool = False) -> List[Optional[Exception]]:
+        """Complete each task, returning None or the error per entry ID.
+
+        With ``stop_on_error`` the list ends at the first failure; the
+        remaining tasks are left untouched.
+        """
+        return _apply_each(entry_ids, self.complete_task, stop_on_error)
+
+    def delete_tasks(self, entry_ids: Sequence[str], stop_on_error: bool = False) -> List[Optional[Exception]]:
+        """Delete each task, returning None or the error per entry ID, as :meth:`complete_tasks`."""
+        return _apply_each(entry_ids, self.delete_task, stop_on_error)
+
+    def scan_incomplete_tasks(self, known: Mapping[str, Any]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Read the tasks that are new or changed relative to ``known``, for a local mirror.
+
+        ``known`` maps EntryIDs to the ``lastModified`` already held. One
+        Table scan reads every :data:`DETAIL_PROPERTIES` column of every
+        incomplete task; only rows missing from ``known`` or modified since
+        are opened to read their body. Returns those full records (see
+        :func:`task_record`) and the EntryIDs of all incomplete tasks.
+        """
+        table = self.tasks_folder.GetTable(INCOMPLETE_TASKS_FILTER)
+        keys = ["entryId", *DETAIL_PROPERTIES]
+        columns = table.Columns
+        columns.RemoveAll()
+        columns.Add("EntryID")
+        for prop in DETAIL_PROPERTIES.values():
+            columns.Add(prop)
+        changed: List[Dict[str, Any]] = []
+        present: List[str] = []
+        while not table.EndOfTable:
+            rows = table.GetArray(TABLE_BLOCK_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                task = dict(zip(keys, row))
+                present.append(task["entryId"])
+                if task["entryId"] in known and known[task["entryId"]] == task["lastModified"]:
+                    continue
+                task["dueDate"] = _com_date(task["dueDate"])
+                task["startDate"] = _com_date(task["startDate"])
+                item_logger.debug("Opening %s to read its body", task["entryId"])
+                try:
+                    task["body"] = self.namespace.GetItemFromID(task["entryId"], self.store_id).Body
+                except Exception as e:
+                    if is_outlook_failure(e):
+                        raise
+                    # Deleted since the row was read.
+                    continue
+                task["complete"] = False
+                changed.append(task)
+        return changed, present
+
+    def find_task_ids(self, restriction: str, include_completed: bool = False) -> List[str]:
+        """EntryIDs of the incomplete (and optionally completed) tasks matching a Restrict filter.
+
+        ``restriction`` is a Jet (``[Subject] = 'x'``) or DASL (``@SQL=...``)
+        filter; :class:`OutlookFilterError` is raised if Outlook rejects it.
+        """
+        states = (False, True) if include_completed else (False,)
+        try:
+            return [
+                task["entryId"]
+                for completed in states
+                for task in self._iter_tasks({"entryId"}, None, [restriction], completed=completed)
+            ]
+        except Exception as e:
+            if is_outlook_failure(e):
+                raise
+            raise OutlookFilterError(f"Invalid filter {restriction!r}: {e}") from e
+
 
 # Convenience factory ------------------------------------------------------
 
 def get_tasks_client() -> OutlookTasks:
-    """Factory function to create an OutlookTasks client using environment variables."""
+    """Factory function to create an OutlookTasks client from the current settings."""
     import logging
     logger = logging.getLogger(__name__)
-    
-    # Make sure we load from .env file before creating the client
-    dotenv_path = find_dotenv(usecwd=True)
-    if dotenv_path:
-        logger.debug(f"Loading environment from: {dotenv_path}")
-        load_dotenv(dotenv_path)
-    else:
-        logger.debug("No .env file found. Using default environment variables.")
-        
-    folder = os.getenv("OUTLOOK_TASKS_FOLDER")
-    profile = os.getenv("OUTLOOK_PROFILE")
-    
-    logger.debug(f"Creating OutlookTasks with folder={folder}, profile={profile}")
+
+    settings = get_settings()
+    folder = settings.outlook_tasks_folder
+    profile = settings.outlook_profile
+    list_engine = settings.outlook_list_engine
+    application = None
+    if settings.outlook_backend == "fake":
+        from .fake_outlook import get_fake_outlook
+
+        application = get_fake_outlook(settings.outlook_fake_tasks, settings.outlook_fake_latency).Application()
+
+    logger.debug("Creating OutlookTasks with folder=%s, profile=%s", folder, profile)
     
     try:
-        client = OutlookTasks(folder, profile)
+        client = OutlookTasks(folder, profile, list_engine=list_engine, application=application)
         logger.debug("OutlookTasks client created successfully")
         return client
     except Exception as e:
-        logger.error(f"Failed to create OutlookTasks client: {str(e)}", exc_info=True)
+        logger.error("Failed to create OutlookTasks client: %s", e, exc_info=True)
         raise
 
+def _apply_each(
+    args: Sequence[A], operation: Callable[[A], R], stop_on_error: bool = False
+) -> List[Union[R, Exception]]:
+    """Run ``operation`` on each argument, collecting its result or error.
+
+    A failure does not stop the others unless ``stop_on_error`` is set, in
+    which case the list ends with it. A busy or disconnected Outlook (see
+    :func:`is_outlook_failure`) is raised if nothing was done yet, so the
+    job can be retried on a new session or counted by the breaker; later,
+    it fails the rest of the batch.
+    """
+    results: List[Union[R, Exception]] = []
+    done = False
+    for arg in args:
+        try:
+            results.append(operation(arg))
+            done = True
+        except Exception as e:  # noqa: BLE001
+            if not is_outlook_failure(e):
+                item_logger.debug("Batch item %r failed: %s", arg, e)
+                results.append(e)
+                if stop_on_error:
+                    break
+                continue
+            if not done:
+                raise
+            results.extend([e] * (len(args) - len(results)))
+            break
+    return results
+
+
+def task_record(item: Any) -> Dict[str, Any]:
+    """Every :data:`DETAIL_PROPERTIES` field of an open item, plus its body and ``complete``."""
+    task = {"entryId": item.EntryID}
+    for field, prop in DETAIL_PROPERTIES.items():
+        task[field] = getattr(item, prop, None)
+    task["dueDate"] = _com_date(task["dueDate"])
+    task["startDate"] = _com_date(task["startDate"])
+    task["body"] = getattr(item, "Body", None)
+    task["complete"] = bool(getattr(item, "Complete", False))
+    return task
+
+
+def _com_date(value: Any) -> Any:
+    """Map Outlook's "no date" sentinel to None."""
+    if value is not None and getattr(value, "year", 0) >= OUTLOOK_NO_DATE_YEAR:
+        return None
+    return value
+
+
+def _check_fields(fields: Optional[Sequence[str]]) -> Sequence[str]:
+    if not fields:
+        return DEFAULT_TASK_FIELDS
+    unknown = [field for field in fields if field not in TASK_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown task fields: {', '.join(unknown)}")
+    return [field for field in TASK_FIELDS if field in fields]
+
+
+def truncate_utf8(text: str, max_bytes: int) -> str:
+    """Cut ``text`` to at most ``max_bytes`` UTF-8 bytes without splitting a character."""
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", "ignore")
+
+
+def _restrictions(query: Optional[TaskQuery], *more: str) -> List[str]:
+    """Restrict filters for ``query`` followed by ``more``."""
+    restriction = query.restriction() if query is not None else None
+    return ([restriction] if restriction else []) + list(more)
+
+
+def _dasl_date(value: datetime) -> str:
+    """Format a task date for a DASL comparison.
+
+    Task start and due dates are stored in local time, so unlike most DASL
+    date properties they are compared without converting to UTC.
+    """
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+def _dasl_string(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _jet_date(value: datetime) -> str:
+    """Format a datetime for a Jet ``Restrict`` comparison (minute precision)."""
+    return value.strftime("%m/%d/%Y %I:%M %p")
+
+
+def _key_sort_key(key: TaskKey) -> tuple:
+    due, entry_id = key
+    return (due is None, due or datetime.min, entry_id)
+
+
+def _task_sort_key(task: Dict[str, Any]) -> tuple:
+    return _key_sort_key((task["dueDate"], task["entryId"]))
+
+
+def encode_cursor(key: TaskKey) -> str:
+    """Encode a page position as an opaque URL-safe token."""
+    due, entry_id = key
+    payload = json.dumps({"d": due.isoformat() if due else None, "e": entry_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> TaskKey:
+    """Decode a token from :func:`encode_cursor`; raises ValueError if invalid."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        due = datetime.fromisoformat(payload["d"]) if payload["d"] else None
+        return due, str(payload["e"])
+    except Exception as e:  # noqa: BLE001
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+# The session whose client forwards folder events; see OutlookSession._subscribe.
+_event_session: Optional["OutlookSession"] = None
+_event_session_lock = threading.Lock()
+
+
+class OutlookSession:
+    """Long-lived Outlook connection that hands a warm client to callers.
+
+    Connecting to Outlook (``CoInitialize``, ``Dispatch``, ``GetNamespace``
+    and resolving the tasks folder) costs more than most task operations, so
+    the session keeps one :class:`OutlookTasks` around and only rebuilds it
+    when it has been idle for ``idle_timeout`` seconds, when a health check
+    fails, or when an operation reports that Outlook disconnected.
+
+    COM proxies belong to the thread that created them, so a session must
+    only be used from a single thread. Of all sessions in the process only
+    one subscribes to folder events, so each event reaches the change
+    listeners once; when it closes, the next session to be used takes over.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], OutlookTasks],
+        idle_timeout: float = 300.0,
+        health_interval: float = 30.0,
+    ) -> None:
+        self._factory = factory
+        self.idle_timeout = idle_timeout
+        self.health_interval = health_interval
+        self._client: Optional[OutlookTasks] = None
+        self._generation = _session_generation
+        self._subscription: Any = None
+        self._last_used = 0.0
+        self._last_checked = 0.0
+        self.connects = 0
+
+    def client(self) -> OutlookTasks:
+        """Return a connected client, reconnecting if it is stale or unhealthy."""
+        logger = logging.getLogger(__name__)
+        now = time.monotonic()
+        if self._client is not None and self._generation != _session_generation:
+            logger.info("Outlook settings changed; reconnecting")
+            self.close()
+        if self._client is not None and self.idle_timeout and now - self._last_used > self.idle_timeout:
+            logger.debug("Outlook session idle for too long; reconnecting")
+            self.close()
+        if self._client is not None and now - self._last_checked > self.health_interval:
+            try:
+                self._client.ping()
+                self._last_checked = now
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Outlook session health check failed: %s", e)
+                self.close()
+        if self._client is None:
+            self._generation = _session_generation
+            self._client = self._factory()
+            self.connects += 1
+            self._last_checked = now
+            self._subscribe(self._client)
+        elif _event_session is None:
+            self._subscribe(self._client)
+        self._last_used = now
+        return self._client
+
+    def _subscribe(self, client: OutlookTasks) -> None:
+        """Forward folder events to the change listeners, unless another session does."""
+        global _event_session
+        if not _change_listeners:
+            return
+        with _event_session_lock:
+            if _event_session is not None and _event_session is not self:
+                return
+            _event_session = self
+        # Anything may have changed while nobody was subscribed.
+        _notify_change("reset", None)
+        try:
+            self._subscription = client.watch(_notify_change)
+        except Exception as e:  # noqa: BLE001
+            logging.getLogger(__name__).warning("Could not subscribe to folder events: %s", e)
+
+    def run(self, operation: Callable[[OutlookTasks], T]) -> T:
+        """Run ``operation`` with the warm client, retrying once after a disconnect."""
+        try:
+            return operation(self.client())
+        except Exception as e:
+            if not is_disconnect_error(e):
+                raise
+            logging.getLogger(__name__).warning("Outlook disconnected (%s); reconnecting", e)
+            self.close()
+            return operation(self.client())
+
+    def close(self) -> None:
+        """Drop the cached COM proxies and the event subscription."""
+        global _event_session
+        with _event_session_lock:
+            if _event_session is self:
+                _event_session = None
+        subscription, self._subscription = self._subscription, None
+        close = getattr(subscription, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:  # noqa: BLE001
+                pass
+        self._client = None
+
+
+# Bumped when settings that shape the connection change; sessions
+# connected under an older generation reconnect on their next use.
+_session_generation = 0
+
+
+def reset_sessions() -> None:
+    """Make every session reconnect before its next operation."""
+    global _session_generation
+    _session_generation += 1
+
+
+_CONNECTION_SETTINGS = ("outlook_backend", "outlook_tasks_folder", "outlook_profile", "outlook_list_engine")
+
+
+def _on_settings_reload(old: Settings, new: Settings) -> None:
+    if any(getattr(old, name) != getattr(new, name) for name in _CONNECTION_SETTINGS):
+        reset_sessions()
+
+
+add_reload_listener(_on_settings_reload)
+
+
+_change_listeners: List[Callable[[str, Any], None]] = []
+
+
+def add_change_listener(listener: Callable[[str, Any], None]) -> None:
+    """Call ``listener(kind, item)`` for every change event of the tasks folder.
+
+    Besides the ``"add"``, ``"change"`` and ``"remove"`` events of
+    :meth:`OutlookTasks.watch`, listeners get ``"reset"`` whenever a session
+    (re)connects, since events may have been missed in between. Listeners
+    run on the COM worker threads and must be quick and thread-safe.
+    """
+    if listener not in _change_listeners:
+        _change_listeners.append(listener)
+
+
+def remove_change_listener(listener: Callable[[str, Any], None]) -> None:
+    if listener in _change_listeners:
+        _change_listeners.remove(listener)
+
+
+def _notify_change(kind: str, item: Any) -> None:
+    for listener in list(_change_listeners):
+        try:
+            listener(kind, item)
+        except Exception as e:  # noqa: BLE001
+            logging.getLogger(__name__).error("Change listener failed: %s", e, exc_info=True)
+
+
+# Seconds an expected event of our own write is waited for.
+PENDING_EVENT_TTL = 60.0
+
+
+class PendingEvents:
+    """Counts the folder events our own writes are still expected to cause.
+
+    Change listeners use it to recognize and skip those events. Each
+    expectation lapses after ``ttl`` seconds, so one whose event never
+    comes, e.g. because the subscription failed, cannot swallow a later
+    change made elsewhere. Not thread-safe; callers hold their own lock.
+    """
+
+    def __init__(self, ttl: float = PENDING_EVENT_TTL) -> None:
+        self.ttl = ttl
+        self._deadlines: Deque[float] = deque()
+
+    def expect(self, count: int = 1) -> None:
+        deadline = time.monotonic() + self.ttl
+        self._deadlines.extend(deadline for _ in range(count))
+
+    def cancel(self, count: int = 1) -> None:
+        """Drop the ``count`` newest expectations, for writes that did not happen."""
+        for _ in range(min(count, len(self._deadlines))):
+            self._deadlines.pop()
+
+    def consume(self) -> bool:
+        """Take one expectation for an event that arrived; False if none was pending."""
+        self._expire()
+        if not self._deadlines:
+            return False
+        self._deadlines.popleft()
+        return True
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._deadlines)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        while self._deadlines and self._deadlines[0] < now:
+            self._deadlines.popleft()
+
+
+class PendingItems:
+    """Like :class:`PendingEvents`, for events expected from known items.
+
+    Holds the EntryIDs whose event our own write is still expected to
+    cause, each until its event arrives or ``ttl`` seconds pass. Not
+    thread-safe; callers hold their own lock.
+    """
+
+    def __init__(self, ttl: float = PENDING_EVENT_TTL) -> None:
+        self.ttl = ttl
+        self._deadlines: "OrderedDict[str, float]" = OrderedDict()
+
+    def expect(self, entry_ids: Iterable[str]) -> None:
+        deadline = time.monotonic() + self.ttl
+        for entry_id in entry_ids:
+            self._deadlines.pop(entry_id, None)
+            self._deadlines[entry_id] = deadline
+
+    def consume(self, entry_id: Optional[str]) -> bool:
+        """Take the expectation for ``entry_id``'s event; False if none was pending."""
+        self._expire()
+        return self._deadlines.pop(entry_id, None) is not None
+
+    def clear(self) -> None:
+        self._deadlines.clear()
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._deadlines)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        while self._deadlines:
+            entry_id, deadline = next(iter(self._deadlines.items()))
+            if deadline >= now:
+                break
+            del self._deadlines[entry_id]
+
+
+_sessions = threading.local()
+
+
+def get_session() -> OutlookSession:
+    """Return the Outlook session owned by the calling thread."""
+    session = getattr(_sessions, "session", None)
+    if session is None:
+        settings = get_settings()
+        session = OutlookSession(
+            get_tasks_client,
+            idle_timeout=settings.outlook_session_idle_timeout,
+            health_interval=settings.outlook_session_health_interval,
+        )
+        _sessions.session = session
+    return session
+
+
+def _co_initialize() -> None:
+    try:
+        import pythoncom  # type: ignore
+    except ImportError:
+        return
+    pythoncom.CoInitialize()
+
+
+def _co_uninitialize() -> None:
+    try:
+        import pythoncom  # type: ignore
+    except ImportError:
+        return
+    pythoncom.CoUninitialize()
+
+
+def _pump_messages() -> None:
+    """Deliver pending COM events to handlers registered on this thread."""
+    try:
+        import pythoncom  # type: ignore
+    except ImportError:
+        return
+    pythoncom.PumpWaitingMessages()
+
+
+# Seconds a streamed job waits for its consumer to read before it is
+# abandoned, when no operation timeout sets a shorter limit.
+STREAM_STALL_LIMIT = 30.0
+
+
+class CircuitBreaker:
+    """Stops sending work to an Outlook that keeps failing or hanging.
+
+    Closed, calls go through. ``failure_threshold`` consecutive failures
+    (see :func:`is_outlook_failure`) open the circuit: calls then fail at
+    once with :class:`OutlookUnavailableError` instead of queueing behind
+    a blocked COM worker. After ``reset_timeout`` seconds the circuit is
+    half-open and lets one call through as a probe; its success closes the
+    circuit, its failure opens it for another ``reset_timeout``. A probe
+    that never reports back is replaced after the same delay. Idle
+    :class:`OutlookExecutor` workers probe on their own (see
+    :meth:`start_probe`), so the circuit closes without waiting for a
+    request to try.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self._opened = 0.0
+        self._probe_started = 0.0
+
+    def allow(self) -> None:
+        """Raise :class:`OutlookUnavailableError` unless a call may go to Outlook now."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.CLOSED or self._start_probe(now):
+                return
+            self.rejected += 1
+            retry_after = max(0.0, self.reset_timeout - (now - self._opened))
+        raise OutlookUnavailableError(
+            f"Outlook is not responding; not retrying for {retry_after:.0f} s", retry_after=retry_after
+        )
+
+    def start_probe(self) -> bool:
+        """Return True, going half-open, if the circuit is open and due for a probe.
+
+        The caller must then try Outlook and report with :meth:`record_success`
+        or :meth:`record_failure`.
+        """
+        with self._lock:
+            return self.state != self.CLOSED and self._start_probe(time.monotonic())
+
+    def _start_probe(self, now: float) -> bool:
+        if self.state == self.OPEN and now - self._opened >= self.reset_timeout:
+            logging.getLogger(__name__).info("Outlook circuit half-open; probing")
+            self.state = self.HALF_OPEN
+            self._probe_started = now
+            return True
+        if self.state == self.HALF_OPEN and now - self._probe_started >= self.reset_timeout:
+            self._probe_started = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logging.getLogger(__name__).info("Outlook answered; circuit closed")
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self.failures >= self.failure_threshold
+            ):
+                if self.state == self.CLOSED:
+                    self.trips += 1
+                    logging.getLogger(__name__).warning(
+                        "Outlook failed %d times in a row; circuit open for %g s", self.failures, self.reset_timeout
+                    )
+                self.state = self.OPEN
+                self._opened = time.monotonic()
+
+    def record(self, exc: Optional[BaseException]) -> None:
+        """Record the outcome of a call that raised ``exc``, or None if it succeeded."""
+        if exc is not None and is_outlook_failure(exc):
+            self.record_failure()
+        elif exc is None or isinstance(exc, Exception):
+            self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """State, as a name and as 0/1 ``open``/``halfOpen`` gauges, with trip and rejection counts."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "open": int(self.state == self.OPEN),
+                "halfOpen": int(self.state == self.HALF_OPEN),
+                "consecutiveFailures": self.failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+class OutlookExecutor:
+    """Runs every Outlook call on a small set of dedicated COM apartment threads.
+
+    Each worker initializes a single-threaded apartment, owns its own
+    :class:`OutlookSession` for its whole life and uninitializes COM when it
+    stops, so no COM state leaks into the web server's thread pool. Jobs are
+    callables taking an :class:`OutlookTasks`; they are queued on a bounded
+    queue and :meth:`submit` raises :class:`OutlookBusyError` instead of
+    growing it without limit.
+
+    :meth:`run` and :meth:`stream` wait at most ``timeout`` seconds for a
+    result (``None`` waits forever) and raise :class:`OutlookTimeoutError`
+    after that. A COM call cannot be interrupted, so the worker stays busy
+    until Outlook answers; the ``breaker`` counts timeouts of jobs a worker
+    was running, or that queued behind a call stuck for longer than
+    ``timeout``, and disconnects, and once it opens fails further calls at
+    once rather than queueing them behind the stuck one. Background jobs that wait on :meth:`submit`
+    directly, like the mirror's scans, are bound by neither.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        max_queue: int = 100,
+        session_factory: Callable[[], OutlookSession] = get_session,
+        poll_interval: float = 0.5,
+        timeout: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker()
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max_queue)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+        # Start time of the job each worker thread is running.
+        self._running: Dict[int, float] = {}
+
+    def start(self) -> None:
+        """Start the worker threads (idempotent)."""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"outlook-com-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers after the jobs already queued have run."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def submit(self, operation: Callable[[OutlookTasks], T]) -> "Future[T]":
+        """Queue ``operation`` and return a future for its result."""
+        self.start()
+        future: "Future[T]" = Future()
+        try:
+            self._queue.put_nowait((future, operation, time.monotonic()))
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            raise OutlookBusyError(
+                f"Outlook job queue is full ({self.max_queue} pending)", retry_after=self.drain_time()
+            ) from None
+        with self._lock:
+            self.submitted += 1
+        return future
+
+    async def run(self, operation: Callable[[OutlookTasks], T]) -> T:
+        """Submit ``operation`` and await its result without blocking the event loop."""
+        self.breaker.allow()
+        future = self.submit(operation)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except TimeoutError:
+            raise self._timed_out(future) from None
+        except BaseException as e:
+            self.breaker.record(e)
+            error = _as_busy_error(e)
+            if error is e:
+                raise
+            raise error from e
+        self.breaker.record(None)
+        return result
+
+    def _timed_out(self, future: "Future[Any]") -> OutlookTimeoutError:
+        """Count a timeout of ``future``'s job, against the breaker only if Outlook is to blame.
+
+        A job still in the queue is cancelled (waiting on it cancels it
+        already) so no worker runs it. Its timeout only counts as a failure
+        when a worker has been stuck in one call for longer than
+        ``timeout``; a queue that is merely long says nothing about
+        Outlook's health.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.timed_out += 1
+            hung = any(now - started >= self.timeout for started in self._running.values())
+        error = OutlookTimeoutError(f"Outlook did not answer within {self.timeout:g} s")
+        if not future.cancel() or hung:
+            self.breaker.record(error)
+        return error
+
+    def stream(
+        self, operation: Callable[[OutlookTasks], Iterable[T]], batch_size: int = 100, buffer: int = 8
+    ) -> AsyncIterator[T]:
+        """Run an operation that yields results and stream them back as they come.
+
+        Must be called from the event loop. The job is queued immediately, so
+        :class:`OutlookBusyError` is raised here rather than mid-stream.
+        ``timeout`` applies to each batch.
+        Results cross over to the event loop in batches of ``batch_size``; at
+        most ``buffer`` batches wait there, after which the worker blocks, so
+        memory stays flat however large the result. If the consumer stops
+        early the worker abandons the operation at the next batch. If it
+        stops reading for half of ``timeout``, or :data:`STREAM_STALL_LIMIT`
+        if that is shorter or there is no timeout, the worker abandons it
+        too, early enough for a job queued behind it to meet its own
+        deadline, and the stream ends with an :class:`OutlookError` once
+        the buffered batches have been read.
+        """
+        loop = asyncio.get_running_loop()
+        batches: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=buffer)
+        stop = threading.Event()
+        stalled = threading.Event()
+        stall_limit = min(self.timeout / 2, STREAM_STALL_LIMIT) if self.timeout else STREAM_STALL_LIMIT
+
+        def wake_consumer() -> None:
+            if not batches.full():
+                batches.put_nowait(("stalled", None))
+
+        def send(message: tuple) -> bool:
+            pending = asyncio.run_coroutine_threadsafe(batches.put(message), loop)
+            started = time.monotonic()
+            poll = min(self.poll_interval, stall_limit)
+            while True:
+                try:
+                    pending.result(timeout=poll)
+                    return True
+                except TimeoutError:
+                    overdue = time.monotonic() - started >= stall_limit
+                    if not (stop.is_set() or overdue):
+                        continue
+                    if not pending.cancel():
+                        return True
+                    if not stop.is_set():
+                        logging.getLogger(__name__).warning(
+                            "Stream consumer read nothing for %g s; abandoning the Outlook job", stall_limit
+                        )
+                        stalled.set()
+                        loop.call_soon_threadsafe(wake_consumer)
+                    return False
+
+        attempts = 0
+
+        def job(client: OutlookTasks) -> None:
+            nonlocal attempts
+            attempts += 1
+            sent = False
+            try:
+                batch: List[T] = []
+                for result in operation(client):
+                    batch.append(result)
+                    if len(batch) >= batch_size:
+                        if stop.is_set() or not send(("batch", batch)):
+                            return
+                        sent = True
+                        batch = []
+                send(("end", batch))
+            except BaseException as e:  # noqa: BLE001
+                if not sent and attempts == 1 and is_disconnect_error(e):
+                    # Nothing reached the consumer yet: let the session
+                    # reconnect and run the job again.
+                    raise
+                send(("error", e))
+                raise
+
+        async def results() -> AsyncIterator[T]:
+            try:
+                while True:
+                    if stalled.is_set() and batches.empty():
+                        kind = "stalled"
+                    else:
+                        try:
+                            kind, payload = await asyncio.wait_for(batches.get(), self.timeout)
+                        except TimeoutError:
+                            raise self._timed_out(future) from None
+                    if kind == "stalled":
+                        raise OutlookError(f"Stream abandoned after the client read nothing for {stall_limit:g} s")
+                    if kind == "error":
+                        self.breaker.record(payload)
+                        error = _as_busy_error(payload)
+                        if error is payload:
+                            raise payload
+                        raise error from payload
+                    for result in payload:
+                        yield result
+                    if kind == "end":
+                        self.breaker.record(None)
+                        return
+            finally:
+                stop.set()
+
+        self.breaker.allow()
+        future = self.submit(job)
+        return results()
+
+    def drain_time(self) -> float:
+        """Seconds the queued jobs should take at the average job run time so far."""
+        with self._lock:
+            started = self.completed + self.failed
+            average = self.total_run / started if started else 0.0
+        return self._queue.qsize() * average / self.workers
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput and queue wait and run time counters."""
+        with self._lock:
+            started = self.completed + self.failed
+            return {
+                "workers": self.workers,
+                "queueDepth": self._queue.qsize(),
+                "maxQueue": self.max_queue,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "timedOut": self.timed_out,
+                "avgWaitMs": self.total_wait / started * 1000 if started else 0.0,
+                "maxWaitMs": self.max_wait * 1000,
+                "avgRunMs": self.total_run / started * 1000 if started else 0.0,
+            }
+
+    def _probe(self, session: OutlookSession) -> None:
+        """Ping Outlook if the breaker is due for a probe, and report the outcome."""
+        if not self.breaker.start_probe():
+            return
+        try:
+            session.run(lambda client: client.ping())
+        except Exception as e:  # noqa: BLE001
+            logging.getLogger(__name__).info("Outlook probe failed: %s", e)
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def _work(self) -> None:
+        logger = logging.getLogger(__name__)
+        _co_initialize()
+        session = self._session_factory()
+        try:
+            while True:
+                try:
+                    job = self._queue.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    _pump_messages()
+                    self._probe(session)
+                    continue
+                if job is None:
+                    break
+                future, operation, enqueued = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                started = time.monotonic()
+                waited = started - enqueued
+                with self._lock:
+                    self._running[threading.get_ident()] = started
+                try:
+                    result = session.run(operation)
+                except BaseException as e:  # noqa: BLE001
+                    future.set_exception(e)
+                    ok = False
+                else:
+                    future.set_result(result)
+                    ok = True
+                with self._lock:
+                    del self._running[threading.get_ident()]
+                    self.total_wait += waited
+                    self.max_wait = max(self.max_wait, waited)
+                    self.total_run += time.monotonic() - started
+                    if ok:
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+                _pump_messages()
+        except Exception as e:  # noqa: BLE001
+            logger.error("Outlook worker stopped unexpectedly: %s", e, exc_info=True)
+        finally:
+            session.close()
+            _co_uninitialize()
+
+
+class RequestGate:
+    """Bounds the requests working against Outlook at once, shedding the excess.
+
+    At most ``limit`` requests hold a slot; up to ``max_waiting`` more wait
+    for one in arrival order. Beyond that :meth:`acquire` raises
+    :class:`OutlookBusyError` at once, so a burst gets quick ``503`` answers
+    instead of piling up behind a single Outlook. Used from the event loop
+    only, so it needs no lock.
+    """
+
+    def __init__(self, limit: int = 32, max_waiting: int = 100) -> None:
+        self.limit = limit
+        self.max_waiting = max_waiting
+        self._semaphore = asyncio.Semaphore(limit)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.total_held = 0.0
+
+    def retry_after(self) -> float:
+        """Seconds until the waiting requests should have had their turn."""
+        average = self.total_held / self.admitted if self.admitted else 0.0
+        return (self.waiting + 1) * average / self.limit
+
+    async def acquire(self) -> Callable[[], None]:
+        """Wait for a slot and return the function that gives it back.
+
+        The function may be called more than once; only the first call
+        counts. Prefer :meth:`slot` unless the slot must outlive a block,
+        e.g. to be handed to a streamed response.
+        """
+        if self._semaphore.locked() and self.waiting >= self.max_waiting:
+            self.rejected += 1
+            raise OutlookBusyError(
+                f"Too many Outlook requests ({self.limit} running, {self.waiting} waiting)",
+                retry_after=self.retry_after(),
+            )
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        self.admitted += 1
+        started = time.monotonic()
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self.active -= 1
+            self.total_held += time.monotonic() - started
+            self._semaphore.release()
+
+        return release
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the ``limit`` slots for the body of the ``async with``."""
+        release = await self.acquire()
+        try:
+            yield
+        finally:
+            release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "maxWaiting": self.max_waiting,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "avgHeldMs": self.total_held / self.admitted * 1000 if self.admitted else 0.0,
+        }
+
+
+_executor: Optional[OutlookExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> OutlookExecutor:
+    """Return the process-wide Outlook executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            settings = get_settings()
+            _executor = OutlookExecutor(
+                workers=settings.outlook_workers,
+                max_queue=settings.outlook_queue_size,
+                timeout=settings.outlook_operation_timeout or None,
+                breaker=CircuitBreaker(settings.outlook_breaker_failures, settings.outlook_breaker_reset),
+            )
+        return _executor
+
+
+_gate: Optional[RequestGate] = None
+
+
+def get_request_gate() -> RequestGate:
+    """Return the process-wide :class:`RequestGate`, creating it on first use."""
+    global _gate
+    if _gate is None:
+        settings = get_settings()
+        _gate = RequestGate(settings.outlook_max_requests, settings.outlook_max_waiting_requests)
+    return _gate
+
+
+def shutdown_executor() -> None:
+    """Stop the process-wide executor, if one was started."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
 def get_default_task_folders() -> List[Dict[str, str]]:
     """Get only the default task folders from Outlook.
     
@@ -249,88 +2026,49 @@ def get_default_task_folders() -> List[Dict[str, str]]:
             # Try to get the default Tasks folder from the primary account
             try:
                 default_tasks = namespace.GetDefaultFolder(tasks_folder_const)
+                default_path = default_tasks.FolderPath
                 folders.append({
                     "name": "Default Tasks",
-                    "path": default_tasks.FolderPath
+                    "path": default_path
                 })
-                logger.info(f"Found default Tasks folder: {default_tasks.FolderPath}")
+                logger.info("Found default Tasks folder: %s", default_path)
             except Exception as e:
-                logger.error(f"Error accessing default Tasks folder: {e}")
+                logger.error("Error accessing default Tasks folder: %s", e)
                 
             # Try the specific path
             # Try a specific path from configuration or environment
             try:
-                specific_path = os.getenv("OUTLOOK_TASKS_FOLDER", None)
+                specific_path = get_settings().outlook_tasks_folder
                 if not specific_path or specific_path.lower() == "default":
                     logger.info("No specific tasks folder path provided in configuration; skipping.")
                     raise Exception("No specific tasks folder path provided.")
-                logger.info(f"Looking for specific tasks folder: {specific_path}")
-                
-                # Clean up the path by removing empty parts
-                parts = [p for p in specific_path.split("\\") if p]
+                logger.info("Looking for specific tasks folder: %s", specific_path)
                 
-                # Start with the root folders collection
-                root_folders = namespace.Folders
-                current = None
-                # First level is the mailbox/store name
-                for i in range(root_folders.Count):
-                    folder = root_folders.Item(i+1)  # 1-based index
-                    logger.debug(f"Checking root folder: {folder.Name}")
-                    if folder.Name == parts[0]:
-                        current = folder
-                        logger.debug(f"Found root folder: {folder.Name}")
-                        break
-                
-                if current is not None:
-                    # Navigate through the remaining path
-                    for name in parts[1:]:
-                        found = False
-                        sub_folders = current.Folders
-                        for i in range(sub_folders.Count):
-                            folder = sub_folders.Item(i+1)  # 1-based index
-                            logger.debug(f"Checking subfolder: {folder.Name}")
-                            if folder.Name == name:
-                                current = folder
-                                found = True
-                                logger.debug(f"Found subfolder: {folder.Name}")
-                                break
-                        
-                        if not found:
-                            logger.warning(f"Subfolder not found: {name}")
-                            raise Exception(f"Subfolder not found: {name}")
-                    
-                    # If we got here, we found the folder
-                    folders.append({
-                        "name": "Known Tasks Folder",
-                        "path": specific_path
-                    })
-                    logger.info(f"Found specific Tasks folder: {specific_path}")
-                else:
-                    logger.warning(f"Root folder not found: {parts[0]}")
+                get_folder_index().resolve(namespace, specific_path)
+                folders.append({
+                    "name": "Known Tasks Folder",
+                    "path": specific_path
+                })
+                logger.info("Found specific Tasks folder: %s", specific_path)
             except Exception as e:
-                logger.error(f"Error accessing specific Tasks folder: {e}")
+                logger.error("Error accessing specific Tasks folder: %s", e)
     except Exception as e:
-        logger.error(f"Failed to connect to Outlook: {str(e)}")
+        logger.error("Failed to connect to Outlook: %s", e)
         raise OutlookError(f"Failed to connect to Outlook: {str(e)}")
     
     return folders
 
 
-def load_env_config():
-    """Load environment variables from .env file."""
+def load_env_config() -> Settings:
+    """Load settings from the environment and the nearest .env file."""
     import logging
     logger = logging.getLogger(__name__)
-    # Look for .env in current directory and parent directories
-    dotenv_path = find_dotenv(usecwd=True)
-    if dotenv_path:
-        logger.info(f"Loading environment from: {dotenv_path}")
-        load_dotenv(dotenv_path)
-    else:
-        logger.info("No .env file found. Using default environment variables.")
-    
+    settings = load_settings()
+
     # Log current configuration (without passwords or secrets)
-    logger.info(f"OUTLOOK_TASKS_FOLDER: {os.getenv('OUTLOOK_TASKS_FOLDER', 'Not set')}")
-    logger.info(f"OUTLOOK_PROFILE: {os.getenv('OUTLOOK_PROFILE', 'Not set')}")
+    logger.info("OUTLOOK_TASKS_FOLDER: %s", settings.outlook_tasks_folder or 'Not set')
+    logger.info("OUTLOOK_PROFILE: %s", settings.outlook_profile or 'Not set')
+    return settings
 
 if __name__ == "__main__":
     if platform.system() != "Windows" or not WIN32_AVAILABLE:
@@ -340,10 +2078,10 @@ if __name__ == "__main__":
     
     # Load environment variables from .env file
     print("\nLoading environment configuration...")
-    load_env_config()
+    settings = load_env_config()
 
-    outlook = OutlookTasks(folder_path=os.getenv("OUTLOOK_TASKS_FOLDER"),
-                           profile=os.getenv("OUTLOOK_PROFILE"))
+    outlook = OutlookTasks(folder_path=settings.outlook_tasks_folder,
+                           profile=settings.outlook_profile)
     print("\nListing incomplete tasks:")
     tasks = outlook.list_incomplete_tasks()
     for task in tasks:
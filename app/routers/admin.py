@@ -0,0 +1,59 @@
+"""Administrative routes: inspect and reload the server settings."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import ValidationError
+
+from ..settings import Settings, changed_fields, get_settings, reload_settings
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+# Settings read once at startup; changing them takes a restart.
+RESTART_SETTINGS = (
+    "host",
+    "port",
+    "outlook_workers",
+    "outlook_queue_size",
+    "outlook_max_requests",
+    "outlook_max_waiting_requests",
+    "outlook_operation_timeout",
+    "outlook_breaker_failures",
+    "outlook_breaker_reset",
+    "outlook_session_idle_timeout",
+    "outlook_session_health_interval",
+    "outlook_settings_watch_interval",
+    "outlook_mirror",
+    "outlook_mirror_path",
+    "outlook_mirror_reconcile_interval",
+    "outlook_fake_tasks",
+    "outlook_fake_latency",
+)
+
+
+@router.get("/settings")
+async def read_settings(settings: Settings = Depends(get_settings)) -> Dict[str, Any]:
+    """Settings currently in effect."""
+    return settings.model_dump()
+
+
+@router.post("/settings:reload")
+async def reload(settings: Settings = Depends(get_settings)) -> Dict[str, Any]:
+    """Re-read the environment and ``.env`` file and apply what changed.
+
+    Outlook folder, profile and listing engine changes make the COM workers
+    reconnect; cache TTL and logging changes apply at once. ``restartRequired``
+    lists changed settings that only take effect after a restart.
+    """
+    try:
+        new = reload_settings()
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid settings: {e}") from e
+    changed = changed_fields(settings, new)
+    return {
+        "changed": changed,
+        "restartRequired": [name for name in changed if name in RESTART_SETTINGS],
+        "settings": new.model_dump(),
+    }
@@ -0,0 +1,14 @@
+"""Prometheus scrape endpoint."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Route, Outlook operation and COM call latencies, queue depth and cache hit ratios."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
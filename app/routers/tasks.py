@@ -2,15 +2,98 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import math
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
 
-from ..outlook import OutlookError, get_tasks_client
+from ..cache import get_detail_cache, get_task_cache
+from ..mirror import TaskMirror, get_mirror
+from ..outlook import (
+    IMPORTANCES,
+    SORT_PROPERTIES,
+    SYNC_TASK_FIELDS,
+    TASK_FIELDS,
+    TASK_STATUSES,
+    OutlookBusyError,
+    OutlookError,
+    OutlookFilterError,
+    OutlookNotFoundError,
+    OutlookTimeoutError,
+    TaskOrder,
+    TaskQuery,
+    TaskReader,
+    decode_cursor,
+    encode_cursor,
+    format_item_key,
+    get_executor,
+    get_request_gate,
+    parse_item_key,
+)
+from ..settings import Settings, get_settings
+from ..sync import SyncToken, get_change_log
 
-router = APIRouter()
+# Reads the task mirror answers; they skip the request gate while it does.
+# GET /tasks/{entry_id} falls back to Outlook for tasks the mirror lacks and
+# takes a slot itself for that.
+MIRROR_READS = {"/tasks", "/tasks/count", "/tasks/{entry_id}"}
+
+
+async def outlook_slot(request: Request, settings: Settings = Depends(get_settings)) -> AsyncIterator[None]:
+    """Dependency holding a :class:`~app.outlook.RequestGate` slot while the route runs.
+
+    Requests over the gate's limits get ``503`` with ``Retry-After``.
+    Search and reads served from the mirror never wait on Outlook and pass
+    straight through. A streamed response takes the slot over with
+    :func:`_keep_slot` and gives it back after its last line.
+    """
+    path = getattr(request.scope.get("route"), "path", None)
+    if path == "/tasks/search" or (path in MIRROR_READS and _read_mirror(settings) is not None):
+        yield
+        return
+    try:
+        release = await get_request_gate().acquire()
+    except OutlookBusyError as exc:
+        raise _to_http(exc) from exc
+    request.state.release_slot = release
+    try:
+        yield
+    finally:
+        release = request.state.release_slot
+        if release is not None:
+            release()
+
+
+def _keep_slot(request: Request, body: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Hand the request's gate slot, if it has one, to a streamed ``body``.
+
+    Depending on the FastAPI version, a dependency's exit code runs before
+    or after a streamed body is sent, so the body releases the slot itself.
+    """
+    release = getattr(request.state, "release_slot", None)
+    request.state.release_slot = None
+
+    async def stream() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in body:
+                yield chunk
+        finally:
+            if release is not None:
+                release()
+
+    return stream()
+
+
+router = APIRouter(dependencies=[Depends(outlook_slot)])
+
+NDJSON = "application/x-ndjson"
+MAX_BATCH = 1000
 
 
 class TaskCreate(BaseModel):
@@ -19,40 +102,500 @@ class TaskCreate(BaseModel):
     body: Optional[str] = None
 
 
+class TaskSelection(BaseModel):
+    """Tasks to act on: an explicit ``entryIds`` list or a Restrict ``filter``."""
+
+    entryIds: Optional[List[str]] = Field(
+        None, min_length=1, max_length=MAX_BATCH, description="EntryIDs or EntryID:StoreID item keys."
+    )
+    filter: Optional[str] = None
+    stopOnError: bool = False
+
+
+def _to_http(exc: OutlookError) -> HTTPException:
+    if isinstance(exc, OutlookBusyError):
+        # Whole seconds, at least one, as HTTP wants.
+        retry_after = str(max(1, math.ceil(exc.retry_after)))
+        return HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": retry_after})
+    if isinstance(exc, OutlookFilterError):
+        return HTTPException(status_code=400, detail=str(exc))
+    if isinstance(exc, OutlookNotFoundError):
+        return HTTPException(status_code=404, detail=str(exc))
+    if isinstance(exc, OutlookTimeoutError):
+        return HTTPException(status_code=504, detail=str(exc))
+    return HTTPException(status_code=501, detail=str(exc))
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body, usedforsecurity=False).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _json_with_etag(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """JSON response carrying an ETag; 304 without a body if the client has it."""
+    etag = etag or _etag(body)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+def task_query(
+    due_before: Optional[datetime] = Query(None, alias="dueBefore", description="Only tasks due before this time."),
+    due_after: Optional[datetime] = Query(None, alias="dueAfter", description="Only tasks due after this time."),
+    status: Optional[str] = Query(
+        None, description="Comma separated statuses to include: notStarted,inProgress,waiting,deferred."
+    ),
+    category: Optional[str] = Query(None, description="Only tasks in this category."),
+    importance: Optional[str] = Query(None, description="Only tasks of this importance: low, normal or high."),
+    subject_contains: Optional[str] = Query(
+        None, alias="subjectContains", min_length=1, description="Only tasks whose subject contains this text."
+    ),
+    owner: Optional[str] = Query(None, description="Only tasks owned by this user."),
+) -> Optional[TaskQuery]:
+    """Dependency turning the task filter parameters into a :class:`TaskQuery`."""
+    statuses = [name.strip() for name in status.split(",") if name.strip()] if status else []
+    unknown = [name for name in statuses if name not in TASK_STATUSES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown status: {', '.join(unknown)}")
+    if importance is not None and importance not in IMPORTANCES:
+        raise HTTPException(status_code=400, detail=f"Unknown importance: {importance}")
+    query = TaskQuery(
+        due_before=due_before,
+        due_after=due_after,
+        statuses=tuple(sorted({TASK_STATUSES[name] for name in statuses})),
+        category=category,
+        importance=IMPORTANCES[importance] if importance is not None else None,
+        subject_contains=subject_contains,
+        owner=owner,
+    )
+    return query if query.restriction() is not None else None
+
+
+def _task_order(sort: Optional[str]) -> Optional[TaskOrder]:
+    if not sort:
+        return None
+    field = sort.removeprefix("-")
+    if field not in SORT_PROPERTIES:
+        raise HTTPException(status_code=400, detail=f"Unknown sort field: {field}")
+    return field, sort.startswith("-")
+
+
+async def _ndjson(tasks: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    async for task in tasks:
+        yield (json.dumps(jsonable_encoder(task)) + "\n").encode()
+
+
+async def _aiter(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+def _read_mirror(settings: Settings) -> Optional[TaskMirror]:
+    """The mirror to answer reads from, or None to read Outlook.
+
+    Reads go to Outlook with ``OUTLOOK_CONSISTENCY=strict`` and until the
+    mirror's first scan has finished.
+    """
+    if settings.outlook_consistency != "mirror":
+        return None
+    mirror = get_mirror()
+    return mirror if mirror is not None and mirror.ready else None
+
+
+async def _read(mirror: Optional[TaskMirror], operation: Callable[[TaskReader], Any]) -> Any:
+    """Run a read ``operation`` against the mirror if given, else as an Outlook job."""
+    if mirror is not None:
+        return operation(mirror)
+    return await get_executor().run(operation)
+
+
+def _discard_from_mirror(entry_id: str) -> None:
+    mirror = get_mirror()
+    if mirror is not None:
+        mirror.discard([entry_id])
+
+
 @router.get("/tasks")
-def list_tasks():
+async def list_tasks(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Return one page of at most this many tasks."),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page."),
+    fields: Optional[str] = Query(
+        None, description="Comma separated subset of entryId,itemKey,subject,dueDate,status,body,lastModified to return."
+    ),
+    body_preview: Optional[int] = Query(
+        None, alias="bodyPreview", ge=1, le=65536, description="Add a bodyPreview of at most this many bytes."
+    ),
+    stream: bool = Query(False, description="Stream tasks as NDJSON, one per line, as they are read."),
+    query: Optional[TaskQuery] = Depends(task_query),
+    sort: Optional[str] = Query(
+        None,
+        description="Order by dueDate, startDate, importance, lastModified or subject; prefix - for descending.",
+    ),
+    settings: Settings = Depends(get_settings),
+):
+    """List incomplete tasks.
+
+    Without ``limit`` all tasks are returned as an array. With ``limit`` the
+    tasks are ordered by due date and returned as
+    ``{"tasks": [...], "nextCursor": ...}``; pass ``nextCursor`` back as
+    ``cursor`` to fetch the following page. ``fields`` limits which
+    properties are read from Outlook; bodies are the slowest to read.
+    With ``?stream=1`` or ``Accept: application/x-ndjson`` tasks are
+    streamed one JSON object per line while the folder is still being read.
+
+    Responses carry an ``ETag``; a request whose ``If-None-Match`` matches
+    gets ``304 Not Modified``. While the cached listing is known to be
+    current this is answered without touching Outlook.
+
+    ``dueBefore``, ``dueAfter``, ``status``, ``category``, ``importance``,
+    ``subjectContains`` and ``owner`` narrow the listing; Outlook applies
+    them all as one restriction, so non-matching tasks are never read.
+
+    ``sort`` has Outlook order the tasks before they are read. Pages in any
+    order other than ``dueDate`` hold the top ``limit`` tasks and have no
+    ``nextCursor``; only the first ``limit`` rows are read.
+
+    With the task mirror on and ``OUTLOOK_CONSISTENCY=mirror``, tasks are
+    read from the local mirror instead of Outlook.
+    """
+    order = _task_order(sort)
+    mirror = _read_mirror(settings)
+    selected = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    if selected:
+        unknown = [field for field in selected if field not in TASK_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    if stream or NDJSON in request.headers.get("accept", ""):
+        if limit is not None:
+            raise HTTPException(status_code=400, detail="stream cannot be combined with limit")
+        try:
+            if mirror is not None:
+                tasks = _aiter(mirror.iter_incomplete_tasks(selected, body_preview, query, order))
+            else:
+                tasks = get_executor().stream(
+                    lambda client: client.iter_incomplete_tasks(selected, body_preview, query, order)
+                )
+        except OutlookError as exc:
+            raise _to_http(exc) from exc
+        return StreamingResponse(_keep_slot(request, _ndjson(tasks)), media_type=NDJSON)
+    keyset = order is None or order == ("dueDate", False)
+    after = None
+    if cursor is not None:
+        if limit is None:
+            raise HTTPException(status_code=400, detail="cursor requires limit")
+        if not keyset:
+            raise HTTPException(status_code=400, detail="cursor requires the default dueDate order")
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    try:
+        if limit is None and mirror is not None:
+            tasks = mirror.list_incomplete_tasks(selected, body_preview, query, order)
+            return _json_with_etag(request, JSONResponse(jsonable_encoder(tasks)).body)
+        if limit is None:
+            snapshot = await get_task_cache().list_tasks(get_executor(), selected, body_preview, query, order)
+            if snapshot.body is None:
+                snapshot.body = JSONResponse(jsonable_encoder(snapshot.tasks)).body
+                snapshot.etag = _etag(snapshot.body)
+            return _json_with_etag(request, snapshot.body, snapshot.etag)
+        if keyset:
+            tasks, next_key = await _read(
+                mirror, lambda client: client.list_incomplete_task_page(limit, after, selected, body_preview, query)
+            )
+        else:
+            tasks = await _read(
+                mirror, lambda client: client.list_incomplete_tasks(selected, body_preview, query, order, limit)
+            )
+            next_key = None
+        page = {"tasks": tasks, "nextCursor": encode_cursor(next_key) if next_key else None}
+        return _json_with_etag(request, JSONResponse(jsonable_encoder(page)).body)
+    except OutlookError as exc:
+        raise _to_http(exc) from exc
+
+
+@router.get("/tasks/count")
+async def count_tasks(
+    query: Optional[TaskQuery] = Depends(task_query), settings: Settings = Depends(get_settings)
+):
+    """Number of incomplete tasks matching the same filters as ``GET /tasks``.
+
+    Outlook counts the restricted rows without opening any item, and the
+    count is cached until the folder changes. With the mirror in use the
+    count comes from it.
+    """
+    mirror = _read_mirror(settings)
+    try:
+        if mirror is not None:
+            return {"count": mirror.count_incomplete_tasks(query)}
+        return {"count": await get_task_cache().count_tasks(get_executor(), query)}
+    except OutlookError as exc:
+        raise _to_http(exc) from exc
+
+
+@router.get("/tasks/changes")
+async def list_task_changes(
+    since: Optional[str] = Query(None, description="nextToken from the previous call; omit for a full sync."),
+):
+    """Changes to incomplete tasks since a previous call, for keeping a mirror current.
+
+    Returns ``changed`` (added or modified incomplete tasks), ``completed``
+    and ``deleted`` (entry IDs to drop) and ``nextToken`` for the next call.
+    When ``full`` is true, ``changed`` holds every incomplete task and the
+    mirror should be replaced; this happens on the first call, after a
+    server restart and after deletions the server could not identify.
+    Tasks modified exactly at the previous watermark are sent again, so
+    applying ``changed`` must be an upsert.
+    """
+    token = None
+    if since is not None:
+        try:
+            token = SyncToken.decode(since)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log = get_change_log()
+
+    def job(client: Any) -> dict:
+        # Read the log on the worker, after any reconnect has been logged.
+        deleted, full, sequence = log.deleted_since(token)
+        if full or token is None or token.watermark is None:
+            changed = client.list_incomplete_tasks(SYNC_TASK_FIELDS)
+            completed: list = []
+            full, deleted = True, []
+        else:
+            changed, completed = client.list_changed_tasks(token.watermark)
+        stamps = [task["lastModified"] for task in changed + completed]
+        if token is not None and token.watermark is not None and not full:
+            stamps.append(token.watermark)
+        watermark = max(stamps, default=None)
+        return {
+            "full": full,
+            "changed": changed,
+            "completed": [task["entryId"] for task in completed],
+            "deleted": deleted,
+            "nextToken": SyncToken(watermark, sequence, log.epoch).encode(),
+        }
+
     try:
-        client = get_tasks_client()
-        return client.list_incomplete_tasks()
+        return await get_executor().run(job)
     except OutlookError as exc:
-        raise HTTPException(status_code=501, detail=str(exc)) from exc
+        raise _to_http(exc) from exc
+
+
+@router.get("/tasks/search")
+async def search_tasks(
+    q: str = Query(..., min_length=1, description="Words that must all occur; end a word with * to match a prefix."),
+    limit: int = Query(20, ge=1, le=1000, description="Return at most this many matches."),
+):
+    """Full-text search over the subject, body and categories of incomplete tasks.
+
+    Answered from the task mirror's index without touching Outlook; returns
+    matches best first as ``{"results": [{"entryId", "itemKey", "subject", "score"}]}``.
+    Needs ``OUTLOOK_MIRROR=true``.
+    """
+    mirror = get_mirror()
+    if mirror is None:
+        raise HTTPException(status_code=501, detail="Search needs the task mirror; set OUTLOOK_MIRROR=true")
+    if not mirror.ready:
+        raise HTTPException(status_code=503, detail="The task mirror is still being built")
+    return {"results": mirror.search(q, limit)}
+
+
+@router.get("/tasks/{entry_id}")
+async def get_task(
+    request: Request,
+    entry_id: str,
+    body: bool = Query(True, description="Include the task body; it is read only when asked for."),
+    settings: Settings = Depends(get_settings),
+):
+    """One task with all its properties; ``entry_id`` may be an EntryID or an item key.
+
+    Recently read tasks are served from memory until Outlook reports a
+    change to them. With the mirror in use, incomplete tasks come from it;
+    completed ones are still read from Outlook.
+    """
+    entry_id = parse_item_key(entry_id)
+    mirror = _read_mirror(settings)
+    try:
+        if mirror is None:
+            task = await get_detail_cache().get_task(get_executor(), entry_id, body)
+        else:
+            try:
+                return _json_with_etag(request, JSONResponse(jsonable_encoder(mirror.get_task(entry_id, body))).body)
+            except OutlookNotFoundError:
+                pass
+            # The gate let this request through for the mirror; Outlook needs a slot.
+            async with get_request_gate().slot():
+                task = await get_detail_cache().get_task(get_executor(), entry_id, body)
+    except OutlookError as exc:
+        raise _to_http(exc) from exc
+    return _json_with_etag(request, JSONResponse(jsonable_encoder(task)).body)
 
 
 @router.post("/tasks")
-def create_task(task: TaskCreate):
+async def create_task(task: TaskCreate):
+    def job(client: Any) -> dict:
+        entry_id = get_task_cache().add_task(client, task.subject, task.dueDate, task.body)
+        return {"entryId": entry_id, "itemKey": format_item_key(entry_id, client.store_id)}
+
+    try:
+        created = await get_executor().run(job)
+    except OutlookError as exc:
+        raise _to_http(exc) from exc
+    mirror = get_mirror()
+    if mirror is not None:
+        mirror.record_added(created["entryId"], task.subject, task.dueDate, task.body)
+    return created
+
+
+@router.post("/tasks:batch")
+async def create_tasks(tasks: List[TaskCreate] = Body(..., min_length=1, max_length=MAX_BATCH)):
+    """Add several tasks in one Outlook job.
+
+    Returns one result per task, in request order: ``{"entryId", "itemKey"}``
+    when it was created, ``{"error": ...}`` when it was not. One failure
+    does not stop the rest of the batch.
+    """
+
+    def job(client: Any) -> List[dict]:
+        results = get_task_cache().add_tasks(client, [(task.subject, task.dueDate, task.body) for task in tasks])
+        return [
+            {"error": str(result)}
+            if isinstance(result, Exception)
+            else {"entryId": result, "itemKey": format_item_key(result, client.store_id)}
+            for result in results
+        ]
+
+    try:
+        items = await get_executor().run(job)
+    except OutlookError as exc:
+        raise _to_http(exc) from exc
+    mirror = get_mirror()
+    if mirror is not None:
+        for task, item in zip(tasks, items):
+            if "entryId" in item:
+                mirror.record_added(item["entryId"], task.subject, task.dueDate, task.body)
+    return {
+        "results": items,
+        "created": sum("entryId" in item for item in items),
+        "failed": sum("error" in item for item in items),
+    }
+
+
+async def _apply_to_selection(
+    selection: TaskSelection, include_completed: bool, operation: Callable[[Any, List[str]], List[Any]], done: str
+) -> dict:
+    """Resolve ``selection`` and run ``operation`` on it in one Outlook job."""
+    if (selection.entryIds is None) == (selection.filter is None):
+        raise HTTPException(status_code=400, detail="Pass exactly one of entryIds and filter")
+
+    keys = [parse_item_key(key) for key in selection.entryIds] if selection.entryIds is not None else None
+
+    def job(client: Any) -> Tuple[List[str], List[Any]]:
+        entry_ids = keys
+        if entry_ids is None:
+            entry_ids = client.find_task_ids(selection.filter, include_completed)
+        try:
+            return entry_ids, operation(client, entry_ids)
+        finally:
+            get_detail_cache().discard(entry_ids)
+
     try:
-        client = get_tasks_client()
-        entry_id = client.add_task(task.subject, task.dueDate, task.body)
-        return {"entryId": entry_id}
+        entry_ids, results = await get_executor().run(job)
     except OutlookError as exc:
-        raise HTTPException(status_code=501, detail=str(exc)) from exc
+        raise _to_http(exc) from exc
+    mirror = get_mirror()
+    if mirror is not None:
+        mirror.discard(entry_id for entry_id, result in zip(entry_ids, results) if result is None)
+    items = []
+    for index, entry_id in enumerate(entry_ids):
+        if index >= len(results):
+            items.append({"entryId": entry_id, "status": "skipped"})
+        elif results[index] is None:
+            items.append({"entryId": entry_id, "status": done})
+        else:
+            items.append({"entryId": entry_id, "status": "failed", "error": str(results[index])})
+    counts = {status: sum(item["status"] == status for item in items) for status in (done, "failed", "skipped")}
+    return {"results": items, **counts}
+
+
+@router.post("/tasks:complete")
+async def complete_tasks(selection: TaskSelection):
+    """Mark several tasks complete in one Outlook job.
+
+    Select tasks by ``entryIds`` or by a Jet/DASL ``filter`` applied to the
+    incomplete tasks of the folder. Each task gets a ``status`` of
+    ``completed`` or ``failed`` (with ``error``); failures do not stop the
+    rest unless ``stopOnError`` is set, which marks the remaining tasks
+    ``skipped``.
+    """
+    return await _apply_to_selection(
+        selection,
+        False,
+        lambda client, entry_ids: get_task_cache().complete_tasks(client, entry_ids, selection.stopOnError),
+        "completed",
+    )
+
+
+@router.post("/tasks:delete")
+async def delete_tasks(selection: TaskSelection):
+    """Permanently delete several tasks in one Outlook job.
+
+    Works as ``POST /tasks:complete``, except that a ``filter`` also
+    matches completed tasks.
+    """
+
+    def delete(client: Any, entry_ids: List[str]) -> List[Optional[Exception]]:
+        with get_change_log().tracking_deletes(entry_ids) as deleted:
+            results = get_task_cache().delete_tasks(client, entry_ids, selection.stopOnError)
+            deleted.extend(entry_id for entry_id, result in zip(entry_ids, results) if result is None)
+        return results
+
+    return await _apply_to_selection(selection, True, delete, "deleted")
 
 
 @router.post("/tasks/{entry_id}/complete")
-def complete_task(entry_id: str):
+async def complete_task(entry_id: str):
+    """Mark a task complete; ``entry_id`` may be an EntryID or an ``EntryID:StoreID`` item key."""
+    entry_id = parse_item_key(entry_id)
+
+    def job(client: Any) -> None:
+        try:
+            get_task_cache().complete_task(client, entry_id)
+        finally:
+            get_detail_cache().discard([entry_id])
+
     try:
-        client = get_tasks_client()
-        client.complete_task(entry_id)
-        return {"status": "completed"}
+        await get_executor().run(job)
     except OutlookError as exc:
-        raise HTTPException(status_code=501, detail=str(exc)) from exc
+        raise _to_http(exc) from exc
+    _discard_from_mirror(entry_id)
+    return {"status": "completed"}
 
 
 @router.delete("/tasks/{entry_id}")
-def delete_task(entry_id: str):
+async def delete_task(entry_id: str):
+    """Delete a task; ``entry_id`` may be an EntryID or an ``EntryID:StoreID`` item key."""
+    entry_id = parse_item_key(entry_id)
+
+    def job(client: Any) -> None:
+        try:
+            with get_change_log().tracking_delete(entry_id):
+                get_task_cache().delete_task(client, entry_id)
+        finally:
+            get_detail_cache().discard([entry_id])
+
     try:
-        client = get_tasks_client()
-        client.delete_task(entry_id)
-        return {"status": "deleted"}
+        await get_executor().run(job)
     except OutlookError as exc:
-        raise HTTPException(status_code=501, detail=str(exc)) from exc
+        raise _to_http(exc) from exc
+    _discard_from_mirror(entry_id)
+    return {"status": "deleted"}
+
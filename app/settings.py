@@ -0,0 +1,186 @@
+"""Typed server settings, read from the environment and ``.env`` once.
+
+:func:`load_settings` is called by :func:`app.main.create_app`; afterwards
+:func:`get_settings` returns the loaded object without touching the disk.
+Settings change only through :func:`reload_settings`, called by the
+``POST /admin/settings:reload`` route or by :class:`SettingsWatcher` when
+the ``.env`` file changes. Modules that keep derived state register a
+callback with :func:`add_reload_listener`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Callable, List, Literal, Optional
+
+from dotenv import find_dotenv
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+logger = logging.getLogger(__name__)
+
+
+class Settings(BaseSettings):
+    """Server configuration; each field is read from the upper-case env variable."""
+
+    model_config = SettingsConfigDict(extra="ignore", env_ignore_empty=True, frozen=True)
+
+    host: str = "localhost"
+    port: int = 8124
+    log_level: Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"] = "INFO"
+    log_format: Literal["text", "json"] = "text"
+
+    # "com" talks to Outlook; "fake" to the in-process fake (app.fake_outlook),
+    # seeded with outlook_fake_tasks tasks, each COM call taking outlook_fake_latency seconds.
+    outlook_backend: Literal["com", "fake"] = "com"
+    outlook_fake_tasks: int = Field(0, ge=0)
+    outlook_fake_latency: float = Field(0.0, ge=0)
+    outlook_tasks_folder: Optional[str] = None
+    outlook_profile: Optional[str] = None
+    outlook_list_engine: Literal["table", "items"] = "table"
+    outlook_session_idle_timeout: float = Field(300.0, ge=0)
+    outlook_session_health_interval: float = Field(30.0, ge=0)
+    outlook_cache_ttl: float = Field(60.0, ge=0)
+    outlook_workers: int = Field(1, ge=1)
+    outlook_queue_size: int = Field(100, ge=1)
+    # Requests working against Outlook at once, and how many more may wait;
+    # the rest get 503 with Retry-After.
+    outlook_max_requests: int = Field(32, ge=1)
+    outlook_max_waiting_requests: int = Field(100, ge=0)
+    # Seconds to wait for an Outlook operation (0 waits forever), and the circuit
+    # breaker: consecutive failures that open it, seconds before it probes again.
+    outlook_operation_timeout: float = Field(30.0, ge=0)
+    outlook_breaker_failures: int = Field(5, ge=1)
+    outlook_breaker_reset: float = Field(30.0, gt=0)
+    # Seconds between checks of the .env file for changes; 0 disables the watch.
+    outlook_settings_watch_interval: float = Field(5.0, ge=0)
+
+    # Local SQLite mirror of the incomplete tasks (app.mirror).
+    outlook_mirror: bool = False
+    outlook_mirror_path: str = ":memory:"
+    outlook_mirror_reconcile_interval: float = Field(300.0, gt=0)
+    # With the mirror on: serve reads from it ("mirror") or from Outlook ("strict").
+    outlook_consistency: Literal["strict", "mirror"] = "mirror"
+
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def _upper_case_level(cls, value: object) -> object:
+        return value.upper() if isinstance(value, str) else value
+
+
+ReloadListener = Callable[[Settings, Settings], None]
+
+_settings: Optional[Settings] = None
+_env_file: Optional[str] = None
+_settings_lock = threading.Lock()
+_reload_listeners: List[ReloadListener] = []
+
+
+def load_settings(env_file: Optional[str] = None) -> Settings:
+    """Read settings from the environment and ``env_file``, or the nearest ``.env``.
+
+    The file is located once, falling back to ``.env`` in the working
+    directory so one created later is picked up; reloads read the same
+    path. Variables set in the environment take precedence over the file.
+    """
+    global _settings, _env_file
+    with _settings_lock:
+        _env_file = env_file or find_dotenv(usecwd=True) or os.path.join(os.getcwd(), ".env")
+        _settings = Settings(_env_file=_env_file)
+        logger.debug("Loaded settings from %s", _env_file)
+        return _settings
+
+
+def get_settings() -> Settings:
+    """Return the current settings, loading them on first use.
+
+    Also usable as a FastAPI dependency.
+    """
+    settings = _settings
+    return settings if settings is not None else load_settings()
+
+
+def settings_file() -> Optional[str]:
+    """Path of the ``.env`` file settings are read from; it need not exist."""
+    return _env_file
+
+
+def reload_settings() -> Settings:
+    """Re-read the settings and tell the reload listeners what changed.
+
+    Raises :class:`pydantic.ValidationError` and keeps the current settings
+    if the new values are invalid.
+    """
+    global _settings
+    with _settings_lock:
+        old = _settings if _settings is not None else Settings(_env_file=_env_file)
+        new = Settings(_env_file=_env_file)
+        _settings = new
+    if new != old:
+        logger.info("Settings reloaded; changed: %s", ", ".join(changed_fields(old, new)))
+        for listener in list(_reload_listeners):
+            try:
+                listener(old, new)
+            except Exception as e:  # noqa: BLE001
+                logger.error("Settings reload listener failed: %s", e, exc_info=True)
+    return new
+
+
+def changed_fields(old: Settings, new: Settings) -> List[str]:
+    return [name for name in Settings.model_fields if getattr(old, name) != getattr(new, name)]
+
+
+def add_reload_listener(listener: ReloadListener) -> None:
+    """Call ``listener(old, new)`` after each reload that changed a setting."""
+    if listener not in _reload_listeners:
+        _reload_listeners.append(listener)
+
+
+def remove_reload_listener(listener: ReloadListener) -> None:
+    if listener in _reload_listeners:
+        _reload_listeners.remove(listener)
+
+
+class SettingsWatcher:
+    """Polls the ``.env`` file's modification time and reloads settings when it changes.
+
+    A poll is one ``stat`` call, so the default interval of a few seconds
+    costs nothing measurable. Invalid files are logged and ignored.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._path = settings_file() or os.path.join(os.getcwd(), ".env")
+        self._mtime = self._read_mtime()
+
+    def _read_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self._path).st_mtime
+        except OSError:
+            return None
+
+    def start(self) -> None:
+        if self.interval and self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="settings-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            mtime = self._read_mtime()
+            if mtime == self._mtime:
+                continue
+            self._mtime = mtime
+            try:
+                reload_settings()
+            except Exception as e:  # noqa: BLE001
+                logger.error("Ignoring invalid settings in %s: %s", self._path, e)
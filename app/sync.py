@@ -0,0 +1,130 @@
+"""Change tracking for incremental sync (``GET /tasks/changes``)."""
+
+from __future__ import annotations
+
+import base64
+import json
+import threading
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Iterator, List, Optional, Sequence, Tuple
+
+from .outlook import PendingEvents, add_change_listener
+
+
+@dataclass
+class SyncToken:
+    """Where a client's mirror is up to.
+
+    ``watermark`` is the newest ``LastModificationTime`` the client has
+    seen, ``sequence`` the last tombstone it received and ``epoch``
+    identifies the server process that issued the token, since tombstones
+    are only kept in memory.
+    """
+
+    watermark: Optional[datetime]
+    sequence: int
+    epoch: str
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            {"w": self.watermark.isoformat() if self.watermark else None, "s": self.sequence, "e": self.epoch}
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncToken":
+        """Parse a token from :meth:`encode`; raises ValueError if invalid."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            watermark = datetime.fromisoformat(payload["w"]) if payload["w"] else None
+            return cls(watermark, int(payload["s"]), str(payload["e"]))
+        except Exception as e:  # noqa: BLE001
+            raise ValueError(f"Invalid sync token: {token}") from e
+
+
+class ChangeLog:
+    """Bounded in-memory log of deletions made through this server.
+
+    Outlook's ``ItemRemove`` event does not say which item went away, so
+    deletions made elsewhere cannot be turned into tombstones. Each one is
+    logged as a resync marker instead, telling clients that saw it to
+    re-read the whole folder. Reconnects log a marker too, as events may
+    have been missed meanwhile.
+    """
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self.epoch = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._entries: Deque[Tuple[int, Optional[str]]] = deque(maxlen=max_entries)
+        self._sequence = 0
+        self._pending_removes = PendingEvents()
+
+    def _append(self, entry_id: Optional[str]) -> None:
+        self._sequence += 1
+        self._entries.append((self._sequence, entry_id))
+
+    @contextmanager
+    def tracking_delete(self, entry_id: str) -> Iterator[None]:
+        """Wrap a deletion so it is logged and its ``ItemRemove`` event recognized."""
+        with self.tracking_deletes([entry_id]) as deleted:
+            yield
+            deleted.append(entry_id)
+
+    @contextmanager
+    def tracking_deletes(self, entry_ids: Sequence[str]) -> Iterator[List[str]]:
+        """Wrap a batch of deletions; add the IDs actually deleted to the yielded list."""
+        deleted: List[str] = []
+        with self._lock:
+            self._pending_removes.expect(len(entry_ids))
+        try:
+            yield deleted
+        finally:
+            with self._lock:
+                self._pending_removes.cancel(len(entry_ids) - len(deleted))
+                for entry_id in deleted:
+                    self._append(entry_id)
+
+    def on_change(self, kind: str, item: Any) -> None:
+        """Change listener for :func:`app.outlook.add_change_listener`."""
+        if kind not in ("remove", "reset"):
+            return
+        with self._lock:
+            if kind == "remove" and self._pending_removes.consume():
+                return
+            self._append(None)
+
+    def deleted_since(self, token: Optional[SyncToken]) -> Tuple[List[str], bool, int]:
+        """Entry IDs deleted after ``token``, whether a full resync is needed, and the current sequence."""
+        with self._lock:
+            if token is None or token.epoch != self.epoch:
+                return [], True, self._sequence
+            oldest = self._entries[0][0] if self._entries else self._sequence + 1
+            if token.sequence + 1 < oldest and token.sequence < self._sequence:
+                # Entries the client has not seen were evicted.
+                return [], True, self._sequence
+            deleted = []
+            for sequence, entry_id in self._entries:
+                if sequence <= token.sequence:
+                    continue
+                if entry_id is None:
+                    return [], True, self._sequence
+                deleted.append(entry_id)
+            return deleted, False, self._sequence
+
+
+_change_log: Optional[ChangeLog] = None
+_change_log_lock = threading.Lock()
+
+
+def get_change_log() -> ChangeLog:
+    """Return the process-wide change log, subscribing it to folder events."""
+    global _change_log
+    with _change_log_lock:
+        if _change_log is None:
+            _change_log = ChangeLog()
+            add_change_listener(_change_log.on_change)
+        return _change_log
@@ -0,0 +1 @@
+"""Benchmarks that run against the fake Outlook object model."""
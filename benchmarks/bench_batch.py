@@ -0,0 +1,60 @@
+"""Compare sequential POST /tasks with one POST /tasks:batch against the fake Outlook.
+
+    python -m benchmarks.bench_batch --tasks 300 --latency 0.0002
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from fastapi.testclient import TestClient
+
+import app.outlook as outlook_module
+from app.fake_outlook import FakeOutlook
+from app.main import create_app
+from app.outlook import OutlookExecutor, OutlookSession, OutlookTasks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.0002, help="seconds per simulated COM call")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    outlook = FakeOutlook(latency=args.latency)
+    outlook_module._executor = OutlookExecutor(
+        session_factory=lambda: OutlookSession(lambda: OutlookTasks(application=outlook.Application()))
+    )
+    payload = [{"subject": f"Action item {i}", "body": "From the meeting notes"} for i in range(args.tasks)]
+
+    with TestClient(create_app()) as client:
+        client.get("/tasks", params={"limit": 1})  # connect before timing
+
+        def measure(label: str, call) -> None:
+            outlook.reset_calls()
+            start = time.perf_counter()
+            call()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<10} {elapsed * 1000:9.1f} ms  {args.tasks / elapsed:8.0f} tasks/s"
+                f"  {outlook.calls / args.tasks:6.2f} COM calls/task"
+            )
+
+        def sequential() -> None:
+            for task in payload:
+                client.post("/tasks", json=task).raise_for_status()
+
+        def batch() -> None:
+            response = client.post("/tasks:batch", json=payload)
+            response.raise_for_status()
+            assert response.json()["created"] == args.tasks
+
+        measure("sequential", sequential)
+        measure("batch", batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare the Table and Items listing engines against the fake Outlook.
+
+    python -m benchmarks.bench_listing --tasks 2000 --latency 0.0001
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from app.fake_outlook import FakeOutlook
+from app.outlook import LIST_ENGINES, OutlookTasks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.0001, help="seconds per simulated COM call")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    outlook = FakeOutlook(latency=args.latency)
+    outlook.seed_tasks(args.tasks)
+    application = outlook.Application()
+
+    for engine in LIST_ENGINES:
+        client = OutlookTasks(application=application, list_engine=engine)
+        best = float("inf")
+        for _ in range(args.repeat):
+            outlook.reset_calls()
+            start = time.perf_counter()
+            tasks = client.list_incomplete_tasks()
+            best = min(best, time.perf_counter() - start)
+        print(
+            f"{engine:<6} {best * 1000:9.1f} ms  {len(tasks):6d} tasks"
+            f"  {outlook.calls / max(len(tasks), 1):6.2f} COM calls/task"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare connect and listing cost with logging at INFO and at DEBUG.
+
+At INFO nothing is formatted for debug messages and COM properties read
+only to be logged are skipped. Log output goes to an in-memory stream, so
+the timings include formatting but not terminal I/O::
+
+    python -m benchmarks.bench_logging --requests 200 --latency 0.0002
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import time
+
+from app.fake_outlook import FakeOutlook
+from app.logging_config import configure_logging
+from app.outlook import OutlookTasks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0002, help="seconds per simulated COM call")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args()
+
+    outlook = FakeOutlook(latency=args.latency)
+    outlook.seed_tasks(args.tasks)
+
+    for level in ("INFO", "DEBUG"):
+        configure_logging(level, args.format)
+        stream = io.StringIO()
+        logging.getLogger().handlers[0].setStream(stream)
+
+        outlook.reset_calls()
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            OutlookTasks(application=outlook.Application())
+        connect = time.perf_counter() - start
+        connect_calls = outlook.calls
+
+        client = OutlookTasks(application=outlook.Application())
+        outlook.reset_calls()
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            client.list_incomplete_tasks(fields=("entryId", "subject", "body"))
+        listing = time.perf_counter() - start
+        print(
+            f"{level:<6} connect {connect / args.requests * 1000:7.3f} ms"
+            f" ({connect_calls / args.requests:5.1f} COM calls)"
+            f"  list {listing / args.requests * 1000:7.3f} ms"
+            f" ({outlook.calls / args.requests:7.1f} COM calls)"
+            f"  {stream.getvalue().count(chr(10)):6d} log lines"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare reads from the SQLite task mirror with the same reads from Outlook.
+
+Runs against the in-process fake::
+
+    python -m benchmarks.bench_mirror --tasks 10000 --latency 0.0002
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from typing import Any, Callable
+
+from app.fake_outlook import FakeOutlook
+from app.mirror import TaskMirror
+from app.outlook import OutlookExecutor, OutlookSession, OutlookTasks, TaskQuery
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0002, help="seconds per simulated COM call")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    outlook = FakeOutlook(latency=args.latency)
+    outlook.seed_tasks(args.tasks)
+    executor = OutlookExecutor(
+        session_factory=lambda: OutlookSession(lambda: OutlookTasks(application=outlook.Application()))
+    )
+    mirror = TaskMirror()
+
+    for label in ("initial scan", "reconcile"):
+        outlook.reset_calls()
+        start = time.perf_counter()
+        mirror.reconcile(executor)
+        print(f"{label:<14} {(time.perf_counter() - start) * 1000:10.1f} ms  {outlook.calls:8d} COM calls")
+
+    reads = {
+        "page of 50": lambda source: source.list_incomplete_task_page(50),
+        "count": lambda source: source.count_incomplete_tasks(TaskQuery(statuses=(1,))),
+        "top 20 by due": lambda source: source.list_incomplete_tasks(sort=("dueDate", False), limit=20),
+    }
+    for label, read in reads.items():
+        outlook.reset_calls()
+        com = measure(args.requests, lambda: executor.submit(read).result())
+        calls = outlook.calls / args.requests
+        local = measure(args.requests, lambda: read(mirror))
+        print(f"{label:<14} outlook {com:9.3f} ms ({calls:7.1f} COM calls)  mirror {local:7.3f} ms")
+    search = measure(args.requests, lambda: mirror.search("task 1*"))
+    print(f"{'search':<14} mirror {search:7.3f} ms (Outlook would read every body)")
+    executor.shutdown()
+
+
+def measure(requests: int, call: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        call()
+    return (time.perf_counter() - start) / requests * 1000
+
+
+if __name__ == "__main__":
+    main()
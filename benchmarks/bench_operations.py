@@ -0,0 +1,92 @@
+"""Latency and throughput of the core task operations at several folder sizes.
+
+Runs OutlookTasks against the in-process fake, so it works on Linux CI::
+
+    python -m benchmarks.bench_operations --sizes 100,10000,100000 --json results.json
+
+For each folder size it times listing (without bodies), one page of 50,
+counting, and creating, completing and deleting single tasks. Wall times
+depend on the machine; COM calls per operation do not, which makes them
+the figure to compare between runs. ``--latency`` adds a simulated cost
+per COM call to approximate a real Outlook.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from app.fake_outlook import FakeOutlook
+from app.outlook import OutlookTasks
+
+LIST_FIELDS = ("entryId", "subject", "dueDate", "status")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,10000,100000", help="comma separated folder sizes")
+    parser.add_argument("--writes", type=int, default=100, help="completes and deletes per size; twice as many creates")
+    parser.add_argument("--reads", type=int, default=20, help="repetitions of each read, fewer for large folders")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per simulated COM call")
+    parser.add_argument("--engine", choices=("table", "items"), default="table")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    results: List[Dict[str, Any]] = []
+    print(f"{'size':>7} {'operation':<10} {'p50 ms':>9} {'p95 ms':>9} {'ops/s':>9} {'COM calls/op':>13}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        outlook = FakeOutlook(latency=args.latency)
+        outlook.seed_tasks(size)
+        client = OutlookTasks(application=outlook.Application(), list_engine=args.engine)
+        reads = max(1, min(args.reads, 200000 // size))
+        # Completes and deletes act on the tasks the creates add, half each.
+        created: List[str] = []
+
+        operations: Dict[str, Callable[[int], Any]] = {
+            "list": lambda i: client.list_incomplete_tasks(LIST_FIELDS),
+            "page": lambda i: client.list_incomplete_task_page(50),
+            "count": lambda i: client.count_incomplete_tasks(),
+            "create": lambda i: created.append(client.add_task(f"Benchmark task {i}", body="Created by the benchmark")),
+            "complete": lambda i: client.complete_task(created[2 * i]),
+            "delete": lambda i: client.delete_task(created[2 * i + 1]),
+        }
+        for name, operation in operations.items():
+            count = {"list": reads, "page": reads, "count": reads, "create": 2 * args.writes}.get(name, args.writes)
+            result = measure(outlook, operation, count)
+            result.update(size=size, operation=name)
+            results.append(result)
+            print(
+                f"{size:>7} {name:<10} {result['p50Ms']:9.3f} {result['p95Ms']:9.3f}"
+                f" {result['opsPerSecond']:9.1f} {result['comCallsPerOp']:13.1f}"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"latency": args.latency, "engine": args.engine, "results": results}, f, indent=2)
+
+
+def measure(outlook: FakeOutlook, operation: Callable[[int], Any], count: int) -> Dict[str, Any]:
+    """Run ``operation(i)`` ``count`` times and summarize the per-call times."""
+    outlook.reset_calls()
+    times = []
+    for i in range(count):
+        start = time.perf_counter()
+        operation(i)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return {
+        "count": count,
+        "p50Ms": statistics.median(times) * 1000,
+        "p95Ms": times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+        "opsPerSecond": count / sum(times),
+        "comCallsPerOp": outlook.calls / count,
+    }
+
+
+if __name__ == "__main__":
+    main()
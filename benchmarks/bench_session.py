@@ -0,0 +1,51 @@
+"""Compare a fresh Outlook connection per request with a warm OutlookSession.
+
+Runs against the in-process fake, so it works on any platform::
+
+    python -m benchmarks.bench_session --requests 200 --latency 0.0002
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from app.fake_outlook import FakeOutlook
+from app.outlook import OutlookSession, OutlookTasks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0002, help="seconds per simulated COM call")
+    parser.add_argument("--connect-latency", type=float, default=0.005, help="seconds per Dispatch")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    outlook = FakeOutlook(latency=args.latency, connect_latency=args.connect_latency)
+    outlook.seed_tasks(args.tasks)
+
+    def connect() -> OutlookTasks:
+        return OutlookTasks(application=outlook.Application())
+
+    def measure(label: str, call) -> None:
+        outlook.reset_calls()
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            call()
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<8} {elapsed / args.requests * 1000:8.3f} ms/request"
+            f"  {outlook.calls / args.requests:8.1f} COM calls/request"
+        )
+
+    measure("cold", lambda: connect().list_incomplete_tasks())
+    session = OutlookSession(connect)
+    measure("session", lambda: session.run(lambda client: client.list_incomplete_tasks()))
+    print(f"session connects: {session.connects}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Fixtures that run the API against the in-process fake Outlook."""
+
+from __future__ import annotations
+
+import os
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.cache as cache
+import app.fake_outlook as fake_outlook
+import app.mirror as mirror
+import app.outlook as outlook
+import app.settings as settings
+import app.sync as sync
+from app.fake_outlook import FakeOutlook
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch: pytest.MonkeyPatch, tmp_path) -> Iterator[None]:
+    """Give every test fresh settings and process-wide singletons.
+
+    Settings come from the environment only: no ``.env`` is found from
+    ``tmp_path``, and the ``OUTLOOK_*`` variables of the caller are removed.
+    Tests set what they need with ``monkeypatch.setenv`` before the first
+    ``get_settings()``.
+    """
+    for name in list(os.environ):
+        if name.startswith("OUTLOOK_") or name in ("LOG_LEVEL", "LOG_FORMAT"):
+            monkeypatch.delenv(name)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "_settings", None)
+    monkeypatch.setattr(settings, "_reload_listeners", list(settings._reload_listeners))
+    monkeypatch.setattr(outlook, "_store_cache", outlook.StoreCache())
+    monkeypatch.setattr(outlook, "_folder_index", outlook.FolderIndex())
+    yield
+    outlook.shutdown_executor()
+    if mirror._mirror is not None:
+        mirror._mirror.stop()
+    mirror._mirror = None
+    cache._cache = None
+    cache._detail_cache = None
+    sync._change_log = None
+    fake_outlook._fake = None
+    outlook._gate = None
+    outlook._event_session = None
+    outlook._change_listeners.clear()
+
+
+@pytest.fixture
+def fake() -> FakeOutlook:
+    """A fake Outlook with 25 incomplete tasks in its default tasks folder."""
+    fake = FakeOutlook()
+    fake.seed_tasks(25)
+    return fake
+
+
+@pytest.fixture
+def executor(fake: FakeOutlook) -> outlook.OutlookExecutor:
+    """The process-wide executor, connected to ``fake`` and pumping events every 50 ms."""
+    outlook._executor = outlook.OutlookExecutor(
+        session_factory=lambda: outlook.OutlookSession(
+            lambda: outlook.OutlookTasks(application=fake.Application())
+        ),
+        poll_interval=0.05,
+    )
+    return outlook._executor
+
+
+@pytest.fixture
+def client(executor: outlook.OutlookExecutor) -> Iterator[TestClient]:
+    """A TestClient of the app, running its lifespan against ``fake``."""
+    from app.main import create_app
+
+    with TestClient(create_app()) as test_client:
+        yield test_client
@@ -0,0 +1,37 @@
+"""Bulk task creation with POST /tasks:batch."""
+
+from __future__ import annotations
+
+from app.outlook import OutlookTasks
+
+
+def test_batch_creates_every_task(client):
+    tasks = [{"subject": f"Batch {i}", "dueDate": "2025-06-01T09:00:00"} for i in range(3)]
+    response = client.post("/tasks:batch", json=tasks).json()
+    assert (response["created"], response["failed"]) == (3, 0)
+    entry_ids = [result["entryId"] for result in response["results"]]
+    assert all(result["itemKey"].startswith(f"{result['entryId']}:") for result in response["results"])
+    listed = {task["entryId"]: task["subject"] for task in client.get("/tasks").json()}
+    assert [listed[entry_id] for entry_id in entry_ids] == ["Batch 0", "Batch 1", "Batch 2"]
+
+
+def test_batch_size_is_bounded(client):
+    assert client.post("/tasks:batch", json=[]).status_code == 422
+    assert client.post("/tasks:batch", json=[{"subject": "x"}] * 1001).status_code == 422
+
+
+def test_one_failure_does_not_stop_the_batch(client, monkeypatch):
+    add = OutlookTasks._add_task
+
+    def flaky(items, subject, due_date, body):
+        if subject == "bad":
+            raise RuntimeError("cannot save")
+        return add(items, subject, due_date, body)
+
+    monkeypatch.setattr(OutlookTasks, "_add_task", staticmethod(flaky))
+    client.get("/tasks")
+    response = client.post("/tasks:batch", json=[{"subject": "a"}, {"subject": "bad"}, {"subject": "c"}]).json()
+    assert (response["created"], response["failed"]) == (2, 1)
+    assert response["results"][1] == {"error": "cannot save"}
+    subjects = [task["subject"] for task in client.get("/tasks").json()]
+    assert "a" in subjects and "c" in subjects and len(subjects) == 27
@@ -0,0 +1,47 @@
+"""Bulk complete and delete by EntryID list or filter."""
+
+from __future__ import annotations
+
+
+def _ids(client):
+    return [task["entryId"] for task in client.get("/tasks").json()]
+
+
+def test_complete_by_entry_ids(client):
+    ids = _ids(client)
+    response = client.post("/tasks:complete", json={"entryIds": ids[:2] + ["missing"] + ids[2:3]}).json()
+    assert [item["status"] for item in response["results"]] == ["completed", "completed", "failed", "completed"]
+    assert (response["completed"], response["failed"], response["skipped"]) == (3, 1, 0)
+    assert not set(ids[:3]) & set(_ids(client))
+
+
+def test_stop_on_error_skips_the_rest(client):
+    ids = _ids(client)
+    response = client.post("/tasks:complete", json={"entryIds": ["missing", ids[0]], "stopOnError": True}).json()
+    assert [item["status"] for item in response["results"]] == ["failed", "skipped"]
+    assert ids[0] in _ids(client)
+
+
+def test_delete_by_entry_ids(client):
+    ids = _ids(client)
+    response = client.post("/tasks:delete", json={"entryIds": ids[:2]}).json()
+    assert response["deleted"] == 2
+    assert len(_ids(client)) == 23
+
+
+def test_delete_by_filter(client):
+    response = client.post("/tasks:delete", json={"filter": "[Subject] = 'Task 0'"}).json()
+    assert response["deleted"] == 1
+    assert "Task 0" not in [task["subject"] for task in client.get("/tasks").json()]
+
+
+def test_complete_by_filter(client):
+    response = client.post("/tasks:complete", json={"filter": "[Subject] = 'Task 1' OR [Subject] = 'Task 2'"}).json()
+    assert response["completed"] == 2
+    assert client.get("/tasks/count").json() == {"count": 23}
+
+
+def test_selection_errors(client):
+    assert client.post("/tasks:delete", json={"filter": "[Bogus ="}).status_code == 400
+    assert client.post("/tasks:delete", json={}).status_code == 400
+    assert client.post("/tasks:delete", json={"entryIds": ["a"], "filter": "[Subject] = 'x'"}).status_code == 400
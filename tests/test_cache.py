@@ -0,0 +1,71 @@
+"""Listing cache hits and invalidation."""
+
+from __future__ import annotations
+
+import time
+
+from app.cache import get_task_cache
+from app.outlook import PendingEvents, PendingItems
+
+
+def _connect(client) -> int:
+    # The worker subscribes to folder events on its first operation, and
+    # the "reset" that comes with it invalidates whatever is in flight.
+    client.get("/tasks/count")
+    return get_task_cache().stats()["invalidations"]
+
+
+def _wait_for_events() -> None:
+    # The worker pumps folder events every poll interval (50 ms in the tests).
+    time.sleep(0.3)
+
+
+def test_repeated_listing_is_served_from_cache(client, fake):
+    _connect(client)
+    client.get("/tasks")
+    fake.reset_calls()
+    assert len(client.get("/tasks").json()) == 25
+    assert fake.calls == 0
+    assert get_task_cache().stats()["hits"] == 1
+
+
+def test_own_writes_update_the_cache_in_place(client):
+    invalidations = _connect(client)
+    client.get("/tasks")
+    entry_id = client.post("/tasks", json={"subject": "Ours"}).json()["entryId"]
+    assert entry_id in [task["entryId"] for task in client.get("/tasks").json()]
+    client.post(f"/tasks/{entry_id}/complete")
+    assert entry_id not in [task["entryId"] for task in client.get("/tasks").json()]
+    _wait_for_events()
+    client.get("/tasks/count")
+    assert get_task_cache().stats()["invalidations"] == invalidations
+
+
+def test_external_change_invalidates(client, fake):
+    invalidations = _connect(client)
+    client.get("/tasks")
+    fake.default_tasks_folder.add_task("Added in Outlook")
+    _wait_for_events()
+    client.get("/tasks/count")
+    assert get_task_cache().stats()["invalidations"] == invalidations + 1
+    subjects = [task["subject"] for task in client.get("/tasks").json()]
+    assert "Added in Outlook" in subjects
+
+
+def test_pending_events_expire():
+    events = PendingEvents(ttl=0.05)
+    events.expect(2)
+    events.cancel()
+    assert len(events) == 1
+    time.sleep(0.1)
+    assert not events.consume()
+
+
+def test_pending_items_expire():
+    items = PendingItems(ttl=0.05)
+    items.expect(["a", "b"])
+    assert items.consume("a")
+    assert not items.consume("a")
+    time.sleep(0.1)
+    assert not items.consume("b")
+    assert len(items) == 0
@@ -0,0 +1,57 @@
+"""GET /tasks/{entry_id} and its per-item cache."""
+
+from __future__ import annotations
+
+import time
+
+from app.cache import get_detail_cache
+
+
+def _first(client, fake):
+    client.get("/tasks/count")
+    return fake.default_tasks_folder._items[3]
+
+
+def test_body_is_read_lazily_and_then_cached(client, fake):
+    item = _first(client, fake)
+    task = client.get(f"/tasks/{item.EntryID}", params={"body": False}).json()
+    assert task["subject"] == "Task 3" and "body" not in task
+    assert client.get(f"/tasks/{item.EntryID}").json()["body"] == item.Body
+    fake.reset_calls()
+    assert client.get(f"/tasks/{item.EntryID}").status_code == 200
+    assert fake.calls == 0
+    assert get_detail_cache().stats()["hits"] == 1
+
+
+def test_etag(client, fake):
+    item = _first(client, fake)
+    etag = client.get(f"/tasks/{item.EntryID}").headers["etag"]
+    assert client.get(f"/tasks/{item.EntryID}", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_external_change_is_seen(client, fake):
+    item = _first(client, fake)
+    client.get(f"/tasks/{item.EntryID}")
+    item.Subject = "Changed in Outlook"
+    item.Save()
+    time.sleep(0.3)
+    assert client.get(f"/tasks/{item.EntryID}").json()["subject"] == "Changed in Outlook"
+
+
+def test_own_writes_are_seen(client, fake):
+    item = _first(client, fake)
+    client.get(f"/tasks/{item.EntryID}")
+    client.post(f"/tasks/{item.EntryID}/complete")
+    assert client.get(f"/tasks/{item.EntryID}").json()["status"] == 2
+    client.delete(f"/tasks/{item.EntryID}")
+    assert client.get(f"/tasks/{item.EntryID}").status_code == 404
+
+
+def test_unidentified_removal_revalidates_cheaply(client, fake):
+    item = _first(client, fake)
+    client.get(f"/tasks/{item.EntryID}")
+    fake.default_tasks_folder._items[10].Delete()
+    time.sleep(0.3)
+    fake.reset_calls()
+    assert client.get(f"/tasks/{item.EntryID}").json()["subject"] == "Task 3"
+    assert 0 < fake.calls < 5
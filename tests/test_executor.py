@@ -0,0 +1,218 @@
+"""Executor timeouts, the circuit breaker and stream backpressure."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+import app.outlook as outlook
+from app.fake_outlook import FakeComError, FakeNamespace
+from app.outlook import (
+    CircuitBreaker,
+    OutlookBusyError,
+    OutlookError,
+    OutlookExecutor,
+    OutlookNotFoundError,
+    OutlookTimeoutError,
+    OutlookUnavailableError,
+)
+
+RPC_E_CALL_REJECTED = -2147418111
+
+
+def _executor(fake, **kwargs) -> OutlookExecutor:
+    return OutlookExecutor(
+        session_factory=lambda: outlook.OutlookSession(lambda: outlook.OutlookTasks(application=fake.Application())),
+        **kwargs,
+    )
+
+
+def test_timeouts_open_the_breaker(fake):
+    async def scenario(executor: OutlookExecutor) -> None:
+        for _ in range(3):
+            with pytest.raises(OutlookTimeoutError):
+                await executor.run(lambda client: time.sleep(0.15))
+        assert executor.breaker.stats()["state"] == "open"
+        with pytest.raises(OutlookUnavailableError) as rejected:
+            await executor.run(lambda client: 1)
+        assert rejected.value.retry_after > 0
+        await asyncio.sleep(0.45)
+        # The half-open probe succeeds and closes the breaker.
+        assert await executor.run(lambda client: client.count_incomplete_tasks()) == 25
+        assert executor.breaker.stats()["state"] == "closed"
+
+    executor = _executor(fake, timeout=0.1, breaker=CircuitBreaker(3, 0.4))
+    try:
+        asyncio.run(scenario(executor))
+    finally:
+        executor.shutdown()
+
+
+def test_queue_saturation_does_not_open_the_breaker(fake):
+    async def scenario(executor: OutlookExecutor) -> None:
+        results = await asyncio.gather(
+            *[executor.run(lambda client: time.sleep(0.3)) for _ in range(12)], return_exceptions=True
+        )
+        assert any(isinstance(result, OutlookTimeoutError) for result in results)
+
+    executor = _executor(fake, timeout=1.0, breaker=CircuitBreaker(3, 30))
+    try:
+        asyncio.run(scenario(executor))
+        stats = executor.breaker.stats()
+        assert (stats["state"], stats["trips"]) == ("closed", 0)
+    finally:
+        executor.shutdown()
+
+
+def test_jobs_stuck_behind_a_hung_call_open_the_breaker(fake):
+    async def scenario(executor: OutlookExecutor) -> None:
+        hung = asyncio.ensure_future(executor.run(lambda client: time.sleep(0.5)))
+        await asyncio.sleep(0.01)
+        for _ in range(2):
+            with pytest.raises(OutlookTimeoutError):
+                await executor.run(lambda client: 1)
+        with pytest.raises(OutlookTimeoutError):
+            await hung
+
+    executor = _executor(fake, timeout=0.1, breaker=CircuitBreaker(3, 30))
+    try:
+        asyncio.run(scenario(executor))
+        assert executor.breaker.stats()["state"] == "open"
+    finally:
+        executor.shutdown()
+
+
+def test_failed_probe_reopens(fake):
+    def busy(client):
+        raise FakeComError(RPC_E_CALL_REJECTED, "Call was rejected by callee.")
+
+    async def scenario(executor: OutlookExecutor) -> None:
+        for _ in range(2):
+            with pytest.raises(OutlookBusyError) as error:
+                await executor.run(busy)
+            assert isinstance(error.value.__cause__, FakeComError)
+        assert executor.breaker.stats()["state"] == "open"
+        await asyncio.sleep(0.15)
+        with pytest.raises(OutlookBusyError) as error:
+            await executor.run(busy)
+        assert isinstance(error.value.__cause__, FakeComError)
+        assert executor.breaker.stats()["state"] == "open"
+
+    # Polling rarely keeps the idle worker from probing first.
+    executor = _executor(fake, breaker=CircuitBreaker(2, 0.1), poll_interval=5.0)
+    try:
+        asyncio.run(scenario(executor))
+    finally:
+        executor.shutdown()
+
+
+def test_idle_worker_probes_the_open_breaker(fake, monkeypatch):
+    def busy(client):
+        raise FakeComError(RPC_E_CALL_REJECTED, "Call was rejected by callee.")
+
+    async def scenario(executor: OutlookExecutor) -> None:
+        for _ in range(2):
+            with pytest.raises(OutlookBusyError):
+                await executor.run(busy)
+
+    outlook_busy = True
+    ping = outlook.OutlookTasks.ping
+
+    def probe(client):
+        if outlook_busy:
+            busy(client)
+        ping(client)
+
+    executor = _executor(fake, breaker=CircuitBreaker(2, 0.1), poll_interval=0.02)
+    try:
+        monkeypatch.setattr(outlook.OutlookTasks, "ping", probe)
+        asyncio.run(scenario(executor))
+        time.sleep(0.3)
+        assert executor.breaker.stats()["state"] != "closed"
+        outlook_busy = False
+        time.sleep(0.3)
+        assert executor.breaker.stats()["state"] == "closed"
+    finally:
+        executor.shutdown()
+
+
+def test_not_found_does_not_count(fake):
+    async def scenario(executor: OutlookExecutor) -> None:
+        for _ in range(5):
+            with pytest.raises(OutlookNotFoundError):
+                await executor.run(lambda client: client.get_task("missing"))
+            with pytest.raises(OutlookNotFoundError):
+                await executor.run(lambda client: client.delete_task("missing"))
+
+    executor = _executor(fake, breaker=CircuitBreaker(2, 30))
+    try:
+        asyncio.run(scenario(executor))
+        assert executor.breaker.stats()["consecutiveFailures"] == 0
+    finally:
+        executor.shutdown()
+
+
+def test_open_breaker_returns_503(client, executor, monkeypatch):
+    executor.timeout = 0.05
+    executor.breaker = CircuitBreaker(2, 60)
+    monkeypatch.setattr(outlook.OutlookTasks, "count_incomplete_tasks", lambda self, query=None: time.sleep(0.1) or 0)
+    assert [client.get("/tasks/count").status_code for _ in range(2)] == [504, 504]
+    response = client.get("/tasks/count")
+    assert response.status_code == 503
+    assert int(response.headers["retry-after"]) >= 59
+    assert "outlook_breaker_trips_total 1.0" in client.get("/metrics").text
+
+
+def test_busy_outlook_is_503_not_404(client, executor, monkeypatch):
+    entry_id = client.get("/tasks").json()[0]["entryId"]
+
+    def rejected(self, entry_id, store_id=None):
+        raise FakeComError(RPC_E_CALL_REJECTED, "Call was rejected by callee.")
+
+    monkeypatch.setattr(FakeNamespace, "GetItemFromID", rejected)
+    response = client.post(f"/tasks/{entry_id}/complete")
+    assert response.status_code == 503
+    assert int(response.headers["retry-after"]) >= 1
+    assert client.post("/tasks:complete", json={"entryIds": [entry_id]}).status_code == 503
+    assert executor.breaker.stats()["consecutiveFailures"] == 2
+
+
+def test_stalled_stream_frees_the_worker(fake):
+    fake.seed_tasks(500)
+
+    async def scenario(executor: OutlookExecutor) -> None:
+        stream = executor.stream(lambda client: client.iter_incomplete_tasks(["entryId"]), batch_size=10, buffer=2)
+        await stream.__anext__()
+        # Nobody reads the stream; the worker must give it up and run this.
+        assert await executor.run(lambda client: client.count_incomplete_tasks()) == 525
+        with pytest.raises(OutlookError):
+            async for _ in stream:
+                pass
+        assert executor.breaker.stats()["consecutiveFailures"] == 0
+
+    executor = _executor(fake, timeout=0.5)
+    try:
+        asyncio.run(scenario(executor))
+    finally:
+        executor.shutdown()
+
+
+def test_stalled_stream_is_abandoned_without_a_timeout(fake, monkeypatch):
+    monkeypatch.setattr(outlook, "STREAM_STALL_LIMIT", 0.2)
+    fake.seed_tasks(500)
+
+    async def scenario(executor: OutlookExecutor) -> None:
+        stream = executor.stream(lambda client: client.iter_incomplete_tasks(["entryId"]), batch_size=10, buffer=2)
+        await stream.__anext__()
+        assert await asyncio.wait_for(executor.run(lambda client: client.count_incomplete_tasks()), 5) == 525
+        with pytest.raises(OutlookError):
+            async for _ in stream:
+                pass
+
+    executor = _executor(fake)
+    try:
+        asyncio.run(scenario(executor))
+    finally:
+        executor.shutdown()
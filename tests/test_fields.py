@@ -0,0 +1,47 @@
+"""Field projection (?fields=) and body previews."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.outlook import OutlookTasks, truncate_utf8
+
+
+def test_default_listing_has_no_body(client):
+    tasks = client.get("/tasks").json()
+    assert set(tasks[0]) == {"entryId", "subject", "dueDate", "status"}
+
+
+def test_fields_select_properties(client):
+    tasks = client.get("/tasks", params={"fields": "subject,body"}).json()
+    assert set(tasks[0]) == {"subject", "body"}
+    assert tasks[0]["body"]
+
+
+def test_unknown_field_is_rejected(client):
+    response = client.get("/tasks", params={"fields": "subject,colour"})
+    assert response.status_code == 400
+    assert "colour" in response.json()["detail"]
+
+
+def test_body_preview(client, fake):
+    fake.default_tasks_folder.add_task("Unicode", Body="äöü" * 10)
+    tasks = client.get("/tasks", params={"fields": "subject", "bodyPreview": 5}).json()
+    preview = next(task["bodyPreview"] for task in tasks if task["subject"] == "Unicode")
+    assert preview == "äö"
+
+
+@pytest.mark.parametrize("engine", ["table", "items"])
+def test_bodies_are_only_read_when_asked_for(fake, engine):
+    client = OutlookTasks(application=fake.Application(), list_engine=engine)
+    fake.reset_calls()
+    client.list_incomplete_tasks(["entryId", "subject"])
+    without_body = fake.calls
+    fake.reset_calls()
+    client.list_incomplete_tasks(["entryId", "subject", "body"])
+    assert fake.calls >= without_body + 25
+
+
+def test_truncate_utf8_keeps_whole_characters():
+    assert truncate_utf8("aä", 2) == "a"
+    assert truncate_utf8("abc", 10) == "abc"
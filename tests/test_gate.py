@@ -0,0 +1,47 @@
+"""Admission control of requests that reach Outlook."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from app.outlook import RequestGate, get_request_gate
+
+
+def test_requests_over_the_limits_get_503(executor, fake, monkeypatch):
+    monkeypatch.setenv("OUTLOOK_MAX_REQUESTS", "2")
+    monkeypatch.setenv("OUTLOOK_MAX_WAITING_REQUESTS", "2")
+    monkeypatch.setenv("OUTLOOK_CACHE_TTL", "0")
+    fake.latency = 0.001
+    from app.main import create_app
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            responses = await asyncio.gather(*[http.get("/tasks") for _ in range(10)])
+            streamed = await http.get("/tasks", params={"stream": 1})
+        return responses, streamed
+
+    executor.start()
+    responses, streamed = asyncio.run(scenario())
+    codes = [response.status_code for response in responses]
+    assert codes.count(200) == 4 and codes.count(503) == 6
+    rejected = next(response for response in responses if response.status_code == 503)
+    assert int(rejected.headers["retry-after"]) >= 1
+    assert len(streamed.text.splitlines()) == 25
+    stats = get_request_gate().stats()
+    assert (stats["active"], stats["waiting"], stats["rejected"]) == (0, 0, 6)
+
+
+def test_slot_release_is_idempotent():
+    async def scenario():
+        gate = RequestGate(1, 0)
+        release = await gate.acquire()
+        release()
+        release()
+        assert gate.stats()["active"] == 0
+        async with gate.slot():
+            assert gate.stats()["active"] == 1
+
+    asyncio.run(scenario())
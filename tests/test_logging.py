@@ -0,0 +1,90 @@
+"""Logging configuration and sampled, lazily formatted debug logs."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+from typing import Iterator
+
+import pytest
+
+from app.logging_config import JsonFormatter, SampledLogger, configure_logging
+from app.main import _reconfigure_logging
+from app.settings import Settings
+
+
+@pytest.fixture(autouse=True)
+def root_logger() -> Iterator[logging.Logger]:
+    """Restore the root logger that :func:`configure_logging` replaces."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class Formatted:
+    """A log argument that counts how often it is formatted."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __str__(self) -> str:
+        self.count += 1
+        return "formatted"
+
+
+def test_log_level_is_honoured(root_logger):
+    assert configure_logging("warning") == "WARNING"
+    assert root_logger.level == logging.WARNING
+    assert len(root_logger.handlers) == 1
+
+
+def test_unknown_level_or_format_is_rejected():
+    with pytest.raises(ValueError):
+        configure_logging("LOUD")
+    with pytest.raises(ValueError):
+        configure_logging("INFO", "xml")
+
+
+def test_json_lines_carry_extra_fields():
+    record = logging.makeLogRecord({"name": "app", "levelname": "INFO", "msg": "took %dms", "args": (5,)})
+    record.entryId = "ABC"
+    entry = json.loads(JsonFormatter().format(record))
+    assert (entry["message"], entry["logger"], entry["entryId"]) == ("took 5ms", "app", "ABC")
+
+
+def test_reload_reconfigures_logging(root_logger):
+    configure_logging("INFO")
+    _reconfigure_logging(Settings(log_level="INFO"), Settings(log_level="DEBUG"))
+    assert root_logger.level == logging.DEBUG
+
+
+def _logger(level: int) -> tuple[logging.Logger, io.StringIO]:
+    stream = io.StringIO()
+    logger = logging.getLogger(f"test.sampled.{level}")
+    logger.handlers[:] = [logging.StreamHandler(stream)]
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger, stream
+
+
+def test_sampled_logger_logs_one_in_every():
+    logger, stream = _logger(logging.DEBUG)
+    sampled = SampledLogger(logger, every=10)
+    for i in range(25):
+        sampled.debug("item %s", i)
+    assert stream.getvalue().splitlines() == [
+        f"item {i} (sampled 1/10)" for i in (0, 10, 20)
+    ]
+
+
+def test_filtered_debug_logs_format_nothing():
+    logger, stream = _logger(logging.INFO)
+    argument = Formatted()
+    sampled = SampledLogger(logger, every=1)
+    for _ in range(100):
+        sampled.debug("item %s", argument)
+        logger.debug("item %s", argument)
+    assert argument.count == 0 and stream.getvalue() == ""
@@ -0,0 +1,22 @@
+"""The Prometheus /metrics endpoint."""
+
+from __future__ import annotations
+
+
+def test_totals_are_counters_and_levels_gauges(client):
+    client.get("/tasks/count")
+    client.get("/tasks")
+    client.get("/tasks")
+    text = client.get("/metrics").text
+    assert "# TYPE outlook_listing_cache_hits_total counter" in text
+    assert "outlook_listing_cache_hits_total 1.0" in text
+    assert "# TYPE outlook_breaker_trips_total counter" in text
+    assert "# TYPE outlook_executor_queue_depth gauge" in text
+    assert "# TYPE outlook_listing_cache_hit_ratio gauge" in text
+
+
+def test_operations_and_com_calls_are_timed(client):
+    client.get("/tasks/count")
+    text = client.get("/metrics").text
+    assert 'outlook_operation_duration_seconds_count{operation="count_incomplete_tasks"}' in text
+    assert 'outlook_api_request_duration_seconds_count{method="GET",route="/tasks/count",status="200"}' in text
@@ -0,0 +1,122 @@
+"""Reads served from the local SQLite mirror of the incomplete tasks."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict
+
+import pytest
+
+import app.settings as settings
+from app.mirror import TaskMirror, get_mirror
+from app.outlook import get_executor, get_request_gate
+
+
+@pytest.fixture(autouse=True)
+def mirror_on(monkeypatch):
+    monkeypatch.setenv("OUTLOOK_MIRROR", "true")
+
+
+@pytest.fixture
+def undated(fake):
+    return [fake.default_tasks_folder.add_task(f"Undated {i}").EntryID for i in range(3)]
+
+
+@pytest.fixture
+def mirror(undated, client) -> TaskMirror:
+    mirror = get_mirror()
+    deadline = time.monotonic() + 5
+    while not mirror.ready and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert mirror.ready
+    return mirror
+
+
+def _settle() -> None:
+    """Let the worker deliver the events of changes made in the fake Outlook."""
+    get_executor().submit(lambda client: None).result()
+    time.sleep(0.3)
+
+
+def _strict(monkeypatch, client, url: str, **params: Any) -> Dict[str, Any]:
+    """GET ``url`` from Outlook itself, bypassing the mirror."""
+    current = settings.get_settings()
+    with monkeypatch.context() as patch:
+        patch.setattr(settings, "_settings", current.model_copy(update={"outlook_consistency": "strict"}))
+        return client.get(url, params=params).json()
+
+
+def test_reads_need_no_outlook_calls(fake, mirror, client):
+    fake.reset_calls()
+    tasks = client.get("/tasks").json()
+    assert len(tasks) == 28
+    assert client.get("/tasks/count").json()["count"] == 28
+    assert client.get(f"/tasks/{tasks[0]['entryId']}").status_code == 200
+    assert fake.calls == 0
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"sort": "dueDate"},
+        {"sort": "-dueDate", "limit": 5},
+        {"fields": "entryId,itemKey,subject,dueDate,status,lastModified"},
+        {"dueAfter": "2025-01-03T00:00:00", "dueBefore": "2025-01-10T00:00:00"},
+        {"subjectContains": "1"},
+    ],
+)
+def test_mirror_reads_match_outlook(monkeypatch, mirror, client, params):
+    assert client.get("/tasks", params=params).json() == _strict(monkeypatch, client, "/tasks", **params)
+
+
+def test_pages_match_outlook(monkeypatch, mirror, client):
+    def pages(read):
+        tasks, cursor = [], None
+        while True:
+            page = read({"limit": 7, **({"cursor": cursor} if cursor else {})})
+            tasks += page["tasks"]
+            cursor = page["nextCursor"]
+            if not cursor:
+                return tasks
+
+    from_mirror = pages(lambda params: client.get("/tasks", params=params).json())
+    assert len(from_mirror) == 28
+    assert from_mirror == pages(lambda params: _strict(monkeypatch, client, "/tasks", **params))
+
+
+def test_own_writes_keep_it_in_sync(mirror, client):
+    created = client.post("/tasks", json={"subject": "New"}).json()["entryId"]
+    assert client.get("/tasks/count").json()["count"] == 29
+    assert created in [task["entryId"] for task in client.get("/tasks").json()]
+    client.post(f"/tasks/{created}/complete")
+    assert client.get("/tasks/count").json()["count"] == 28
+    first = client.get("/tasks").json()[0]["entryId"]
+    client.post("/tasks:delete", json={"entryIds": [first]})
+    assert client.get("/tasks/count").json()["count"] == 27
+
+
+def test_foreign_changes_arrive_by_event(fake, mirror, client):
+    item = fake.default_tasks_folder._items[10]
+    item.Subject = "Changed in Outlook"
+    item.Save()
+    _settle()
+    assert client.get(f"/tasks/{item.EntryID}").json()["subject"] == "Changed in Outlook"
+
+
+def test_tasks_the_mirror_lacks_are_read_from_outlook(mirror, client):
+    entry_id = client.get("/tasks").json()[0]["entryId"]
+    gate = get_request_gate()
+    admitted = gate.stats()["admitted"]
+    assert client.get(f"/tasks/{entry_id}").status_code == 200
+    assert gate.stats()["admitted"] == admitted
+    client.post(f"/tasks/{entry_id}/complete")
+    admitted = gate.stats()["admitted"]
+    assert client.get(f"/tasks/{entry_id}").json()["status"] == 2
+    assert gate.stats()["admitted"] == admitted + 1
+
+
+def test_strict_consistency_reads_outlook(monkeypatch, fake, mirror, client):
+    fake.reset_calls()
+    assert len(_strict(monkeypatch, client, "/tasks")) == 28
+    assert fake.calls > 0
@@ -0,0 +1,83 @@
+"""Filtering GET /tasks with query parameters, applied by Outlook."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from app.fake_outlook import FakeOutlook
+from app.outlook import OutlookTasks, TaskQuery
+
+
+@pytest.fixture
+def fake() -> FakeOutlook:
+    fake = FakeOutlook()
+    folder = fake.default_tasks_folder
+    folder.add_task(
+        "Q2 budget review",
+        DueDate=datetime(2025, 3, 1),
+        Importance=2,
+        Categories="Finance, Red",
+        Status=1,
+        Owner="Alice",
+    )
+    folder.add_task("Write report", DueDate=datetime(2025, 6, 1), Importance=1, Categories="Blue", Owner="Bob")
+    folder.add_task("budget it's fine", Importance=0, Status=3)
+    folder.add_task("done budget", Status=2)
+    return fake
+
+
+def _subjects(client, **params):
+    response = client.get("/tasks", params={"fields": "subject", **params})
+    assert response.status_code == 200, response.text
+    return sorted(task["subject"] for task in response.json())
+
+
+def test_filters(client):
+    assert _subjects(client, subjectContains="BUDGET") == ["Q2 budget review", "budget it's fine"]
+    assert _subjects(client, subjectContains="it's") == ["budget it's fine"]
+    assert _subjects(client, dueBefore="2025-04-01T00:00:00") == ["Q2 budget review"]
+    assert _subjects(client, dueAfter="2025-04-01T00:00:00") == ["Write report"]
+    assert _subjects(client, status="inProgress,waiting") == ["Q2 budget review", "budget it's fine"]
+    assert _subjects(client, category="finance") == ["Q2 budget review"]
+    assert _subjects(client, importance="high") == ["Q2 budget review"]
+    assert _subjects(client, owner="bob") == ["Write report"]
+    assert _subjects(client, subjectContains="budget", importance="low") == ["budget it's fine"]
+
+
+def test_filters_apply_to_pages_counts_and_streams(client):
+    page = client.get("/tasks", params={"limit": 1, "subjectContains": "budget"}).json()
+    assert [task["subject"] for task in page["tasks"]] == ["Q2 budget review"]
+    assert client.get("/tasks/count", params={"subjectContains": "budget"}).json() == {"count": 2}
+    streamed = client.get("/tasks", params={"stream": 1, "subjectContains": "budget"})
+    assert len(streamed.text.splitlines()) == 2
+
+
+@pytest.mark.parametrize(
+    ("params", "status_code"),
+    [
+        ({"status": "bogus"}, 400),
+        ({"importance": "urgent"}, 400),
+        ({"sort": "colour"}, 400),
+        ({"dueBefore": "soon"}, 422),
+        ({"subjectContains": ""}, 422),
+    ],
+)
+def test_bad_filters_are_rejected(client, params, status_code):
+    assert client.get("/tasks", params=params).status_code == status_code
+
+
+def test_query_builds_one_dasl_restriction():
+    assert TaskQuery().restriction() is None
+    restriction = TaskQuery(subject_contains="it's", statuses=(1, 3)).restriction()
+    assert restriction.startswith("@SQL=")
+    assert "LIKE '%it''s%'" in restriction
+    assert restriction.count(" AND ") == 1 and " OR " in restriction
+
+
+@pytest.mark.parametrize("engine", ["table", "items"])
+def test_engines_filter_alike(fake, engine):
+    client = OutlookTasks(application=fake.Application(), list_engine=engine)
+    tasks = client.list_incomplete_tasks(["subject"], query=TaskQuery(subject_contains="budget"))
+    assert sorted(task["subject"] for task in tasks) == ["Q2 budget review", "budget it's fine"]
@@ -0,0 +1,75 @@
+"""Full-text search of the incomplete tasks with GET /tasks/search."""
+
+from __future__ import annotations
+
+import time
+from typing import List
+
+import pytest
+
+from app.mirror import get_mirror
+from app.outlook import get_executor
+
+
+@pytest.fixture
+def items(fake):
+    items = list(fake.default_tasks_folder._items)
+    items[3].Subject = "Prepare Q2 budget"
+    items[4].Body = "notes about the q2 budget review"
+    items[5].Categories = "Budget, Finance"
+    items[6].Subject = "Café meeting"
+    return items
+
+
+@pytest.fixture
+def search(monkeypatch, items, executor):
+    """A TestClient with the mirror on, its first scan done."""
+    from fastapi.testclient import TestClient
+
+    from app.main import create_app
+
+    monkeypatch.setenv("OUTLOOK_MIRROR", "true")
+    with TestClient(create_app()) as client:
+        deadline = time.monotonic() + 5
+        while not get_mirror().ready and time.monotonic() < deadline:
+            time.sleep(0.02)
+        yield client
+
+
+def _ids(client, q: str) -> List[str]:
+    return [result["entryId"] for result in client.get("/tasks/search", params={"q": q}).json()["results"]]
+
+
+def test_search_ranks_subject_and_category_hits_first(fake, items, search):
+    fake.reset_calls()
+    results = search.get("/tasks/search", params={"q": "budget"}).json()["results"]
+    assert fake.calls == 0
+    assert results[0]["entryId"] == items[3].EntryID
+    assert {result["entryId"] for result in results} == {items[3].EntryID, items[4].EntryID, items[5].EntryID}
+    assert results[-1]["entryId"] == items[4].EntryID
+    assert set(results[0]) == {"entryId", "itemKey", "subject", "score"}
+
+
+def test_search_words_and_prefixes(items, search):
+    assert _ids(search, "q2 budget") == [items[3].EntryID, items[4].EntryID]
+    assert set(_ids(search, "budg*")) == {items[3].EntryID, items[4].EntryID, items[5].EntryID}
+    assert _ids(search, "cafe") == [items[6].EntryID]
+    assert search.get("/tasks/search", params={"q": '" OR ( NEAR'}).status_code == 200
+
+
+def test_search_follows_writes(items, search):
+    created = search.post("/tasks", json={"subject": "zebra budget"}).json()["entryId"]
+    assert _ids(search, "zebra") == [created]
+    search.post(f"/tasks/{created}/complete")
+    assert _ids(search, "zebra") == []
+    search.post("/tasks:delete", json={"entryIds": [items[3].EntryID]})
+    assert items[3].EntryID not in _ids(search, "budget")
+    items[7].Body = "giraffe"
+    items[7].Save()
+    get_executor().submit(lambda client: None).result()
+    time.sleep(0.3)
+    assert _ids(search, "giraffe") == [items[7].EntryID]
+
+
+def test_search_needs_the_mirror(client):
+    assert client.get("/tasks/search", params={"q": "budget"}).status_code == 501
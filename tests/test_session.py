@@ -0,0 +1,62 @@
+"""Warm session reuse (user-001) against the fake Outlook."""
+
+from __future__ import annotations
+
+import time
+
+import app.outlook as outlook
+from app.fake_outlook import FakeOutlook
+
+
+def _session(fake: FakeOutlook, **kwargs) -> outlook.OutlookSession:
+    return outlook.OutlookSession(lambda: outlook.OutlookTasks(application=fake.Application()), **kwargs)
+
+
+def test_session_connects_once(fake):
+    session = _session(fake)
+    for _ in range(5):
+        assert session.run(lambda client: client.count_incomplete_tasks()) == 25
+    assert session.connects == 1
+    assert fake.connects == 1
+
+
+def test_session_reconnects_after_disconnect(fake):
+    session = _session(fake)
+    session.run(lambda client: client.count_incomplete_tasks())
+    fake.restart()
+    assert session.run(lambda client: client.count_incomplete_tasks()) == 25
+    assert session.connects == 2
+
+
+def test_session_reconnects_when_idle(fake):
+    session = _session(fake, idle_timeout=0.01)
+    session.run(lambda client: client.count_incomplete_tasks())
+    time.sleep(0.02)
+    session.run(lambda client: client.count_incomplete_tasks())
+    assert session.connects == 2
+
+
+def test_reset_sessions_reconnects(fake):
+    session = _session(fake)
+    session.run(lambda client: client.count_incomplete_tasks())
+    outlook.reset_sessions()
+    session.run(lambda client: client.count_incomplete_tasks())
+    assert session.connects == 2
+
+
+def test_one_session_subscribes_to_events(fake):
+    outlook.add_change_listener(lambda kind, item: None)
+    first, second = _session(fake), _session(fake)
+    first.client()
+    second.client()
+    assert outlook._event_session is first
+    first.close()
+    second.client()
+    assert outlook._event_session is second
+
+
+def test_requests_share_the_worker_session(client, fake):
+    for _ in range(5):
+        assert client.get("/tasks/count").status_code == 200
+        assert client.get("/tasks").status_code == 200
+    assert fake.connects == 1
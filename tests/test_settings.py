@@ -0,0 +1,86 @@
+"""Settings loaded once, and reloaded on request or when ``.env`` changes."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import app.outlook as outlook
+from app.cache import get_task_cache
+from app.settings import (
+    Settings,
+    SettingsWatcher,
+    add_reload_listener,
+    get_settings,
+    load_settings,
+    reload_settings,
+)
+
+
+def _write_env(*lines: str) -> None:
+    Path(".env").write_text("\n".join(lines) + "\n")
+
+
+def test_settings_are_read_once(client):
+    ttl = get_settings().outlook_cache_ttl
+    _write_env(f"OUTLOOK_CACHE_TTL={ttl + 1}")
+    assert client.get("/tasks").status_code == 200
+    assert client.get("/admin/settings").json()["outlook_cache_ttl"] == ttl
+
+
+def test_reload_applies_and_reports_changes(client):
+    _write_env("OUTLOOK_CACHE_TTL=7", "OUTLOOK_WORKERS=3")
+    result = client.post("/admin/settings:reload").json()
+    assert sorted(result["changed"]) == ["outlook_cache_ttl", "outlook_workers"]
+    assert result["restartRequired"] == ["outlook_workers"]
+    assert get_task_cache().ttl == 7
+
+
+def test_invalid_settings_are_not_applied(client):
+    _write_env("OUTLOOK_CACHE_TTL=7")
+    client.post("/admin/settings:reload")
+    _write_env("OUTLOOK_CACHE_TTL=-1")
+    assert client.post("/admin/settings:reload").status_code == 400
+    assert get_settings().outlook_cache_ttl == 7 and get_task_cache().ttl == 7
+
+
+def test_connection_changes_reconnect(client):
+    generation = outlook._session_generation
+    _write_env("OUTLOOK_LIST_ENGINE=items")
+    client.post("/admin/settings:reload")
+    assert outlook._session_generation == generation + 1
+    assert len(client.get("/tasks").json()) == 25
+
+
+def test_file_changes_are_picked_up():
+    _write_env("OUTLOOK_CACHE_TTL=30")
+    load_settings()
+    watcher = SettingsWatcher(0.05)
+    watcher.start()
+    try:
+        _write_env("OUTLOOK_CACHE_TTL=9")
+        later = time.time() + 5
+        os.utime(".env", (later, later))
+        deadline = time.monotonic() + 2
+        while get_settings().outlook_cache_ttl != 9 and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        watcher.stop()
+    assert get_settings().outlook_cache_ttl == 9
+
+
+def test_listeners_get_changes_only():
+    load_settings()
+    calls = []
+
+    def failing(old, new):
+        raise RuntimeError("listener failed")
+
+    add_reload_listener(failing)
+    add_reload_listener(lambda old, new: calls.append((old.outlook_cache_ttl, new.outlook_cache_ttl)))
+    reload_settings()
+    assert calls == []
+    _write_env("OUTLOOK_CACHE_TTL=11")
+    reload_settings()
+    assert calls == [(Settings.model_fields["outlook_cache_ttl"].default, 11)]
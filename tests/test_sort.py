@@ -0,0 +1,42 @@
+"""Server-side sorting of task listings with ?sort=."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.outlook import OutlookTasks
+
+
+@pytest.fixture
+def undated(fake):
+    return [fake.default_tasks_folder.add_task(f"Undated {i}").EntryID for i in range(2)]
+
+
+@pytest.mark.parametrize("engine", ["table", "items"])
+def test_undated_tasks_sort_as_due_last(fake, undated, engine):
+    client = OutlookTasks(application=fake.Application(), list_engine=engine)
+    ascending = client.list_incomplete_tasks(["entryId", "dueDate"], sort=("dueDate", False))
+    assert [task["dueDate"] for task in ascending[-2:]] == [None, None]
+    assert [task["dueDate"] for task in ascending[:-2]] == sorted(task["dueDate"] for task in ascending[:-2])
+    descending = client.list_incomplete_tasks(["entryId", "dueDate"], sort=("dueDate", True), limit=3)
+    assert {task["entryId"] for task in descending[:2]} == set(undated)
+    assert descending[2]["dueDate"] == max(task["dueDate"] for task in ascending[:-2])
+
+
+def test_sorted_pages_hold_the_top_tasks(client):
+    page = client.get("/tasks", params={"limit": 3, "sort": "-subject", "fields": "subject"}).json()
+    assert [task["subject"] for task in page["tasks"]] == ["Task 9", "Task 8", "Task 7"]
+    assert page["nextCursor"] is None
+    default = client.get("/tasks", params={"limit": 3, "sort": "dueDate"}).json()
+    assert default["nextCursor"] is not None
+
+
+def test_sort_errors(client):
+    assert client.get("/tasks", params={"sort": "bogus"}).status_code == 400
+    assert client.get("/tasks", params={"sort": "subject", "limit": 2, "cursor": "x"}).status_code == 400
+
+
+def test_sorted_stream(client):
+    lines = client.get("/tasks", params={"stream": 1, "sort": "-dueDate", "fields": "dueDate"}).text.splitlines()
+    assert len(lines) == 25
+    assert lines[0] > lines[-1]
@@ -0,0 +1,39 @@
+"""Item keys and the EntryID to StoreID cache."""
+
+from __future__ import annotations
+
+from app.outlook import OutlookTasks, format_item_key, get_store_cache, parse_item_key
+
+
+def test_item_keys_address_tasks(client):
+    task = client.get("/tasks", params={"fields": "entryId,itemKey"}).json()[0]
+    entry_id, store_id = task["itemKey"].split(":")
+    assert entry_id == task["entryId"] and store_id
+    assert client.get(f"/tasks/{task['itemKey']}").json()["entryId"] == entry_id
+    assert client.post(f"/tasks/{task['itemKey']}/complete").status_code == 200
+    assert entry_id not in [task["entryId"] for task in client.get("/tasks").json()]
+
+
+def test_created_tasks_come_with_their_item_key(client):
+    created = client.post("/tasks", json={"subject": "Keyed"}).json()
+    assert created["itemKey"].startswith(created["entryId"] + ":")
+
+
+def test_parse_item_key():
+    assert parse_item_key(format_item_key("ABC", "STORE")) == "ABC"
+    assert parse_item_key("ABC") == "ABC"
+
+
+def test_items_of_other_stores_are_searched_for_once(fake):
+    for i in range(3):
+        fake.add_store(f"Archive {i}")
+    elsewhere = fake.add_store("Shared").add_folder("Tasks").add_task("Shared task")
+    client = OutlookTasks(application=fake.Application())
+    fake.reset_calls()
+    assert client.get_task(elsewhere.EntryID)["subject"] == "Shared task"
+    searched = fake.calls
+    fake.reset_calls()
+    client.get_task(elsewhere.EntryID)
+    assert fake.calls < searched
+    stats = get_store_cache().stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
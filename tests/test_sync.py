@@ -0,0 +1,48 @@
+"""The /tasks/changes sync endpoint."""
+
+from __future__ import annotations
+
+import time
+
+
+def test_first_sync_is_full(client):
+    changes = client.get("/tasks/changes").json()
+    assert changes["full"] is True
+    assert len(changes["changed"]) == 25
+    assert changes["nextToken"]
+
+
+def test_delta_reports_changes_and_tombstones(client):
+    first = client.get("/tasks/changes").json()
+    token = first["nextToken"]
+    # Tasks modified exactly at the watermark are sent again.
+    newest = max(task["lastModified"] for task in first["changed"])
+    again = client.get("/tasks/changes", params={"since": token}).json()
+    assert again["full"] is False
+    assert {task["lastModified"] for task in again["changed"]} <= {newest}
+    assert (again["completed"], again["deleted"]) == ([], [])
+
+    time.sleep(0.01)
+    ids = [task["entryId"] for task in client.get("/tasks").json()]
+    client.post(f"/tasks/{ids[0]}/complete")
+    client.delete(f"/tasks/{ids[1]}")
+    client.post("/tasks", json={"subject": "New"})
+    changes = client.get("/tasks/changes", params={"since": token}).json()
+    assert changes["full"] is False
+    assert "New" in [task["subject"] for task in changes["changed"]]
+    assert changes["completed"] == [ids[0]]
+    assert changes["deleted"] == [ids[1]]
+
+
+def test_external_delete_forces_full_sync(client, fake):
+    token = client.get("/tasks/changes").json()["nextToken"]
+    victim = fake.default_tasks_folder._items[0]
+    victim.Delete()
+    time.sleep(0.3)
+    changes = client.get("/tasks/changes", params={"since": token}).json()
+    assert changes["full"] is True
+    assert victim.EntryID not in [task["entryId"] for task in changes["changed"]]
+
+
+def test_invalid_token(client):
+    assert client.get("/tasks/changes", params={"since": "abc"}).status_code == 400
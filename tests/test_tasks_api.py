@@ -0,0 +1,89 @@
+"""Task endpoints, pagination and cursors against the fake Outlook."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.outlook import OutlookTasks
+
+
+def test_list_and_count(client):
+    tasks = client.get("/tasks").json()
+    assert len(tasks) == 25
+    assert client.get("/tasks/count").json() == {"count": 25}
+
+
+def test_pages_walk_every_task_once(client):
+    everything = [task["entryId"] for task in client.get("/tasks").json()]
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 10}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = client.get("/tasks", params=params).json()
+        seen += [task["entryId"] for task in page["tasks"]]
+        cursor = page["nextCursor"]
+        if cursor is None:
+            break
+    assert seen == everything
+
+
+@pytest.mark.parametrize("engine", ["table", "items"])
+def test_undated_tasks_page_last_in_entry_id_order(fake, engine):
+    undated = sorted(fake.default_tasks_folder.add_task(f"Undated {i}").EntryID for i in range(13))
+    client = OutlookTasks(application=fake.Application(), list_engine=engine)
+    seen, after = [], None
+    while True:
+        page, after = client.list_incomplete_task_page(6, after, ["entryId", "dueDate"])
+        seen += page
+        if after is None:
+            break
+    assert len(seen) == 38
+    assert all(task["dueDate"] is not None for task in seen[:25])
+    assert [task["entryId"] for task in seen[25:]] == undated
+
+
+@pytest.mark.parametrize("engine", ["table", "items"])
+def test_engines_agree_on_which_items_are_tasks(fake, engine):
+    folder = fake.default_tasks_folder
+    folder.add_task("Custom form").MessageClass = "IPM.Task.Custom"
+    folder.add_task("Task request").MessageClass = "IPM.TaskRequest"
+    client = OutlookTasks(application=fake.Application(), list_engine=engine)
+    subjects = [task["subject"] for task in client.list_incomplete_tasks(["subject"])]
+    assert "Custom form" in subjects and "Task request" not in subjects
+    assert client.count_incomplete_tasks() == len(subjects) == 26
+
+
+def test_cursor_errors(client):
+    assert client.get("/tasks", params={"limit": 2, "cursor": "zz"}).status_code == 400
+    first = client.get("/tasks", params={"limit": 2}).json()["nextCursor"]
+    assert client.get("/tasks", params={"cursor": first}).status_code == 400
+
+
+def test_page_stays_stable_across_inserts(client, fake):
+    page = client.get("/tasks", params={"limit": 10}).json()
+    fake.default_tasks_folder.add_task("Inserted")
+    rest = client.get("/tasks", params={"limit": 100, "cursor": page["nextCursor"]}).json()
+    ids = [task["entryId"] for task in page["tasks"] + rest["tasks"]]
+    assert len(ids) == len(set(ids))
+
+
+def test_create_complete_delete(client):
+    entry_id = client.post("/tasks", json={"subject": "Write tests"}).json()["entryId"]
+    assert client.get(f"/tasks/{entry_id}").json()["subject"] == "Write tests"
+    assert client.post(f"/tasks/{entry_id}/complete").status_code == 200
+    assert entry_id not in [task["entryId"] for task in client.get("/tasks").json()]
+    assert client.delete(f"/tasks/{entry_id}").status_code == 200
+    assert client.get(f"/tasks/{entry_id}").status_code == 404
+
+
+def test_unknown_task_is_not_found(client):
+    assert client.get("/tasks/missing").status_code == 404
+    assert client.post("/tasks/missing/complete").status_code == 404
+    assert client.delete("/tasks/missing").status_code == 404
+
+
+def test_task_outside_the_folder_is_not_found(client, fake):
+    stray = fake.default_tasks_folder.Parent.add_folder("Elsewhere").add_task("Not ours")
+    assert client.delete(f"/tasks/{stray.EntryID}").status_code == 404
+    assert client.post(f"/tasks/{stray.EntryID}/complete").status_code == 404